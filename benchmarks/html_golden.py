@@ -0,0 +1,147 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+상세 페이지 추출 골든 파일 검사
+
+html_golden/*.html 상세 페이지를 fast·legacy 추출기로 처리하여
+골든 파일(*.json, legacy 추출 결과)과 같은지 확인하고 처리 시간을 비교
+- 추출기 결과가 골든 파일과 다르면 실패
+- fast(lxml)는 닫는 태그를 생략한 페이지에서 결과가 다르므로
+  그런 페이지는 lxml 전용 골든 파일(*.lxml.json)과 비교
+- --update 옵션: legacy 추출기로 골든 파일 다시 생성 (lxml 전용 골든 파일은 결과가 다른 페이지만 생성)
+- 같은 검사를 tests/test_html_golden.py에서 pytest로 실행
+
+실행:
+    python benchmarks/html_golden.py
+    python benchmarks/html_golden.py --update
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from html_extractor import parse_html_fast, parse_html_legacy
+
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "html_golden")
+
+# 골든 파일 생성에 사용하는 고정 도메인
+BASE_DOMAIN = "https://www.hansung.ac.kr"
+
+
+def load_pages(directory=GOLDEN_DIR):
+    """
+    골든 검사용 상세 페이지 로드
+
+    Returns:
+        list[tuple[str, str]]: (파일 이름, HTML)
+    """
+    pages = []
+    for path in sorted(glob.glob(os.path.join(directory, "*.html"))):
+        with open(path, "r", encoding="utf-8") as f:
+            pages.append((os.path.splitext(os.path.basename(path))[0], f.read()))
+    return pages
+
+
+def to_record(result):
+    content, image_urls, attachments = result
+    return {"content": content, "image_urls": image_urls, "attachments": attachments}
+
+
+def golden_path(name, variant=None):
+    return os.path.join(GOLDEN_DIR, f"{name}.{variant}.json" if variant else f"{name}.json")
+
+
+def load_golden(name, variant=None):
+    """
+    페이지의 골든 파일 로드 (variant 전용 골든 파일이 있으면 그 파일)
+
+    Returns:
+        dict: content, image_urls, attachments
+    """
+    path = golden_path(name, variant)
+    if not variant or not os.path.exists(path):
+        path = golden_path(name)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# (이름, 추출 함수, 전용 골든 파일 이름)
+EXTRACTORS = [
+    ("fast", partial(parse_html_fast, parser="html.parser"), None),
+    ("fast-lxml", partial(parse_html_fast, parser="lxml"), "lxml"),
+    ("legacy", parse_html_legacy, None),
+]
+
+
+def timed(parse, pages, repeat):
+    """
+    페이지당 평균 처리 시간 (µs)
+    """
+    start_ts = time.perf_counter()
+    for _ in range(repeat):
+        for _, html in pages:
+            parse(html, BASE_DOMAIN)
+    return (time.perf_counter() - start_ts) / (repeat * len(pages)) * 1e6
+
+
+def write_golden(path, record):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(record, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상세 페이지 추출 골든 파일 검사")
+    parser.add_argument("--update", action="store_true", help="legacy 추출 결과로 골든 파일 다시 생성")
+    parser.add_argument("--repeat", type=int, default=20, help="처리 시간 측정 반복 횟수")
+    args = parser.parse_args()
+
+    pages = load_pages()
+    if not pages:
+        print(f"검사할 페이지가 없습니다: {GOLDEN_DIR}")
+        return 1
+
+    if args.update:
+        for name, html in pages:
+            expected = to_record(parse_html_legacy(html, BASE_DOMAIN))
+            write_golden(golden_path(name), expected)
+            for _, parse, variant in EXTRACTORS:
+                if not variant:
+                    continue
+                actual = to_record(parse(html, BASE_DOMAIN))
+                if actual != expected:
+                    write_golden(golden_path(name, variant), actual)
+                elif os.path.exists(golden_path(name, variant)):
+                    os.remove(golden_path(name, variant))
+        print(f"골든 파일 {len(pages)}개 생성")
+        return 0
+
+    failures = 0
+    for name, html in pages:
+        for label, parse, variant in EXTRACTORS:
+            expected = load_golden(name, variant)
+            actual = to_record(parse(html, BASE_DOMAIN))
+            if actual == expected:
+                continue
+            failures += 1
+            print(f"  [불일치] {name} ({label})")
+            for key in expected:
+                if actual[key] != expected[key]:
+                    print(f"    {key}: 기대={expected[key]!r}")
+                    print(f"    {key}: 실제={actual[key]!r}")
+
+    print(f"페이지 수: {len(pages)}, 불일치: {failures}건")
+    print("평균 처리 시간: " + ", ".join(
+        f"{label} {timed(parse, pages, args.repeat):.0f}µs" for label, parse, _ in EXTRACTORS
+    ))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
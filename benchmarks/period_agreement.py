@@ -0,0 +1,105 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+신청기간 추출 벤치마크
+
+라벨링된 공지 본문(period_corpus.jsonl)으로 규칙 기반 추출기를 평가
+- 규칙으로 처리한 비율(커버리지)과 그중 라벨과 일치한 비율(정확도)
+- --llm 옵션: 같은 본문을 AI 추출로도 처리하여 규칙 결과와의 일치율 비교
+
+실행:
+    python benchmarks/period_agreement.py
+    python benchmarks/period_agreement.py --llm
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler_config import RULE_EXTRACTOR_MIN_CONFIDENCE
+from date_extractor import extract_period
+
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "period_corpus.jsonl")
+
+
+def load_corpus(path=CORPUS_PATH):
+    """
+    라벨링된 본문 목록 로드
+
+    Returns:
+        list[dict]: content, pub_date, start_date, end_date
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def run_rules(corpus, threshold):
+    """
+    규칙 기반 추출기 실행
+
+    Returns:
+        list[tuple[str | None, str | None] | None]: 공지별 결과 (AI로 넘어간 경우 None)
+    """
+    results = []
+    for row in corpus:
+        start_date, end_date, confidence = extract_period(row["content"], row["pub_date"])
+        results.append((start_date, end_date) if confidence >= threshold else None)
+    return results
+
+
+async def run_llm(corpus):
+    """
+    AI 추출 실행 (규칙 경로를 거치지 않음)
+
+    Returns:
+        list[tuple[str | None, str | None]]: 공지별 결과
+    """
+    from utils import extract_period_with_llm
+
+    return [await extract_period_with_llm(row["content"]) for row in corpus]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="신청기간 추출 벤치마크")
+    parser.add_argument("--threshold", type=float, default=RULE_EXTRACTOR_MIN_CONFIDENCE)
+    parser.add_argument("--llm", action="store_true", help="AI 추출 결과와 일치율 비교")
+    parser.add_argument("--verbose", action="store_true", help="불일치 항목 출력")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    labels = [(row["start_date"], row["end_date"]) for row in corpus]
+
+    start_ts = time.perf_counter()
+    rule_results = run_rules(corpus, args.threshold)
+    elapsed = time.perf_counter() - start_ts
+
+    settled = [(i, result) for i, result in enumerate(rule_results) if result is not None]
+    correct = [i for i, result in settled if result == labels[i]]
+
+    print(f"본문 수: {len(corpus)}")
+    print(f"규칙 처리: {len(settled)}건 ({len(settled) / len(corpus):.0%}), "
+          f"평균 {elapsed / len(corpus) * 1e6:.1f}µs")
+    if settled:
+        print(f"규칙 정확도(라벨 기준): {len(correct)}/{len(settled)} ({len(correct) / len(settled):.0%})")
+
+    if args.verbose:
+        for i, result in settled:
+            if result != labels[i]:
+                print(f"  [불일치] {corpus[i]['content'][:40]!r} 규칙={result} 라벨={labels[i]}")
+
+    if args.llm:
+        llm_results = asyncio.run(run_llm(corpus))
+        llm_correct = sum(1 for i, result in enumerate(llm_results) if result == labels[i])
+        agree = sum(1 for i, result in settled if result == llm_results[i])
+        print(f"AI 정확도(라벨 기준): {llm_correct}/{len(corpus)} ({llm_correct / len(corpus):.0%})")
+        if settled:
+            print(f"규칙-AI 일치율: {agree}/{len(settled)} ({agree / len(settled):.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 게시판 레지스트리 모듈
+
+crawler_config.BOARDS의 게시판별 설정(RSS URL, ID 패턴, CSS 클래스, 카테고리,
+중단 기준, 요청 한도)을 불러와 크롤링 코드에서 사용할 Board 객체로 제공
+"""
+
+import os
+import re
+
+from crawler_config import (
+    BOARDS, DEFAULT_BOARD, CRAWL_BOARDS,
+    BASE_DOMAIN, NOTICE_ID_PATTERN, HTML_CONTENT_CLASS, HTML_FILE_CLASS,
+    CATEGORY_MAP, ALLOWED_CATEGORIES,
+    CRAWLED_ID_FILENAME, INCREMENTAL_STOP_AFTER
+)
+from rate_limiter import UpstreamLimiter
+
+
+class Board:
+    """
+    게시판 하나의 크롤링 설정
+
+    Attributes:
+        name (str): 게시판 이름
+        rss_url (str): RSS URL 템플릿 ({}에 페이지 번호)
+        base_domain (str): 절대 URL 생성용 도메인
+        content_class (str): 상세 페이지 본문 div 클래스
+        file_class (str): 상세 페이지 첨부파일 div 클래스
+        category_map (dict): 카테고리 정규화 맵
+        allowed_categories (list[str] | None): 수집할 카테고리 (None이면 전체)
+        initial_pages (int): 초기 크롤링 최대 페이지 수
+        daily_pages (int): 일일 크롤링 최대 페이지 수
+        stop_days (int): 초기 크롤링 중단 기준 (일)
+        incremental_stop_after (int): 일일 크롤링 중단 기준 (연속 변경 없는 공지 수)
+        limiter (UpstreamLimiter | None): 게시판별 요청 한도 (없으면 None)
+    """
+
+    def __init__(self, name, rss_url, base_domain=BASE_DOMAIN,
+                 id_pattern=NOTICE_ID_PATTERN,
+                 content_class=HTML_CONTENT_CLASS, file_class=HTML_FILE_CLASS,
+                 category_map=CATEGORY_MAP, allowed_categories=ALLOWED_CATEGORIES,
+                 initial_pages=100, daily_pages=2, stop_days=365,
+                 incremental_stop_after=INCREMENTAL_STOP_AFTER, rpm=None):
+        """
+        Board 초기화 (인자는 crawler_config.BOARDS 항목과 같음)
+        """
+        self.name = name
+        self.rss_url = rss_url
+        self.base_domain = base_domain
+        self.id_re = re.compile(id_pattern)
+        self.content_class = content_class
+        self.file_class = file_class
+        self.category_map = category_map
+        self.allowed_categories = set(allowed_categories) if allowed_categories is not None else None
+        self.initial_pages = initial_pages
+        self.daily_pages = daily_pages
+        self.stop_days = stop_days
+        self.incremental_stop_after = incremental_stop_after
+        self.limiter = UpstreamLimiter(f"board:{name}", rpm) if rpm else None
+
+    @property
+    def is_default(self):
+        return self.name == DEFAULT_BOARD
+
+    @property
+    def crawled_id_filename(self):
+        """
+        최고 수위(이전에 본 가장 큰 공지 ID) 저장 파일명
+        """
+        if self.is_default:
+            return CRAWLED_ID_FILENAME
+        root, ext = os.path.splitext(CRAWLED_ID_FILENAME)
+        return f"{root}_{self.name}{ext}"
+
+    def max_pages(self, initial):
+        return self.initial_pages if initial else self.daily_pages
+
+    def normalize_category(self, category):
+        """
+        세부 카테고리를 대표 카테고리로 정규화
+        """
+        return self.category_map.get(category, category)
+
+    def allows(self, category):
+        """
+        수집 대상 카테고리인지 확인
+        """
+        return self.allowed_categories is None or category in self.allowed_categories
+
+    def extract_id(self, link):
+        """
+        링크에서 게시판 내 공지 ID 추출
+
+        Returns:
+            str: 공지 ID (찾지 못하면 "unknown")
+        """
+        match = self.id_re.search(link)
+        return match.group(1) if match else "unknown"
+
+    def store_id(self, board_notice_id):
+        """
+        저장소에 기록할 공지 ID (기본 게시판은 그대로, 나머지는 "게시판:ID")
+        """
+        return board_notice_id if self.is_default else f"{self.name}:{board_notice_id}"
+
+    async def acquire(self):
+        """
+        게시판별 요청 한도 확보 (한도가 없으면 바로 반환)
+        """
+        if self.limiter is not None:
+            await self.limiter.acquire()
+
+# ============================================================================
+
+# 레지스트리 조회
+
+_boards = {}
+
+def get_board(name=DEFAULT_BOARD):
+    """
+    이름에 해당하는 게시판 반환 (프로세스 전체에서 공유)
+
+    Args:
+        name (str): 게시판 이름
+
+    Returns:
+        Board: 게시판
+
+    Raises:
+        KeyError: BOARDS에 없는 게시판
+    """
+    if name not in _boards:
+        _boards[name] = Board(name, **BOARDS[name])
+    return _boards[name]
+
+def board_of(notice_id):
+    """
+    저장소 공지 ID가 속한 게시판 ("게시판:ID" 형식이 아니면 기본 게시판)
+
+    Args:
+        notice_id (str): 저장소 공지 ID
+
+    Returns:
+        Board: 게시판 (BOARDS에서 빠진 게시판이면 기본 게시판)
+    """
+    name, sep, _ = str(notice_id).partition(":")
+    return get_board(name if sep and name in BOARDS else DEFAULT_BOARD)
+
+def get_crawl_boards(names=None):
+    """
+    이번 실행에서 크롤링할 게시판 목록
+
+    Args:
+        names (list[str], optional): 게시판 이름 목록 (기본값: CRAWL_BOARDS)
+
+    Returns:
+        list[Board]: 게시판 목록
+    """
+    return [get_board(name) for name in (names or CRAWL_BOARDS)]
@@ -0,0 +1,331 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 체크포인트 모듈
+
+초기 크롤링(수십 페이지의 백필) 진행 상황을 SQLite 저널에 기록하여
+중단된 크롤링을 마지막 완료 페이지부터 이어서 실행
+- 게시판별 마지막 완료 페이지와 그때까지 본 가장 큰 공지 ID
+- 공지별 진행 단계(html → ocr → period → saved)와 단계 결과(본문, OCR 결과, 신청기간)
+- 처리에 실패한 공지의 RSS 항목 (완료 페이지 이전에 있어도 이어서 실행할 때 다시 처리)
+
+각 기록은 한 트랜잭션으로 커밋되므로 프로세스가 중간에 종료되어도 반쯤 쓴 기록이 남지 않음.
+이어서 실행할 때는 저장을 마친 공지는 건너뛰고, 진행 중이던 공지는 기록된 결과를 복원하여
+남은 단계만 처리하므로 OCR·신청기간 추출 API를 다시 호출하지 않음.
+실패한 공지는 페이지 순회 전에 먼저 다시 투입하고, 저장되면 실패 기록에서 지움
+"""
+
+import os
+import json
+import sqlite3
+import time
+
+from crawler_config import CHECKPOINT_PATH
+
+
+# 파이프라인 단계 순서
+STAGES = ("html", "ocr", "period", "saved")
+
+# 단계를 마친 뒤 저널에 기록하는 공지 필드
+_STAGE_FIELDS = (
+    "content", "image_urls", "attachments", "content_fingerprint", "start_date", "end_date",
+    "simhash", "number_fingerprint", "dedup_tokens", "duplicate_of", "reused"
+)
+
+# 실패한 공지를 다시 투입하기 위해 기록하는 RSS 항목 필드
+_RSS_FIELDS = ("notice_id", "title", "link", "pub_date", "category", "fingerprint")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    board TEXT PRIMARY KEY,
+    last_page INTEGER NOT NULL DEFAULT 0,
+    newest_id TEXT,
+    started_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS notices (
+    board TEXT NOT NULL,
+    notice_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    data TEXT,
+    PRIMARY KEY (board, notice_id)
+);
+CREATE TABLE IF NOT EXISTS failed (
+    board TEXT NOT NULL,
+    notice_id TEXT NOT NULL,
+    notice TEXT NOT NULL,
+    PRIMARY KEY (board, notice_id)
+);
+"""
+
+
+def _connect(path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def pending_checkpoints(path=CHECKPOINT_PATH):
+    """
+    중단된 초기 크롤링 목록
+
+    Args:
+        path (str): 체크포인트 파일 경로
+
+    Returns:
+        list[dict]: 게시판별 {"board", "last_page", "saved", "in_progress", "failed"} (없으면 빈 목록)
+    """
+    if not os.path.exists(path):
+        return []
+
+    conn = _connect(path)
+    try:
+        rows = conn.execute(
+            "SELECT r.board, r.last_page,"
+            " SUM(n.stage = 'saved'), SUM(n.stage IS NOT NULL AND n.stage != 'saved'),"
+            " (SELECT COUNT(*) FROM failed f WHERE f.board = r.board)"
+            " FROM runs r LEFT JOIN notices n ON n.board = r.board"
+            " GROUP BY r.board ORDER BY r.board"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    return [
+        {
+            "board": board, "last_page": last_page,
+            "saved": saved or 0, "in_progress": in_progress or 0, "failed": failed
+        }
+        for board, last_page, saved, in_progress, failed in rows
+    ]
+
+
+def has_pending_checkpoint(path=CHECKPOINT_PATH):
+    """
+    이어서 실행할 초기 크롤링이 있는지 확인
+    """
+    return bool(pending_checkpoints(path))
+
+# ============================================================================
+
+# 초기 크롤링 체크포인트
+
+class CrawlCheckpoint:
+    """
+    게시판 하나의 초기 크롤링 체크포인트
+
+    RSS 페이지의 공지가 모두 저장 단계를 지나면 저장소를 flush한 뒤
+    그 페이지를 완료로 기록하므로, 완료 페이지의 공지는 저장소에 반드시 남아 있음
+
+    Attributes:
+        board (str): 게시판 이름
+        db: 데이터베이스 객체 (페이지 완료 전에 flush)
+        last_page (int): 마지막 완료 페이지 (0이면 없음)
+        newest_id (str | None): 이전 실행에서 본 가장 큰 공지 ID
+        saved (set[str]): 저장을 마친 공지 ID
+        in_progress (dict[str, tuple[str, dict]]): 진행 중이던 공지 ID → (마친 단계, 단계 결과)
+        failed (dict[str, dict]): 이전 실행에서 실패한 공지 ID → RSS 항목 (다시 투입할 공지)
+        resumed (bool): 중단된 크롤링을 이어서 실행하는지 여부
+    """
+
+    def __init__(self, board, db, path=CHECKPOINT_PATH):
+        """
+        CrawlCheckpoint 초기화 (이전 기록이 있으면 불러옴)
+
+        Args:
+            board (str): 게시판 이름
+            db: 데이터베이스 객체
+            path (str): 체크포인트 파일 경로
+        """
+        self.board = board
+        self.db = db
+        self.conn = _connect(path)
+
+        self.saved = set()
+        self.in_progress = {}
+        for notice_id, stage, data in self.conn.execute(
+            "SELECT notice_id, stage, data FROM notices WHERE board = ?", (board,)
+        ):
+            if stage == "saved":
+                self.saved.add(notice_id)
+            else:
+                self.in_progress[notice_id] = (stage, json.loads(data) if data else {})
+        self.failed = {
+            notice_id: json.loads(notice) for notice_id, notice in self.conn.execute(
+                "SELECT notice_id, notice FROM failed WHERE board = ?", (board,)
+            )
+            if notice_id not in self.saved
+        }
+
+        row = self.conn.execute("SELECT last_page, newest_id FROM runs WHERE board = ?", (board,)).fetchone()
+        self.resumed = row is not None
+        self.last_page, self.newest_id = row if row else (0, None)
+        if not self.resumed:
+            now = time.time()
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO runs (board, started_at, updated_at) VALUES (?, ?, ?)", (board, now, now)
+                )
+
+        # 페이지 완료 판단용: 페이지 → 마지막 공지 순번, 저장 단계를 지난 공지 (순번, ID)
+        self._page_ends = []
+        self._processed = 0
+        self._saved_since = []
+
+    @property
+    def start_page(self):
+        """
+        이어서 시작할 RSS 페이지
+
+        중단 후 삭제된 공지로 목록이 앞으로 당겨져도 빠뜨리지 않도록
+        마지막 완료 페이지를 다시 읽음 (저장을 마친 공지는 건너뜀)
+        """
+        return max(1, self.last_page)
+
+    # ------------------------------------------------------------------------
+    # 공지 단계
+
+    def retry_notices(self):
+        """
+        이전 실행에서 실패한 공지를 다시 투입할 RSS 항목으로 반환 (한 번만 반환)
+
+        Returns:
+            list[dict]: 공지 (notice_id, title, link, pub_date, category, fingerprint)
+        """
+        notices = [dict(notice) for notice in self.failed.values()]
+        self.failed = {}
+        return notices
+
+    def restore(self, notice):
+        """
+        진행 중이던 공지의 단계 결과 복원
+
+        Args:
+            notice (dict): RSS에서 만든 공지
+
+        Returns:
+            dict: 복원한 공지 (기록이 없으면 그대로)
+        """
+        if notice["notice_id"] in self.in_progress:
+            stage, data = self.in_progress.pop(notice["notice_id"])
+            notice.update(data)
+            notice["stage"] = stage
+        return notice
+
+    @staticmethod
+    def done(notice, stage):
+        """
+        이전 실행에서 해당 단계를 이미 마쳤는지 확인
+        """
+        finished = notice.get("stage")
+        return finished is not None and STAGES.index(finished) >= STAGES.index(stage)
+
+    def record(self, notice, stage):
+        """
+        공지의 단계 완료와 결과 기록
+        """
+        data = {field: notice[field] for field in _STAGE_FIELDS if field in notice}
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO notices (board, notice_id, stage, data) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(board, notice_id) DO UPDATE SET stage = excluded.stage, data = excluded.data",
+                (self.board, notice["notice_id"], stage, json.dumps(data, ensure_ascii=False))
+            )
+        notice["stage"] = stage
+
+    # ------------------------------------------------------------------------
+    # 페이지 진행
+
+    def end_page(self, page, last_seq, newest_id):
+        """
+        RSS 페이지의 공지를 모두 투입했음을 기록 (투입 단계에서 호출)
+
+        Args:
+            page (int): 페이지 번호
+            last_seq (int): 이 페이지까지 투입한 마지막 공지 순번 (-1이면 없음)
+            newest_id (str | None): 지금까지 본 가장 큰 공지 ID
+        """
+        self._page_ends.append((page, last_seq, newest_id))
+        self._complete_pages()
+
+    def processed(self, notice):
+        """
+        순서대로 저장 단계를 지난 공지 기록 (저장 단계에서 호출)
+
+        실패한 공지는 페이지 완료와 관계없이 바로 실패 기록에 남겨
+        이후 페이지가 완료되어도 이어서 실행할 때 다시 처리
+
+        Args:
+            notice (dict): 처리한 공지 (실패·건너뛴 공지 포함)
+        """
+        if notice.get("failed"):
+            data = {field: notice[field] for field in _RSS_FIELDS}
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO failed (board, notice_id, notice) VALUES (?, ?, ?)"
+                    " ON CONFLICT(board, notice_id) DO UPDATE SET notice = excluded.notice",
+                    (self.board, notice["notice_id"], json.dumps(data, ensure_ascii=False))
+                )
+        elif not notice.get("unchanged"):
+            self._saved_since.append((notice["seq"], notice["notice_id"]))
+        self._processed = notice["seq"] + 1
+        self._complete_pages()
+
+    def _complete_pages(self):
+        """
+        공지가 모두 저장 단계를 지난 페이지를 완료로 기록
+        """
+        completed = None
+        while self._page_ends and self._page_ends[0][1] < self._processed:
+            completed = self._page_ends.pop(0)
+        if completed is None:
+            return
+
+        page, last_seq, newest_id = completed
+        saved_ids = [notice_id for seq, notice_id in self._saved_since if seq <= last_seq]
+        self._saved_since = [(seq, notice_id) for seq, notice_id in self._saved_since if seq > last_seq]
+
+        # 저장소에 기록한 뒤 완료로 표시
+        flush = getattr(self.db, "flush", None)
+        if flush:
+            flush()
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO notices (board, notice_id, stage, data) VALUES (?, ?, 'saved', NULL)"
+                " ON CONFLICT(board, notice_id) DO UPDATE SET stage = 'saved', data = NULL",
+                [(self.board, notice_id) for notice_id in saved_ids]
+            )
+            self.conn.executemany(
+                "DELETE FROM failed WHERE board = ? AND notice_id = ?",
+                [(self.board, notice_id) for notice_id in saved_ids]
+            )
+            self.conn.execute(
+                "UPDATE runs SET last_page = ?, newest_id = ?, updated_at = ? WHERE board = ?",
+                (page, newest_id, time.time(), self.board)
+            )
+        self.saved.update(saved_ids)
+        self.last_page = page
+
+    # ------------------------------------------------------------------------
+    # 종료
+
+    def finish(self):
+        """
+        초기 크롤링 완료: 저장소를 flush한 뒤 이 게시판의 기록 삭제
+        """
+        flush = getattr(self.db, "flush", None)
+        if flush:
+            flush()
+
+        with self.conn:
+            self.conn.execute("DELETE FROM notices WHERE board = ?", (self.board,))
+            self.conn.execute("DELETE FROM failed WHERE board = ?", (self.board,))
+            self.conn.execute("DELETE FROM runs WHERE board = ?", (self.board,))
+        self.close()
+
+    def close(self):
+        self.conn.close()
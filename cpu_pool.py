@@ -0,0 +1,89 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 CPU 작업 풀 모듈
+
+HTML 파싱·Markdown 변환·이미지 전처리처럼 CPU를 많이 쓰는 작업을
+프로세스 풀에서 실행하여 GIL에 묶이지 않고 여러 코어를 사용.
+CPU_WORKERS가 0이거나 풀을 쓸 수 없으면 같은 프로세스의 스레드에서 실행
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from crawler_config import CPU_WORKERS
+
+
+# 프로세스 풀 (첫 사용 시 생성)
+_executor = None
+
+# 풀 생성 또는 실행에 실패하여 같은 프로세스에서 실행하는지 여부
+_disabled = False
+
+# ============================================================================
+
+# 풀 관리
+
+def get_cpu_executor():
+    """
+    프로세스 전체에서 공유하는 CPU 작업 프로세스 풀 반환
+
+    이벤트 루프·스레드 상태를 물려받지 않도록 spawn 방식으로 작업 프로세스 생성
+
+    Returns:
+        ProcessPoolExecutor | None: 프로세스 풀 (사용하지 않으면 None)
+    """
+    global _executor, _disabled
+    if _executor is None and CPU_WORKERS > 0 and not _disabled:
+        try:
+            _executor = ProcessPoolExecutor(
+                max_workers=CPU_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        except (OSError, NotImplementedError) as e:
+            print(f"CPU 작업 풀 생성 실패, 같은 프로세스에서 실행합니다: {e}")
+            _disabled = True
+    return _executor
+
+def close_cpu_pool():
+    """
+    CPU 작업 프로세스 풀 종료
+    """
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+# ============================================================================
+
+# 작업 실행
+
+async def run_cpu(func, *args):
+    """
+    CPU 작업 실행 (프로세스 풀이 있으면 풀에서, 없으면 스레드에서)
+
+    작업 프로세스로는 인자만 전달되므로 func는 모듈 최상위 함수여야 하고,
+    인자와 반환값은 원시 바이트·문자열·리스트처럼 작은 값이어야 함.
+    작업 프로세스가 비정상 종료되면 풀을 끄고 같은 프로세스에서 다시 실행
+
+    Args:
+        func (Callable): 실행할 함수
+        *args: 함수 인자
+
+    Returns:
+        func의 반환값
+    """
+    global _executor, _disabled
+    executor = get_cpu_executor()
+
+    if executor is not None:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+        except BrokenProcessPool as e:
+            print(f"CPU 작업 풀 오류, 같은 프로세스에서 실행합니다: {e}")
+            _disabled = True
+            _executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return await asyncio.to_thread(func, *args)
@@ -32,6 +32,16 @@ BASE_DOMAIN = os.getenv("BASE_DOMAIN")
 HTML_CONTENT_CLASS = "view-con"  # 본문 내용이 있는 div 클래스
 HTML_FILE_CLASS = "view-file"    # 첨부파일이 있는 div 클래스
 
+# 상세 페이지 추출 방식
+# - "fast": 본문·첨부파일 블록만 파싱하고 재직렬화 없이 Markdown 변환
+# - "legacy": 페이지 전체를 html.parser로 파싱 (이전 방식)
+HTML_EXTRACTOR = "fast"
+
+# fast 추출에 사용할 파서
+# - "html.parser": legacy와 결과 동일
+# - "lxml": 더 빠르지만 닫는 태그를 생략한 목록·표는 결과가 달라질 수 있음
+HTML_PARSER = "html.parser"
+
 # 공지사항 ID 추출 정규식 패턴
 # - URL에서 공지사항 고유 ID를 추출하는 패턴
 NOTICE_ID_PATTERN = r'143/(\d+)'
@@ -44,6 +54,52 @@ NOTICE_ID_PATTERN = r'143/(\d+)'
 # - 네트워크 문제나 서버 응답 지연 시 무한 대기를 방지
 REQUEST_TIMEOUT = 30
 
+# HTTP 요청 User-Agent
+HTTP_USER_AGENT = "Mozilla/5.0"
+
+# HTTP 연결 풀 크기
+# - 전체 동시 연결 수와 호스트(학교 서버)별 동시 연결 수
+HTTP_POOL_SIZE = 20
+HTTP_LIMIT_PER_HOST = 6
+
+# HTTP 요청 재시도 설정
+# - 연결 오류나 5xx 응답 시 HTTP_BACKOFF_BASE * 2^n 초 간격으로 재시도
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_BASE = 1.0
+
+# HTTP 캐시 설정
+# - RSS 페이지, 상세 페이지, OCR 대상 이미지 응답을 디스크에 압축 저장
+# - 다음 실행 시 ETag/Last-Modified로 조건부 요청하여 변경 없으면(304) 캐시 사용
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_DIR = "./cache/http"
+
+# 오프라인 재실행 모드 (.env 파일 또는 `python start.py offline`으로 설정)
+# - 네트워크 요청 없이 캐시된 응답만으로 크롤링 (파싱 로직 변경 후 재처리용)
+# - 캐시에 없는 페이지는 건너뜀
+# - 캐시에 없는 이미지가 있는 공지는 OCR하지 않고 저장도 하지 않음 (저장된 본문 유지)
+HTTP_CACHE_OFFLINE = os.getenv("HTTP_CACHE_OFFLINE") == "1"
+
+# ============================================================================
+
+# 크롤링 파이프라인 설정
+
+# 단계별 동시 실행 수
+# - RSS 페이지 → 상세 HTML → OCR → 신청기간 추출 → DB 저장 순으로 처리
+# - 각 단계는 큐로 연결되어 앞 단계가 다음 공지를 처리하는 동안 뒤 단계가 동시에 진행
+RSS_FETCH_CONCURRENCY = 2    # 미리 받아둘 RSS 페이지 수
+HTML_FETCH_CONCURRENCY = 4   # 상세 페이지 동시 요청 수
+OCR_CONCURRENCY = 3          # 동시 OCR(zerox) 작업 수
+PERIOD_CONCURRENCY = 4       # 신청기간 추출 동시 호출 수
+
+# 단계 사이 큐의 최대 크기
+# - 뒤 단계가 밀리면 앞 단계가 대기하여 메모리 사용량을 제한
+PIPELINE_QUEUE_SIZE = 20
+
+# CPU 작업 프로세스 수
+# - HTML 파싱·Markdown 변환·이미지 전처리를 여러 프로세스에서 병렬 실행 (대량 백필·캐시 재처리용)
+# - 0이면 프로세스 풀 없이 같은 프로세스의 스레드에서 실행
+CPU_WORKERS = int(os.getenv("CPU_WORKERS", "0"))
+
 # ============================================================================
 
 # 카테고리 설정
@@ -91,34 +147,201 @@ CATEGORY_MAP = {
 
 # ============================================================================
 
+# 유사 중복 공지 설정
+
+# 여러 세부 카테고리에 다른 ID로 다시 올린 같은 공지 판별
+# - OCR 전 제목·본문의 SimHash(64비트) 해밍 거리가 DEDUP_MAX_DISTANCE 이하이고
+#   본문의 숫자(날짜·연도 등)가 모두 같으며 게시일 차이가 DEDUP_WINDOW_DAYS일 이내이면 중복으로 판단
+# - 중복 공지는 OCR·신청기간 추출을 다시 하지 않고 원본 결과를 재사용하며 duplicate_of에 원본 ID 기록
+# - 토큰이 DEDUP_MIN_TOKENS개보다 적은 짧은 공지는 OCR이 필요하면서 이미지가 같은 경우만 중복으로 판단
+DEDUP_ENABLED = True
+DEDUP_MAX_DISTANCE = 3
+DEDUP_WINDOW_DAYS = 30
+DEDUP_MIN_TOKENS = 20
+
+# ============================================================================
+
+# 게시판 레지스트리
+
+# 게시판별 크롤링 설정 (지정하지 않은 항목은 위의 전역 설정 사용)
+# - rss_url: RSS URL 템플릿 ({}에 페이지 번호), base_domain: 절대 URL 생성용 도메인
+# - id_pattern: 링크에서 공지 ID를 추출하는 정규식
+# - content_class / file_class: 상세 페이지 본문·첨부파일 div 클래스
+# - category_map / allowed_categories: 카테고리 정규화 맵과 수집할 카테고리 (None이면 전체)
+# - initial_pages / daily_pages: 초기/일일 크롤링 최대 페이지 수
+# - stop_days: 초기 크롤링에서 이보다 오래된 공지에 도달하면 중단
+# - incremental_stop_after: 일일 크롤링 중단 기준 (INCREMENTAL_STOP_AFTER 참고)
+# - rpm: 이 게시판의 분당 요청 수 (school 전체 한도 안에서 추가 제한, None이면 제한 없음)
+BOARDS = {
+    "hansung": {
+        "rss_url": RSS_URL,
+        "base_domain": BASE_DOMAIN,
+        "initial_pages": 100,
+        "daily_pages": 2,
+    },
+    # 예시: 기숙사 공지 (.env에 DORM_RSS_URL 설정 후 CRAWL_BOARDS에 추가)
+    # "dorm": {
+    #     "rss_url": os.getenv("DORM_RSS_URL"),
+    #     "base_domain": BASE_DOMAIN,
+    #     "id_pattern": r'/(\d+)/artclView',
+    #     "category_map": {},
+    #     "allowed_categories": None,
+    #     "daily_pages": 1,
+    #     "rpm": 30,
+    # },
+}
+
+# 기본 게시판
+# - 공지 ID를 접두사 없이 저장하고 최고 수위는 CRAWLED_ID_FILENAME에 기록
+# - 다른 게시판은 "게시판:ID" 형식으로 저장하고 crawled_id_게시판.txt 사용
+DEFAULT_BOARD = "hansung"
+
+# 이번 실행에서 크롤링할 게시판 (쉼표로 구분, 여러 게시판은 동시에 크롤링)
+CRAWL_BOARDS = [name.strip() for name in os.getenv("CRAWL_BOARDS", DEFAULT_BOARD).split(",") if name.strip()]
+
+# ============================================================================
+
 # 데이터베이스 설정
 
+# 저장소 종류
+# - "sqlite": SQLite 저장소(NoticeStore)에 저장 후 텍스트 파일로 내보내기
+# - "text": 텍스트 파일(TextFileDB)에 바로 추가 저장
+DB_BACKEND = "sqlite"
+
+# SQLite 저장소 파일 경로와 한 트랜잭션으로 모아 저장할 공지 수
+DB_PATH = "notice_db.sqlite3"
+DB_WRITE_BATCH_SIZE = 50
+
 # 크롤링한 공지사항 저장하는 텍스트 파일명
-# - 텍스트 파일 기반 간단한 DB로 동작
+# - text 저장소의 DB 파일이자 sqlite 저장소의 내보내기 파일 (FastAPI 업로드 대상)
 DB_TEXT_FILENAME = "notice_db.txt"
 
 # 마지막 크롤링 ID 저장 파일명
-# - 일일 크롤링 시 중복 방지를 위한 ID 추적
+# - 이전에 본 가장 큰 공지 ID (일일 크롤링의 최고 수위)
 CRAWLED_ID_FILENAME = "crawled_id.txt"
 
+# 일일(증분) 크롤링 중단 기준
+# - 최고 수위 이하이면서 변경 없는 공지가 이 개수만큼 연속되면 중단
+# - 상단 고정 공지나 삭제된 공지가 있어도 끝까지 순회하지 않도록 정확한 ID 일치 대신 사용
+INCREMENTAL_STOP_AFTER = 10
+
+# 신청기간이 남은 공지 재검증
+# - 일일 크롤링 후 마감 전 공지의 상세 페이지를 조건부 요청으로 다시 확인하고
+#   본문·첨부파일이 바뀐 공지만 OCR·신청기간 추출을 다시 실행 (sqlite 저장소만)
+REVALIDATE_OPEN_NOTICES = True
+
+# 초기 크롤링 체크포인트
+# - 초기 크롤링 중 완료한 RSS 페이지와 공지별 진행 단계(상세 페이지·OCR·신청기간 추출 결과)를 기록
+# - 중단된 초기 크롤링은 다음 실행(또는 python start.py resume)에서 마지막 완료 페이지부터 이어서 실행하고,
+#   저장을 마친 공지는 건너뛰며 진행 중이던 공지는 기록된 단계 이후만 처리
+CHECKPOINT_ENABLED = True
+CHECKPOINT_PATH = "crawl_checkpoint.sqlite3"
+
+# 크롤러 실행 잠금 파일
+# - 크롤러(일회 실행·데몬)가 동시에 실행되어 저장소, notice_db.txt, crawled_id.txt를
+#   함께 수정하지 않도록 실행 중에는 이 파일을 잠금
+CRAWL_LOCK_FILENAME = "crawler.lock"
+
+# ============================================================================
+
+# 검색 색인 설정 (sqlite 저장소만)
+
+# 크롤링 마지막 단계에서 검색 색인 갱신
+# - 저장소 안의 FTS5 색인에 바뀐 공지만 다시 색인 (한국어는 음절 바이그램)
+# - python start.py search <검색어>로 확인
+SEARCH_INDEX_ENABLED = True
+
+# BM25 열 가중치 (제목, 카테고리, 본문)
+# - 제목에 검색어가 있는 공지를 본문에만 있는 공지보다 앞에 표시
+SEARCH_BM25_WEIGHTS = (5.0, 2.0, 1.0)
+
+# 검색 결과 최대 개수
+SEARCH_RESULT_LIMIT = 20
+
+# ============================================================================
+
+# 임베딩 색인 설정 (sqlite 저장소만, .env 파일 또는 EMBEDDING_ENABLED=1로 사용)
+
+# 크롤링 마지막 단계에서 임베딩 색인 갱신
+# - 바뀐 공지의 본문만 조각으로 나누고, 조각 해시로 이전 벡터를 재사용하여 새·수정 조각만 임베딩
+# - python start.py similar <질문>으로 확인
+EMBEDDING_ENABLED = os.getenv("EMBEDDING_ENABLED") == "1"
+
+# 임베딩 방식
+# - "openai": OpenAI Embeddings API (EMBEDDING_MODEL, EMBEDDING_DIMENSIONS)
+# - "local": 네트워크 없이 같은 입력에 같은 벡터를 주는 해시 임베딩 (오프라인 실행·테스트용)
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "openai")
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSIONS = 512
+
+# 벡터 행렬(float32)과 조각 메타데이터 저장 디렉토리 (방식·모델·차원별 하위 디렉토리)
+EMBEDDING_DIR = "./cache/embeddings"
+
+# 본문 조각 크기 (글자 수)
+# - 문단 경계에서 EMBEDDING_CHUNK_CHARS 이하로 나누고, 이보다 긴 줄은 EMBEDDING_CHUNK_OVERLAP만큼 겹쳐 자름
+EMBEDDING_CHUNK_CHARS = 800
+EMBEDDING_CHUNK_OVERLAP = 100
+
+# 한 번의 임베딩 요청에 담는 조각 수
+EMBEDDING_BATCH_SIZE = 64
+
+# 더 이상 공지에 연결되지 않은 벡터 비율이 이보다 크면 벡터 파일 압축
+EMBEDDING_COMPACT_RATIO = 0.3
+
+# 근사 검색(IVF)
+# - 조각이 EMBEDDING_IVF_MIN_VECTORS개 이상이면 k-means 군집(√조각 수개) 중
+#   질문과 가까운 EMBEDDING_IVF_NPROBE개 군집의 조각만 비교 (미만이면 전수 비교)
+EMBEDDING_IVF_MIN_VECTORS = 50000
+EMBEDDING_IVF_NPROBE = 8
+
+# 검색 결과 공지 수
+EMBEDDING_SEARCH_K = 10
+
+# ============================================================================
+
+# 데몬 모드 설정 (python start.py daemon)
+
+# 기본 크롤링 간격 (초)과 무작위 편차 비율
+# - 실제 간격 = 간격 × (1 ± DAEMON_JITTER) 범위의 무작위 값
+DAEMON_INTERVAL = int(os.getenv("DAEMON_INTERVAL", "900"))
+DAEMON_JITTER = 0.1
+
+# 바쁜 기간의 크롤링 간격 (초)
+# - DAEMON_BUSY_PERIODS(월-일, 시작·끝 포함) 동안이나 직전 주기에 새 공지가 있었으면 이 간격 사용
+DAEMON_BUSY_INTERVAL = int(os.getenv("DAEMON_BUSY_INTERVAL", "300"))
+DAEMON_BUSY_PERIODS = [
+    ("02-15", "03-15"),  # 1학기 개강 전후
+    ("08-15", "09-15"),  # 2학기 개강 전후
+]
+
+# 신청기간이 남은 공지 재검증 간격 (초, REVALIDATE_OPEN_NOTICES가 True일 때)
+DAEMON_REVALIDATE_INTERVAL = 6 * 60 * 60
+
 # ============================================================================
 
 # PDF 및 OCR 처리 설정
 
 # OCR 처리를 위한 임시 PDF 저장 디렉토리
-# - 이미지가 포함된 공지사항을 PDF로 변환 후 OCR 처리
+# - 이미지가 포함된 공지사항을 OCR 작업마다 별도 임시 PDF로 변환 후 처리
+# - 임시 PDF는 OCR 처리 후 자동으로 삭제
 OUTPUT_DIR = "./pdf"
 
-# 임시 PDF 파일명
-# - OCR 처리 후 자동으로 삭제
-PDF_FILENAME = "temp.pdf"
-
-# 임시 PDF 파일 전체 경로
-PDF_PATH = os.path.join(OUTPUT_DIR, PDF_FILENAME)
-
-# OCR 처리 전 대기 시간 (초)
-# - 연속적인 OCR 요청으로 인한 서버 부하 방지
-OCR_DELAY = 3
+# OCR 결과 캐시
+# - 이미지 내용 해시(SHA-256)가 같은 이미지만 이전 OCR 결과를 재사용
+#   (날짜만 다른 같은 템플릿 포스터는 지각 해시가 같으므로 지각 해시로는 찾지 않음)
+OCR_CACHE_PATH = "./cache/ocr_cache.sqlite3"
+OCR_CACHE_MAX_ENTRIES = 20000
+
+# OCR 전 이미지 전처리
+# - OCR_MIN_IMAGE_BYTES / OCR_MIN_IMAGE_DIMENSION: 이보다 작은 이미지(아이콘, 여백 이미지)는 OCR 제외
+# - OCR_MAX_IMAGE_DIMENSION: 긴 변이 이보다 큰 이미지는 축소 후 JPEG로 재인코딩
+# - OCR_TEXT_CHECK_ENABLED: 경계 픽셀 비율로 글자가 없어 보이는 이미지 제외
+OCR_MIN_IMAGE_BYTES = 2048
+OCR_MIN_IMAGE_DIMENSION = 100
+OCR_MAX_IMAGE_DIMENSION = 2000
+OCR_JPEG_QUALITY = 85
+OCR_TEXT_CHECK_ENABLED = False
+OCR_TEXT_MIN_EDGE_RATIO = 0.02
 
 # OCR 적용을 위한 최소 텍스트 길이 (문자 수)
 # - 본문이 이 길이보다 짧으면 이미지 OCR을 시도
@@ -140,9 +363,59 @@ TEMPERATURE = 0.1
 # AI 응답 최대 토큰 수
 MAX_TOKENS = 200
 
-# OpenAI API 호출 간 지연 시간 (초)
-# - 레이트 리밋(Rate Limit) 초과를 방지
-AI_CALL_DELAY = 3
+# AI로 보내는 본문 길이 제한
+# - 본문의 예상 토큰 수가 상한을 넘으면 날짜·신청 관련 표현이 있는 줄과
+#   앞뒤 LLM_CONTEXT_LINES줄만 남겨서 전송 (긴 공지, OCR 결과 등)
+LLM_CONTENT_TOKEN_CAP = 3000
+LLM_CONTEXT_LINES = 1
+
+# 신청기간 추출 결과 캐시
+# - 본문·프롬프트·모델·온도 해시가 같으면 API를 호출하지 않고 이전 결과 재사용
+# - 최대 개수를 넘으면 가장 오래 사용되지 않은 결과부터 삭제
+LLM_CACHE_PATH = "./cache/llm_cache.sqlite3"
+LLM_CACHE_MAX_ENTRIES = 50000
+
+# 규칙 기반 신청기간 추출 (AI 호출 전 빠른 경로)
+# - 정규식으로 날짜 표현을 찾아 확신도가 기준값 이상이면 AI를 호출하지 않음
+# - 기준값을 높일수록 AI로 넘어가는 공지가 늘어남 (benchmarks/period_agreement.py로 확인)
+RULE_EXTRACTOR_ENABLED = True
+RULE_EXTRACTOR_MIN_CONFIDENCE = 0.8
+
+# 신청기간 일괄 추출 (여러 공지를 한 번의 요청으로 처리)
+# - PERIOD_BATCH_SIZE가 1이면 공지마다 개별 요청 (일괄 추출 사용 안 함)
+# - 한 요청에 담는 본문의 예상 토큰 합계는 PERIOD_BATCH_TOKEN_BUDGET 이하로 제한
+# - 공지가 모일 때까지 최대 PERIOD_BATCH_LINGER초 대기 후 모인 만큼 전송
+# - 응답 형식이 잘못된 공지는 개별 요청으로 다시 처리
+PERIOD_BATCH_SIZE = 1
+PERIOD_BATCH_TOKEN_BUDGET = 8000
+PERIOD_BATCH_LINGER = 2.0
+
+# OpenAI Batch API(파일 기반 비동기 작업) 입력/결과 파일 저장 디렉토리
+# - 대량 백필 시 즉시 응답 대신 24시간 내 처리되는 일괄 작업으로 제출 (`python start.py batch submit`)
+# - 결과는 `python start.py batch collect <작업 ID>`로 수집하여 저장소와 신청기간 캐시에 기록
+BATCH_JOB_DIR = "./cache/batch_jobs"
+
+# ============================================================================
+
+# 요청 속도 제한 설정
+
+# 외부 서비스별 요청 한도
+# - rpm: 분당 요청 수, tpm: 분당 토큰 수 (None이면 제한 없음)
+# - school: 학교 홈페이지(RSS, 상세 페이지, 이미지)
+# - openai_chat: 신청기간 추출용 OpenAI Chat API
+# - zerox: 이미지 OCR용 Vision 모델 호출 (페이지당 1건)
+RATE_LIMITS = {
+    "school": {"rpm": 120, "tpm": None},
+    "openai_chat": {"rpm": 500, "tpm": 200000},
+    "zerox": {"rpm": 60, "tpm": None},
+    "openai_embedding": {"rpm": 3000, "tpm": 1000000},
+}
+
+# 429 응답에 Retry-After가 없을 때 대기 시간 (초)
+RATE_LIMIT_DEFAULT_BACKOFF = 10
+
+# 429 응답 시 최대 재시도 횟수
+RATE_LIMIT_MAX_RETRIES = 3
 
 # ============================================================================
 
@@ -160,6 +433,26 @@ FASTAPI_PORT = "8000"
 # 파일 업로드 엔드포인트 경로
 FASTAPI_PATH = "/send/file"
 
+# 변경분 동기화 엔드포인트 경로 (notice_db.txt 전체 업로드 대신 사용)
+# - 마지막으로 서버가 확인(ack)한 이후 바뀐 공지만 JSONL 묶음으로 전송
+# - 묶음마다 SYNC_CHUNK_SIZE개씩 보내고 실패하면 SYNC_BACKOFF_BASE * 2^n 초 간격으로 재시도,
+#   확인받은 묶음까지는 기록되므로 다음 실행에서 이어서 전송
+# - SYNC_ENABLED가 True면 크롤링 후 자동으로 동기화
+FASTAPI_SYNC_PATH = "/sync/notices"
+SYNC_ENABLED = False
+SYNC_CHUNK_SIZE = 200
+SYNC_MAX_RETRIES = 5
+SYNC_BACKOFF_BASE = 1.0
+
+# 구조화 내보내기 (python start.py export)
+# - JSONL: 공지 하나당 한 줄의 JSON (버전·변경 순번 포함)
+# - Parquet: 열 단위 압축 스냅샷 (pyarrow 설치 시에만, EXPORT_PARQUET_ENABLED)
+EXPORT_JSONL_FILENAME = "notice_db.jsonl"
+EXPORT_PARQUET_FILENAME = "notice_db.parquet"
+EXPORT_PARQUET_ENABLED = False
+EXPORT_PARQUET_COMPRESSION = "zstd"
+EXPORT_PARQUET_ROW_GROUP_SIZE = 1000
+
 # ============================================================================
 
 # AI 프롬프트
@@ -197,3 +490,29 @@ PROMPT = """
     # 본문
     {content}
 """
+
+# 여러 공지의 신청 기간을 한 번에 추출하는 프롬프트
+# - 공지마다 "공지 ID"로 구분하며, 응답은 JSON 스키마(structured output)로 강제
+PERIOD_BATCH_PROMPT = """
+    너는 여러 공지사항 본문에서 각각 신청 기간의 시작일과 종료일을 추출하는 AI야.
+
+    # 규칙
+    - 각 공지는 "### 공지 ID: <ID>"로 시작해. 공지마다 독립적으로 분석해.
+    - 모든 공지에 대해 결과를 하나씩, 입력과 같은 notice_id로 반환해.
+    - 날짜는 항상 "YYYY-MM-DD" 형식으로 작성해줘.
+    - 기간을 찾을 수 없으면 "has_period"는 false, 날짜는 모두 null로 처리해.
+    - 기간을 찾았다면 "has_period"는 true로 하고, "end_date"는 반드시 값이 있어야 해. "start_date"는 없으면 null로 처리해.
+
+    # 예시
+    1. 본문: "모집 기간은 9월 16일부터 10월 5일까지입니다."
+    결과: {{"has_period": true, "start_date": "2025-09-16", "end_date": "2025-10-05"}}
+
+    2. 본문: "접수 마감은 2025년 9월 30일 18:00까지입니다."
+    결과: {{"has_period": true, "start_date": null, "end_date": "2025-09-30"}}
+
+    3. 본문: "본 채용은 상시 모집으로 진행됩니다."
+    결과: {{"has_period": false, "start_date": null, "end_date": null}}
+
+    # 공지 목록
+    {notices}
+"""
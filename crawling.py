@@ -3,194 +3,780 @@ HANA (Hansung AI for Notice & Assistance)
 한성대학교 공지사항 크롤링 모듈
 
 RSS 피드 및 HTML 페이지 크롤링을 통해 공지사항 데이터 수집
+(게시판별 설정은 boards.py의 게시판 레지스트리에서 가져옴)
 """
 
-import re
 import asyncio
-import requests
-from bs4 import BeautifulSoup as bs
-from markdownify import markdownify as md
+from datetime import datetime
 
 from crawler_config import (
-    RSS_URL, BASE_DOMAIN, HTML_CONTENT_CLASS, HTML_FILE_CLASS, NOTICE_ID_PATTERN,
-    MIN_TEXT_LENGTH, AI_CALL_DELAY, ALLOWED_CATEGORIES
+    MIN_TEXT_LENGTH,
+    RSS_FETCH_CONCURRENCY, HTML_FETCH_CONCURRENCY, OCR_CONCURRENCY, PERIOD_CONCURRENCY,
+    PIPELINE_QUEUE_SIZE, CPU_WORKERS,
+    PERIOD_BATCH_SIZE, PERIOD_BATCH_LINGER,
+    CHECKPOINT_ENABLED,
+    SEARCH_INDEX_ENABLED, EMBEDDING_ENABLED,
+    DEDUP_ENABLED
 )
+from db import NoticeStore
+from checkpoint import CrawlCheckpoint
+from search_index import update_search_index
+from embedding_index import update_embedding_index
+from boards import get_board, board_of, get_crawl_boards
+from dedup import DuplicateDetector, set_near_duplicate_key, reuse_original
 from utils import (
-    normalize_category,
-    get_application_period,
-    image_urls_to_text,
-    is_stop, load_latest_crawled_id, save_latest_crawled_id
+    get_application_period, rule_based_period, get_period_cache, period_stats,
+    is_stop, notice_fingerprint, content_fingerprint, is_older_than,
+    load_latest_crawled_id, save_latest_crawled_id
 )
+from rss_parser import iter_items
+from html_extractor import parse_html_bytes
+from cpu_pool import run_cpu
+from ocr import image_urls_to_text
+from ocr_cache import get_ocr_cache
+from period_batch import extract_periods_batch
+from http_cache import CacheMissError
+from http_client import get_http_client
 
 
 # ============================================================================
 
 # HTML 페이지 크롤링
 
-def html_crawl(link, base_domain=BASE_DOMAIN):
+async def _fetch_page(link, board):
+    """
+    게시판 요청 한도를 지켜 페이지 수집 (HTTP 캐시 사용)
+
+    삭제된 글(404)이나 재시도 후에도 남은 429/5xx 응답은 HttpStatusError로 실패시켜
+    오류 페이지가 공지 본문으로 저장되지 않도록 함
+    """
+    await board.acquire()
+    return await get_http_client().fetch_cached(link)
+
+
+async def _parse_page(page, board):
+    """
+    게시판의 본문·첨부파일 클래스로 상세 페이지 추출 (CPU 작업 풀에서 실행)
+    """
+    return await run_cpu(
+        parse_html_bytes, page.body, page.encoding,
+        board.base_domain, board.content_class, board.file_class
+    )
+
+
+async def html_crawl(link, board=None):
     """
     공지사항 게시글에서 본문, 이미지, 첨부파일 수집
     
     Args:
         link (str): 공지사항 URL
-        base_domain (str): 기본 도메인
+        board (Board, optional): 게시판 (기본값: 기본 게시판)
         
     Returns:
         tuple[str | None, list[str], list[str]]: (본문, 이미지 URL 목록, 첨부파일 목록)
     """
-    page = requests.get(link)
-    soup = bs(page.text, 'html.parser')
+    board = board or get_board()
+    return await _parse_page(await _fetch_page(link, board), board)
 
-    content, image_urls, attachments = None, [], []
+# ============================================================================
 
-    # 본문 내용 및 이미지 추출
-    view_con_div = soup.find('div', class_=HTML_CONTENT_CLASS)
-    if view_con_div:
-        # HTML을 Markdown으로 변환
-        content = md(str(view_con_div), strip=['a', 'img']).strip()
-        
-        # 이미지 URL 수집
-        for img_tag in view_con_div.find_all('img', src=True):
-            src = img_tag['src']
-            # 상대 경로를 절대 경로로 변환
-            if src.startswith('/'):
-                src = f"{base_domain}{src}"
-            image_urls.append(src)
-
-    # 첨부파일 추출
-    file_div = soup.find('div', class_=HTML_FILE_CLASS)
-    if file_div:
-        for a_tag in file_div.find_all('a', href=True):
-            href = a_tag['href']
-            # 다운로드 링크만 수집
-            if "download.do" in href:
-                if href.startswith('/'):
-                    file_url = f"{base_domain}{href}"
-                file_name = a_tag.get_text(strip=True)
-                attachments.append(f"{file_name} | {file_url}")
-    
-    return content, image_urls, attachments
+# 크롤링 파이프라인 단계
+
+# 단계 종료 신호
+_STOP = object()
+
+
+def _skipped(notice):
+    """
+    이후 단계를 건너뛸 공지인지 확인 (처리 실패 또는 재검증 결과 변경 없음)
+    """
+    return notice.get("failed") or notice.get("unchanged")
+
+
+async def _run_stage(handler, in_queue, out_queue, workers):
+    """
+    입력 큐의 공지를 여러 워커로 처리하여 출력 큐로 전달
+
+    처리 중 오류가 난 공지는 버리지 않고 "failed" 표시 후 전달하여
+    저장 단계의 순서 맞춤이 멈추지 않도록 함
+
+    Args:
+        handler (Callable): 공지 dict를 받아 처리하는 코루틴 함수
+        in_queue (asyncio.Queue): 입력 큐
+        out_queue (asyncio.Queue): 출력 큐
+        workers (int): 동시 실행 워커 수
+    """
+    async def worker():
+        while True:
+            notice = await in_queue.get()
+            if notice is _STOP:
+                # 다른 워커도 종료할 수 있도록 종료 신호를 되돌려 놓음
+                await in_queue.put(_STOP)
+                return
+
+            if not _skipped(notice):
+                try:
+                    await handler(notice)
+                except Exception as e:
+                    print(f"공지 처리 실패 (ID: {notice['notice_id']}): {e}")
+                    notice["failed"] = True
+
+            await out_queue.put(notice)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, workers))))
+    await out_queue.put(_STOP)
+
+
+async def _run_batch_stage(handler, in_queue, out_queue, workers, batch_size, linger):
+    """
+    입력 큐의 공지를 묶음 단위로 처리하여 출력 큐로 전달
+
+    첫 공지를 받은 뒤 batch_size개가 모이거나 linger초가 지나면 모인 만큼 처리
+
+    Args:
+        handler (Callable): 공지 dict 목록을 받아 처리하는 코루틴 함수
+        in_queue (asyncio.Queue): 입력 큐
+        out_queue (asyncio.Queue): 출력 큐
+        workers (int): 동시 실행 워커 수
+        batch_size (int): 묶음 최대 크기
+        linger (float): 묶음을 채우기 위한 최대 대기 시간 (초)
+    """
+    async def worker():
+        stopped = False
+        while not stopped:
+            notice = await in_queue.get()
+            if notice is _STOP:
+                await in_queue.put(_STOP)
+                return
+
+            batch = [notice]
+            deadline = asyncio.get_running_loop().time() + linger
+            while len(batch) < batch_size:
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    notice = await asyncio.wait_for(in_queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if notice is _STOP:
+                    await in_queue.put(_STOP)
+                    stopped = True
+                    break
+                batch.append(notice)
+
+            active = [notice for notice in batch if not _skipped(notice)]
+            if active:
+                try:
+                    await handler(active)
+                except Exception as e:
+                    print(f"공지 묶음 처리 실패 ({len(active)}건): {e}")
+                    for notice in active:
+                        notice["failed"] = True
+
+            for notice in batch:
+                await out_queue.put(notice)
+
+    await asyncio.gather(*(worker() for _ in range(max(1, workers))))
+    await out_queue.put(_STOP)
+
+
+async def _fetch_html(notice):
+    """
+    상세 페이지에서 본문, 이미지, 첨부파일 수집
+    """
+    notice["content"], notice["image_urls"], notice["attachments"] = await html_crawl(
+        notice["link"], notice["board"]
+    )
+    notice["content_fingerprint"] = content_fingerprint(
+        notice["content"], notice["image_urls"], notice["attachments"]
+    )
+    set_near_duplicate_key(notice)
+
+
+async def _revalidate_html(notice):
+    """
+    저장된 공지의 상세 페이지를 다시 받아 변경 여부 확인
+
+    본문·첨부파일 지문이 저장된 지문과 같으면 "unchanged" 표시하여 OCR·신청기간 추출·저장을 건너뜀.
+    HTTP 캐시는 공지 저장 여부와 관계없이 200 응답을 받을 때 갱신되므로
+    (이전 실행에서 OCR·신청기간 추출에 실패한 수정본도 캐시에는 남음)
+    조건부 요청이 304여도 캐시 본문을 추출하여 지문을 비교함.
+    글이 삭제되었거나(404) 오류 응답이 계속되면 HttpStatusError로,
+    본문·이미지·첨부파일을 하나도 추출하지 못하면 ValueError로 실패 처리하여 저장된 공지를 유지
+    """
+    board = board_of(notice["notice_id"])
+    page = await _fetch_page(notice["link"], board)
+    content, image_urls, attachments = await _parse_page(page, board)
+    if not (content or image_urls or attachments) and (
+            notice["content"] or notice["image_urls"] or notice["attachments"]):
+        raise ValueError("상세 페이지에서 본문을 찾지 못했습니다")
+    fingerprint = content_fingerprint(content, image_urls, attachments)
+    if fingerprint == notice["content_fingerprint"]:
+        notice["unchanged"] = True
+        return
+
+    notice["content"], notice["image_urls"], notice["attachments"] = content, image_urls, attachments
+    notice["content_fingerprint"] = fingerprint
+    # 수정된 공지는 다시 처리하므로 이전 원본 연결은 끊음
+    notice["duplicate_of"] = None
+    set_near_duplicate_key(notice)
+
+
+async def _run_ocr(notice, stats):
+    """
+    본문이 없거나 짧은 공지의 이미지 OCR 처리
+    """
+    content, image_urls = notice["content"], notice["image_urls"]
+
+    if not content and image_urls:
+        # 텍스트가 없고 이미지만 있는 경우
+        stats["ocr"] += 1
+        notice["content"] = await image_urls_to_text(image_urls)
+
+    elif content and len(content) < MIN_TEXT_LENGTH and image_urls:
+        # 텍스트가 짧고 이미지가 있는 경우
+        stats["ocr"] += 1
+        ocr_content = await image_urls_to_text(image_urls)
+
+        # OCR 결과가 더 길면 대체
+        if ocr_content and len(ocr_content) > len(content):
+            notice["content"] = ocr_content
+
+
+async def _extract_period(notice):
+    """
+    본문에서 신청기간 추출 (원본 공지의 신청기간을 재사용한 중복 공지는 건너뜀)
+    """
+    if notice.get("reused"):
+        return
+
+    start_date, end_date = None, None
+    if notice["content"]:
+        start_date, end_date = await get_application_period(notice["content"], notice["pub_date"])
+
+    _set_period(notice, start_date, end_date)
+
+
+async def _extract_periods(notices):
+    """
+    여러 공지의 신청기간을 한 번의 요청으로 추출 (규칙으로 처리되는 공지는 제외)
+    """
+    pending = []
+    for notice in notices:
+        if notice.get("reused"):
+            continue
+        period = None
+        if notice["content"]:
+            period = rule_based_period(notice["content"], notice["pub_date"])
+            if period is None:
+                pending.append(notice)
+                continue
+        _set_period(notice, *(period or (None, None)))
+
+    if not pending:
+        return
+
+    period_stats["llm"] += len(pending)
+    periods = await extract_periods_batch([(str(notice["seq"]), notice["content"]) for notice in pending])
+    for notice in pending:
+        _set_period(notice, *periods.get(str(notice["seq"]), (None, None)))
+
+
+def _set_period(notice, start_date, end_date):
+    """
+    추출한 신청기간 기록
+
+    종료일만 있고 시작일이 없으면 게시일을 시작일로 사용
+    """
+    if end_date and not start_date:
+        pub_date = notice["pub_date"]
+        start_date = pub_date.split(' ')[0] if ' ' in pub_date else pub_date
+
+    notice["start_date"], notice["end_date"] = start_date, end_date
+
+
+def _deduplicated(handler, duplicates, stats):
+    """
+    OCR 단계 처리 함수에 유사 중복 판별 추가
+
+    원본 공지가 있으면 OCR을 실행하지 않고 원본의 OCR 결과와 신청기간을 재사용하며
+    신청기간 추출 단계도 건너뜀 ("reused" 표시)
+
+    Args:
+        handler (Callable): OCR 단계 처리 코루틴 함수
+        duplicates (DuplicateDetector): 유사 중복 판별기
+        stats (dict): 처리 통계 (duplicates)
+    """
+    async def run(notice):
+        original = await duplicates.find_original(notice)
+        if original is None:
+            await handler(notice)
+            return
+        reuse_original(notice, original)
+        notice["reused"] = True
+        stats["duplicates"] += 1
+
+    return run
+
+
+def _checkpointed(handler, stage, checkpoint, batch=False):
+    """
+    단계 처리 함수에 체크포인트 기록 추가
+
+    이전 실행에서 이미 마친 단계는 건너뛰고, 처리를 마친 공지는 단계와 결과를 기록
+
+    Args:
+        handler (Callable): 공지 dict(batch면 목록)를 받아 처리하는 코루틴 함수
+        stage (str): 단계 이름
+        checkpoint (CrawlCheckpoint): 체크포인트
+        batch (bool): 묶음 단위 처리 함수 여부
+    """
+    async def run(item):
+        notices = item if batch else [item]
+        pending = [notice for notice in notices if not checkpoint.done(notice, stage)]
+        if not pending:
+            return
+        await handler(pending if batch else pending[0])
+        for notice in pending:
+            checkpoint.record(notice, stage)
+
+    return run
+
+
+async def _save_notices(db, in_queue, stats, checkpoint=None, duplicates=None):
+    """
+    처리 완료된 공지를 RSS 순서대로 DB에 저장
+
+    앞 단계는 병렬로 끝나는 순서가 뒤섞이므로 순번(seq) 기준으로
+    버퍼링한 뒤 순서대로 기록하여 매 실행의 출력 순서를 동일하게 유지.
+    체크포인트가 있으면 공지가 모두 저장된 RSS 페이지를 완료로 기록.
+    유사 중복 판별기가 있으면 도착 즉시(순서 맞춤 전) 처리 결과를 기다리는 중복 공지에 전달
+    """
+    pending = {}
+    next_seq = 0
+
+    while True:
+        notice = await in_queue.get()
+        if notice is _STOP:
+            break
+        if duplicates:
+            duplicates.finish(notice)
+
+        pending[notice["seq"]] = notice
+        while next_seq in pending:
+            ready = pending.pop(next_seq)
+            next_seq += 1
+
+            if _skipped(ready):
+                if ready.get("failed"):
+                    stats["failed"] += 1
+                if checkpoint:
+                    checkpoint.processed(ready)
+                continue
+
+            db.save_notice(
+                notice_id=ready["notice_id"],
+                title=ready["title"],
+                link=ready["link"],
+                pub_date=ready["pub_date"],
+                category=ready["category"],
+                start_date=ready["start_date"],
+                end_date=ready["end_date"],
+                content=ready["content"],
+                image_urls=ready["image_urls"],
+                attachments=ready["attachments"],
+                fingerprint=ready["fingerprint"],
+                content_fingerprint=ready["content_fingerprint"],
+                simhash=ready.get("simhash"),
+                number_fingerprint=ready.get("number_fingerprint"),
+                duplicate_of=ready.get("duplicate_of")
+            )
+            stats["saved"] += 1
+            if checkpoint:
+                checkpoint.processed(ready)
 
 # ============================================================================
 
 # RSS 피드 크롤링
 
-async def rss_crawl(db, max_pages, initial=False, rss_url=RSS_URL, base_domain=BASE_DOMAIN):
+async def _fetch_rss_page(url, board):
+    """
+    RSS 페이지 본문 수집 (파싱은 순회하면서 item 단위로 진행)
+    """
+    try:
+        page = await _fetch_page(url, board)
+    except CacheMissError:
+        # 오프라인 재실행: 캐시된 마지막 페이지 이후는 없는 페이지로 처리
+        return b""
+    return page.body
+
+
+async def _produce_notices(out_queue, board, initial, high_water_mark, seen, stats, max_pages=None,
+                           checkpoint=None):
+    """
+    게시판의 RSS 페이지를 순회하며 처리할 공지를 파이프라인에 투입
+
+    다음 RSS 페이지들을 미리 요청해 두어 현재 페이지를 처리하는 동안
+    네트워크 대기가 겹치도록 함.
+    일일 크롤링에서는 저장된 지문과 같은(변경 없는) 공지는 건너뛰고,
+    최고 수위 이하의 변경 없는 공지가 게시판의 incremental_stop_after개 연속되면 중단.
+    체크포인트가 있으면 이전 실행에서 실패한 공지를 먼저 다시 투입한 뒤 마지막 완료 페이지부터 순회하며
+    저장을 마친 공지는 건너뛰고, 진행 중이던 공지는 기록된 단계 결과를 복원하여 투입
+
+    Returns:
+        tuple[str | None, bool]: (게시판 내 가장 큰 공지 ID, 중단 조건 도달 여부)
+    """
+    max_pages = board.max_pages(initial) if max_pages is None else max_pages
+    first_page = checkpoint.start_page if checkpoint else 1
+    newest_id = checkpoint.newest_id if checkpoint else None
+    seq = 0
+    unchanged_run = 0
+    prefetch = {}
+
+    def schedule(page_number):
+        if page_number <= max_pages and page_number not in prefetch:
+            prefetch[page_number] = asyncio.create_task(
+                _fetch_rss_page(board.rss_url.format(page_number), board)
+            )
+
+    try:
+        for page_number in range(first_page, first_page + RSS_FETCH_CONCURRENCY):
+            schedule(page_number)
+
+        # 이어서 실행: 이전 실행에서 실패한 공지 다시 처리 (완료 페이지 이전 공지 포함)
+        retried = set()
+        for notice in checkpoint.retry_notices() if checkpoint else ():
+            notice.update(seq=seq, board=board)
+            retried.add(notice["notice_id"])
+            await out_queue.put(checkpoint.restore(notice))
+            seq += 1
+
+        for page_number in range(first_page, max_pages + 1):
+            schedule(page_number)
+            body = await prefetch.pop(page_number)
+            schedule(page_number + RSS_FETCH_CONCURRENCY)
+
+            # item을 하나씩 파싱하며 처리 (중단 조건에 도달하면 나머지는 파싱하지 않음)
+            item_count = 0
+            for item in iter_items(body):
+                item_count += 1
+                title, link, pub_date, category, description = item
+
+                # 카테고리 정규화 및 필터링
+                category = board.normalize_category(category)
+                if not board.allows(category):
+                    continue
+
+                # 공지사항 ID 추출 (최고 수위는 게시판 내 ID, 저장소에는 게시판을 구분한 ID)
+                board_notice_id = board.extract_id(link)
+                notice_id = board.store_id(board_notice_id)
+
+                # 가장 큰 숫자 ID 기록 (상단 고정 공지가 있어도 최고 수위가 줄지 않도록)
+                if board_notice_id.isdigit() and not is_older_than(board_notice_id, newest_id):
+                    newest_id = board_notice_id
+
+                # 초기 크롤링: 중단 기준보다 오래된 데이터 도달 시 중단
+                if initial and is_stop(pub_date, board.stop_days):
+                    return newest_id, True
+
+                # 이어서 실행: 이전 실행에서 저장을 마친 공지는 건너뜀
+                if checkpoint and notice_id in checkpoint.saved:
+                    stats["resumed"] += 1
+                    continue
+                if notice_id in retried:
+                    continue
+
+                fingerprint = notice_fingerprint(title, pub_date, category, description)
+                older = is_older_than(board_notice_id, high_water_mark)
+
+                # 일일 크롤링: 변경 없는 기존 공지는 건너뜀
+                # (저장소 기록이 없으면 최고 수위 이하의 공지를 기존 공지로 간주)
+                if not initial and (seen.get(notice_id) == fingerprint or (older and not seen)):
+                    stats["unchanged"] += 1
+                    if older:
+                        unchanged_run += 1
+                        if unchanged_run >= board.incremental_stop_after:
+                            return newest_id, True
+                    continue
+                unchanged_run = 0
+
+                if notice_id in seen:
+                    stats["updated"] += 1
+
+                # 상대 경로를 절대 경로로 변환
+                if link.startswith("/"):
+                    link = f"{board.base_domain}{link}"
+
+                notice = {
+                    "seq": seq,
+                    "board": board,
+                    "notice_id": notice_id,
+                    "title": title,
+                    "link": link,
+                    "pub_date": pub_date,
+                    "category": category,
+                    "fingerprint": fingerprint,
+                }
+                await out_queue.put(checkpoint.restore(notice) if checkpoint else notice)
+                seq += 1
+
+            if not item_count:
+                break
+
+            if checkpoint:
+                checkpoint.end_page(page_number, seq - 1, newest_id)
+
+        return newest_id, False
+
+    finally:
+        # 더 이상 필요 없는 선행 요청 정리
+        for task in prefetch.values():
+            task.cancel()
+        await out_queue.put(_STOP)
+
+
+async def _run_pipeline(db, produce, fetch, stats, checkpoint=None, duplicates=None):
+    """
+    공지 투입 → 상세 HTML → OCR → 신청기간 추출 → DB 저장 단계를 크기 제한 큐로 연결하여 실행
+
+    Args:
+        db: 데이터베이스 객체
+        produce (Callable): 출력 큐를 받아 공지를 투입하는 코루틴 함수
+        fetch (Callable): 상세 페이지 단계 처리 코루틴 함수
+        stats (dict): 처리 통계
+        checkpoint (CrawlCheckpoint, optional): 단계별 진행 기록 (초기 크롤링)
+        duplicates (DuplicateDetector, optional): OCR 전 유사 중복 판별기
+
+    Returns:
+        produce의 반환값
+    """
+    # 단계 사이 큐
+    html_queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    ocr_queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    period_queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    save_queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+
+    ocr = lambda notice: _run_ocr(notice, stats)
+    extract_periods, extract_period = _extract_periods, _extract_period
+    if duplicates:
+        ocr = _deduplicated(ocr, duplicates, stats)
+    if checkpoint:
+        fetch = _checkpointed(fetch, "html", checkpoint)
+        ocr = _checkpointed(ocr, "ocr", checkpoint)
+        extract_periods = _checkpointed(extract_periods, "period", checkpoint, batch=True)
+        extract_period = _checkpointed(extract_period, "period", checkpoint)
+
+    # 신청기간 추출: 일괄 추출 사용 시 묶음 단위, 아니면 공지 단위로 처리
+    if PERIOD_BATCH_SIZE > 1:
+        period_stage = _run_batch_stage(
+            extract_periods, period_queue, save_queue, PERIOD_CONCURRENCY,
+            PERIOD_BATCH_SIZE, PERIOD_BATCH_LINGER
+        )
+    else:
+        period_stage = _run_stage(extract_period, period_queue, save_queue, PERIOD_CONCURRENCY)
+
+    result, *_ = await asyncio.gather(
+        produce(html_queue),
+        # CPU 작업 풀의 모든 프로세스가 파싱할 수 있도록 워커 수를 풀 크기 이상으로 유지
+        _run_stage(fetch, html_queue, ocr_queue, max(HTML_FETCH_CONCURRENCY, CPU_WORKERS)),
+        _run_stage(ocr, ocr_queue, period_queue, OCR_CONCURRENCY),
+        period_stage,
+        _save_notices(db, save_queue, stats, checkpoint, duplicates),
+    )
+    return result
+
+
+async def rss_crawl(db, initial=False, board=None, max_pages=None):
     """
-    RSS 피드를 순회하며 공지사항 수집 및 처리
+    게시판 하나의 RSS 피드를 순회하며 공지사항 수집 및 처리
+
+    RSS 페이지 → 상세 HTML → OCR → 신청기간 추출 → DB 저장 단계를
+    크기 제한 큐로 연결하고, 단계별 동시 실행 수는 crawler_config에서 설정.
+    일일 크롤링은 새 공지와 RSS 항목이 바뀐 공지만 다시 처리하여 저장소에 덮어씀.
+    최고 수위 기록이 없는 게시판(새로 추가된 게시판)은 초기 크롤링으로 처리하고,
+    초기 크롤링은 체크포인트에 진행 상황을 기록하여 중단되면 다음 실행에서 이어서 처리
     
     Args:
         db: 데이터베이스 객체
-        max_pages (int): 최대 크롤링 페이지 수
         initial (bool): 초기 크롤링 여부 (True=초기, False=일일)
-        rss_url (str): RSS URL 템플릿
-        base_domain (str): 기본 도메인
+        board (Board, optional): 게시판 (기본값: 기본 게시판)
+        max_pages (int, optional): 최대 크롤링 페이지 수 (기본값: 게시판 설정)
+
+    Returns:
+        dict: 처리 통계
     """
-    saved_cnt = 0
-    ocr_count = 0
-    
-    # 마지막 크롤링 ID 로드
-    latest_crawled_id = load_latest_crawled_id()
-    
-    # 가장 최신 ID 저장용
-    newest_id = None
+    board = board or get_board()
+    stats = {"saved": 0, "ocr": 0, "failed": 0, "unchanged": 0, "updated": 0, "resumed": 0, "duplicates": 0}
 
-    for page_number in range(1, max_pages + 1):
-        url = rss_url.format(page_number)
-        page = requests.get(url)
-            
-        soup = bs(page.text, 'xml')
-        items = soup.find_all('item')
+    # 최고 수위(이전에 본 가장 큰 공지 ID)와 저장된 공지별 지문 로드
+    high_water_mark = load_latest_crawled_id(board.crawled_id_filename)
+    initial = initial or high_water_mark is None
+    seen = db.fingerprints() if isinstance(db, NoticeStore) else {}
 
-        if not items:
-            break
+    # 초기 크롤링 체크포인트 (중단된 기록이 있으면 이어서 실행)
+    checkpoint = CrawlCheckpoint(board.name, db) if initial and CHECKPOINT_ENABLED else None
+    if checkpoint and checkpoint.resumed:
+        print(
+            f"[{board.name}] 중단된 초기 크롤링 이어서 실행: {checkpoint.start_page}페이지부터, "
+            f"저장 완료 {len(checkpoint.saved)}개, 진행 중 {len(checkpoint.in_progress)}개, "
+            f"실패 재시도 {len(checkpoint.failed)}개",
+            flush=True
+        )
 
-        for item in items:
-            # RSS 아이템에서 기본 정보 추출
-            title = item.find('title').get_text(strip=True) if item.find('title') else ""
-            link = item.find('link').get_text(strip=True) if item.find('link') else ""
-            pub_date = item.find('pubDate').get_text(strip=True) if item.find('pubDate') else ""
-            category = item.find('category').get_text(strip=True) if item.find('category') else ""
+    try:
+        newest_id, stopped = await _run_pipeline(
+            db,
+            lambda out_queue: _produce_notices(
+                out_queue, board, initial, high_water_mark, seen, stats, max_pages, checkpoint
+            ),
+            _fetch_html,
+            stats,
+            checkpoint,
+            DuplicateDetector(db) if DEDUP_ENABLED else None
+        )
+    except BaseException:
+        # 중단: 체크포인트는 남겨 두고 다음 실행에서 이어서 처리
+        if checkpoint:
+            checkpoint.close()
+        raise
 
-            # 카테고리 정규화 및 필터링
-            category = normalize_category(category)
-            if category not in ALLOWED_CATEGORIES:
-                continue
+    # 최고 수위 갱신 (더 큰 ID를 본 경우에만)
+    if newest_id and not is_older_than(newest_id, high_water_mark):
+        save_latest_crawled_id(newest_id, board.crawled_id_filename)
+        print(f"[{board.name}] 가장 최신 ID 저장: {newest_id}" + (" (중단 조건 도달)" if stopped else ""))
 
-            # 공지사항 ID 추출
-            match = re.search(NOTICE_ID_PATTERN, link)
-            notice_id = match.group(1) if match else "unknown"
+    # 초기 크롤링 완료: 최고 수위를 기록한 뒤 체크포인트 삭제
+    if checkpoint:
+        checkpoint.finish()
 
-            # 가장 최신 ID 저장 (첫 아이템)
-            if newest_id is None:
-                newest_id = notice_id
+    # 검색 색인 갱신 (이번에 저장한 공지와 다른 게시판에서 먼저 저장한 공지 중 색인하지 않은 것)
+    if SEARCH_INDEX_ENABLED and isinstance(db, NoticeStore):
+        indexed = update_search_index(db)
+        if indexed:
+            print(f"[{board.name}] 검색 색인 갱신: {indexed}개", flush=True)
 
-            # 초기 크롤링: 1년 전 데이터 도달 시 중단
-            if initial and is_stop(pub_date):
-                if newest_id:
-                    save_latest_crawled_id(newest_id)
-                    print(f"가장 최신 ID 저장: {newest_id}")
-                return
+    # 임베딩 색인 갱신 (바뀐 조각만 임베딩, 여러 게시판이 동시에 끝나면 차례로 처리)
+    if EMBEDDING_ENABLED and isinstance(db, NoticeStore):
+        embedded = await update_embedding_index(db)
+        if embedded and embedded["notices"]:
+            print(
+                f"[{board.name}] 임베딩 색인 갱신: 공지 {embedded['notices']}개, "
+                f"조각 {embedded['chunks']}개 중 {embedded['embedded']}개 임베딩",
+                flush=True
+            )
 
-            # 중복 체크: 마지막 크롤링 ID와 동일하면 중단
-            if latest_crawled_id and notice_id == latest_crawled_id:
-                if newest_id:
-                    save_latest_crawled_id(newest_id)
-                    print(f"가장 최신 ID 저장: {newest_id}")
-                return
+    print(f"[{board.name}] 총 {stats['saved']}개의 공지사항이 성공적으로 저장되었습니다!", flush=True)
+    if stats["resumed"]:
+        print(f"[{board.name}] 이전 실행에서 저장한 공지 {stats['resumed']}개 건너뜀", flush=True)
+    if not initial:
+        print(
+            f"[{board.name}] 변경 없는 공지 {stats['unchanged']}개 건너뜀, "
+            f"수정된 공지 {stats['updated']}개 다시 처리",
+            flush=True
+        )
+    print(f"[{board.name}] OCR을 실행한 공지는 총 {stats['ocr']}개입니다.", flush=True)
+    if stats["duplicates"]:
+        print(f"[{board.name}] 유사 중복 공지 {stats['duplicates']}개는 원본의 OCR·신청기간 결과 재사용", flush=True)
+    return stats
 
-            # 상대 경로를 절대 경로로 변환
-            if link.startswith("/"):
-                link = f"{base_domain}{link}"
-
-            # HTML 크롤링 (본문, 이미지, 첨부파일)
-            content, image_urls, attachments = html_crawl(link)
-            
-            # API 호출 간격 대기
-            await asyncio.sleep(AI_CALL_DELAY)
-            
-            # OCR 처리
-            if not content and image_urls:
-                # 텍스트가 없고 이미지만 있는 경우
-                ocr_count += 1
-                content = await image_urls_to_text(image_urls)
-                
-            elif content and len(content) < MIN_TEXT_LENGTH and image_urls:
-                # 텍스트가 짧고 이미지가 있는 경우
-                ocr_count += 1
-                ocr_content = await image_urls_to_text(image_urls)
-                
-                # OCR 결과가 더 길면 대체
-                if ocr_content and len(ocr_content) > len(content):
-                    content = ocr_content
-            
-            # 신청기간 추출
-            start_date, end_date = None, None
-            if content:
-                await asyncio.sleep(AI_CALL_DELAY)
-                start_date, end_date = get_application_period(content)
-                
-                # 종료일만 있고 시작일이 없으면 게시일을 시작일로 사용
-                if end_date and not start_date:
-                    clean_pub_date = pub_date.split(' ')[0] if ' ' in pub_date else pub_date
-                    start_date = clean_pub_date
-                
-            # DB에 저장
-            db.save_notice(
-                notice_id=notice_id,
-                title=title,
-                link=link,
-                pub_date=pub_date,
-                category=category,
-                start_date=start_date,
-                end_date=end_date,
-                content=content,
-                image_urls=image_urls,
-                attachments=attachments
-            )
-            saved_cnt += 1
-            
-            await asyncio.sleep(AI_CALL_DELAY)
-            
-    print(f"총 {saved_cnt}개의 공지사항이 성공적으로 저장되었습니다!", flush=True)
-    print(f"OCR을 실행한 공지는 총 {ocr_count}개입니다.", flush=True)
+
+async def crawl_boards(db, initial=False, boards=None, max_pages=None):
+    """
+    여러 게시판을 동시에 크롤링
+
+    게시판마다 같은 수의 단계별 워커로 파이프라인을 실행하므로, 공유 요청 한도
+    (학교 서버·LLM)는 도착 순서대로 토큰을 나눠 받아 한 게시판이 독점하지 않음.
+    게시판별 rpm을 설정하면 그 게시판의 요청은 추가로 제한됨
+
+    Args:
+        db: 데이터베이스 객체 (모든 게시판이 공유)
+        initial (bool): 초기 크롤링 여부
+        boards (list[Board], optional): 게시판 목록 (기본값: CRAWL_BOARDS)
+        max_pages (int, optional): 최대 크롤링 페이지 수 (기본값: 게시판 설정)
+
+    Returns:
+        dict[str, dict]: 게시판 이름 → 처리 통계
+    """
+    boards = boards or get_crawl_boards()
+    results = await asyncio.gather(
+        *(rss_crawl(db, initial, board, max_pages) for board in boards),
+        return_exceptions=True
+    )
+
+    board_stats = {}
+    for board, result in zip(boards, results):
+        # 취소된 게시판(CancelledError)도 결과로 돌아오므로 BaseException으로 확인
+        if isinstance(result, BaseException):
+            print(f"[{board.name}] 크롤링 실패: {result}", flush=True)
+        else:
+            board_stats[board.name] = result
+
+    if len(boards) > 1:
+        print(f"게시판 {len(boards)}개 크롤링: 총 {sum(s['saved'] for s in board_stats.values())}개 저장", flush=True)
+
+    print(
+        f"신청기간 추출: 규칙 {period_stats['rule']}건, AI {period_stats['llm']}건",
+        flush=True
+    )
+
+    cache_stats = get_period_cache().stats()
+    print(
+        f"신청기간 캐시: 적중 {cache_stats['hits']}회, 미적중 {cache_stats['misses']}회, "
+        f"저장 {cache_stats['entries']}건",
+        flush=True
+    )
+
+    if any(s["ocr"] for s in board_stats.values()):
+        ocr_stats = get_ocr_cache().stats()
+        print(
+            f"OCR 캐시: 이미지 적중 {ocr_stats['hits']}회, 미적중 {ocr_stats['misses']}회",
+            flush=True
+        )
+    return board_stats
+
+# ============================================================================
+
+# 신청기간이 남은 공지 재검증
+
+async def revalidate_open_notices(db, today=None, exclude_ids=()):
+    """
+    신청 마감 전인 저장 공지의 상세 페이지를 다시 확인하여 수정된 공지만 재처리
+
+    마감 연장·첨부파일 추가처럼 게시 후 수정된 공지를 반영하기 위해
+    조건부 요청과 본문·첨부파일 지문으로 변경 여부를 먼저 판단하고,
+    바뀐 공지만 OCR·신청기간 추출을 다시 실행하여 저장소에 덮어씀
+
+    Args:
+        db (NoticeStore): SQLite 저장소
+        today (str, optional): 기준 날짜 (YYYY-MM-DD, 기본값: 오늘)
+        exclude_ids (Iterable[str]): 재검증에서 제외할 공지 ID (이번 실행에서 이미 처리한 공지)
+
+    Returns:
+        int: 수정되어 다시 저장한 공지 수
+    """
+    today = today or datetime.now().strftime("%Y-%m-%d")
+    exclude_ids = set(exclude_ids)
+    notices = [notice for notice in db.find(end_from=today) if notice["notice_id"] not in exclude_ids]
+    stats = {"saved": 0, "ocr": 0, "failed": 0}
+
+    async def produce(out_queue):
+        try:
+            for seq, notice in enumerate(notices):
+                await out_queue.put({**notice, "seq": seq})
+        finally:
+            await out_queue.put(_STOP)
+
+    await _run_pipeline(db, produce, _revalidate_html, stats)
+
+    if SEARCH_INDEX_ENABLED and stats["saved"]:
+        update_search_index(db)
+    if EMBEDDING_ENABLED and stats["saved"]:
+        await update_embedding_index(db)
+
+    print(
+        f"신청기간이 남은 공지 {len(notices)}개 재검증: 수정된 공지 {stats['saved']}개 다시 저장"
+        f" (OCR {stats['ocr']}개, 확인 실패로 기존 내용 유지 {stats['failed']}개)",
+        flush=True
+    )
+    return stats["saved"]
@@ -0,0 +1,188 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 데몬 모듈
+
+한 프로세스에서 주기적으로 일일 크롤링을 반복 실행
+- 모듈 import, HTTP 연결 풀, OpenAI 클라이언트, CPU 작업 풀, 각종 캐시를 주기 사이에 유지
+- 간격에 무작위 편차를 두고, 개강 전후 등 바쁜 기간이나 직전 주기에 새 공지가 있었으면 더 자주 확인
+- 주기는 한 번에 하나만 실행하며, 실행 중 들어온 즉시 실행 요청(SIGUSR1)은 한 번으로 합쳐 바로 이어서 실행
+- 주기마다 실행 잠금을 잡아 일회 실행 크롤러와 동시에 저장소를 수정하지 않음
+
+실행:
+    python start.py daemon
+    kill -USR1 <pid>   # 대기 중인 다음 주기를 바로 실행
+    kill -TERM <pid>   # 실행 중인 주기를 마친 뒤 종료
+"""
+
+import time
+import random
+import signal
+import asyncio
+from datetime import datetime
+
+from crawler_config import (
+    DB_BACKEND, REVALIDATE_OPEN_NOTICES,
+    DAEMON_INTERVAL, DAEMON_JITTER,
+    DAEMON_BUSY_INTERVAL, DAEMON_BUSY_PERIODS,
+    DAEMON_REVALIDATE_INTERVAL,
+    SYNC_ENABLED
+)
+from db import NoticeStore
+from start import run_crawl, close_clients, export_notices, import_legacy_text_db
+from exporter import sync_notices
+from utils import crawl_lock, is_initial_crawl
+
+
+def is_busy_period(now=None):
+    """
+    바쁜 기간(DAEMON_BUSY_PERIODS)인지 확인
+
+    Args:
+        now (datetime, optional): 기준 시각 (기본값: 현재)
+
+    Returns:
+        bool: 바쁜 기간 여부
+    """
+    today = (now or datetime.now()).strftime("%m-%d")
+    for start, end in DAEMON_BUSY_PERIODS:
+        # 연말을 넘어가는 기간(예: 12-20 ~ 01-10)도 처리
+        if (start <= today <= end) if start <= end else (today >= start or today <= end):
+            return True
+    return False
+
+
+def next_interval(saved, now=None):
+    """
+    다음 주기까지 대기 시간 (초)
+
+    바쁜 기간이거나 직전 주기에 저장한 공지가 있으면 DAEMON_BUSY_INTERVAL,
+    아니면 DAEMON_INTERVAL에 무작위 편차(± DAEMON_JITTER)를 적용
+
+    Args:
+        saved (int): 직전 주기에 저장한 공지 수
+        now (datetime, optional): 기준 시각
+
+    Returns:
+        float: 대기 시간 (초)
+    """
+    interval = DAEMON_BUSY_INTERVAL if saved or is_busy_period(now) else DAEMON_INTERVAL
+    return interval * (1 + random.uniform(-DAEMON_JITTER, DAEMON_JITTER))
+
+
+async def run_cycle(db, initial, revalidate):
+    """
+    크롤링 주기 한 번 실행 (실행 잠금을 잡지 못하면 건너뜀)
+
+    Args:
+        db (NoticeStore): SQLite 저장소 (주기 사이에 연결 유지)
+        initial (bool): 초기 크롤링 여부
+        revalidate (bool): 신청기간이 남은 공지 재검증 여부
+
+    Returns:
+        int | None: 저장한 공지 수 (건너뛰면 None)
+    """
+    with crawl_lock() as acquired:
+        if not acquired:
+            print("다른 크롤러가 실행 중이어서 이번 주기를 건너뜁니다.", flush=True)
+            return None
+
+        # 내보내기 파일에는 이번 주기에 저장한 공지만 기록
+        db.saved_ids.clear()
+        await run_crawl(db, initial, revalidate=revalidate)
+
+        # 새로 저장한 공지가 없으면 이전 주기의 내보내기 파일을 그대로 둠
+        if db.saved_ids:
+            export_notices(db, full=initial)
+
+        # 이전 주기에 실패한 동기화도 이어서 전송되도록 매 주기 실행
+        # (requests·time.sleep으로 블로킹하므로 스레드에서 실행하여 종료 신호 처리를 막지 않음)
+        if SYNC_ENABLED:
+            db.flush()
+            await asyncio.to_thread(_sync_in_thread, db.path)
+        return len(db.saved_ids)
+
+
+def _sync_in_thread(path):
+    # SQLite 연결은 만든 스레드에서만 쓸 수 있으므로 동기화 스레드에서 따로 연결
+    with NoticeStore(path) as store:
+        return sync_notices(store)
+
+
+async def run_daemon():
+    """
+    종료 신호를 받을 때까지 크롤링 주기 반복 실행
+
+    첫 주기는 저장소가 없으면 초기 크롤링, 이후는 일일 크롤링.
+    신청기간이 남은 공지 재검증은 DAEMON_REVALIDATE_INTERVAL마다 한 번만 실행
+    """
+    if DB_BACKEND != "sqlite":
+        print("데몬 모드는 sqlite 저장소에서만 실행할 수 있습니다.")
+        return
+
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    wake = asyncio.Event()
+
+    # 종료 신호: 실행 중인 주기를 마친 뒤 종료, SIGUSR1: 대기 중인 다음 주기를 바로 실행
+    for sig, event in ((signal.SIGINT, stop), (signal.SIGTERM, stop), (getattr(signal, "SIGUSR1", None), wake)):
+        if sig is None:
+            continue
+        try:
+            loop.add_signal_handler(sig, event.set)
+        except (NotImplementedError, RuntimeError):
+            # 신호 처리기를 등록할 수 없는 환경 (Windows 등)
+            pass
+
+    # sqlite 저장소 도입 전 배포는 첫 주기를 초기 크롤링으로 실행하지 않도록 기존 공지를 먼저 가져옴
+    with crawl_lock() as acquired:
+        if acquired:
+            import_legacy_text_db()
+
+    initial = is_initial_crawl()
+    last_revalidated = None
+    db = NoticeStore()
+    print(f"HANA 크롤링 데몬 시작 (기본 간격 {DAEMON_INTERVAL}초, 바쁜 기간 {DAEMON_BUSY_INTERVAL}초)\n", flush=True)
+
+    try:
+        while not stop.is_set():
+            # 이 주기 시작 전에 들어온 즉시 실행 요청은 이 주기로 합침
+            wake.clear()
+
+            now = time.monotonic()
+            revalidate = REVALIDATE_OPEN_NOTICES and (
+                last_revalidated is None or now - last_revalidated >= DAEMON_REVALIDATE_INTERVAL
+            )
+
+            print(f"[{datetime.now():%Y-%m-%d %H:%M:%S}] " + ("초기 크롤링" if initial else "일일 크롤링"), flush=True)
+            start_ts = time.perf_counter()
+            saved = None
+            try:
+                saved = await run_cycle(db, initial, revalidate)
+            except Exception as e:
+                print(f"크롤링 주기 실패: {e}", flush=True)
+
+            if saved is not None:
+                # 초기 크롤링이 중단되어 체크포인트가 남아 있으면 다음 주기에 이어서 실행
+                initial = is_initial_crawl()
+                if revalidate:
+                    last_revalidated = now
+                print(f"주기 완료: {saved}개 저장, {time.perf_counter() - start_ts:.2f}초", flush=True)
+
+            # 다음 주기까지 대기 (종료 신호나 즉시 실행 요청이 오면 바로 깨어남)
+            if wake.is_set() or stop.is_set():
+                continue
+            delay = next_interval(saved or 0)
+            print(f"다음 주기까지 {delay:.0f}초 대기\n", flush=True)
+
+            stop_wait = asyncio.ensure_future(stop.wait())
+            wake_wait = asyncio.ensure_future(wake.wait())
+            try:
+                await asyncio.wait({stop_wait, wake_wait}, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                stop_wait.cancel()
+                wake_wait.cancel()
+
+    finally:
+        db.close()
+        await close_clients()
+        print("HANA 크롤링 데몬 종료", flush=True)
@@ -0,0 +1,223 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 규칙 기반 날짜 추출 모듈
+
+자주 쓰이는 한국어 날짜 표현에서 신청 기간을 정규식으로 추출하고
+확신도가 낮은 공지만 AI 추출로 넘기기 위한 빠른 경로 제공
+"""
+
+import re
+from datetime import date, datetime, timedelta
+
+
+# ============================================================================
+
+# 정규식 패턴
+
+# 날짜 표현: "2025년 9월 30일", "2025. 9. 30.", "2025-09-30", "9월 16일", "10/5"
+# 뒤에 붙는 요일·시간: "(화)", "(화요일)", "18:00", "오후 6시", "18시 30분"
+_DATE_RE = re.compile(
+    r'(?<![\d.])(?:(?P<year>\d{4})\s*(?:년|[./-])\s*)?'
+    r'(?P<month>\d{1,2})\s*(?:월|[./-])\s*(?P<day>\d{1,2})(?!\d)\s*(?:일)?\.?'
+    r'(?:\s*\(\s*[월화수목금토일](?:요일)?\s*\))?'
+    r'(?:\s*(?:오전|오후)?\s*\d{1,2}\s*(?::\s*\d{2}|시(?:\s*\d{1,2}\s*분)?))?'
+)
+
+# 두 날짜 사이의 범위 구분자: "~", "-", "부터"
+_RANGE_GAP_RE = re.compile(r'^\s*(?:부터)?\s*(?:~|∼|〜|-|–|—)?\s*$')
+
+# 월이 생략된 범위 끝: "9월 16일 ~ 20일"
+_DAY_ONLY_END_RE = re.compile(
+    r'^\s*(?:부터\s*(?:~|∼|〜)?|~|∼|〜|-|–|—)\s*(?P<day>\d{1,2})\s*일'
+    r'(?:\s*\(\s*[월화수목금토일](?:요일)?\s*\))?'
+)
+
+# 마감 표현: 날짜 뒤 "까지"/"마감", 날짜 앞 "~"
+_DEADLINE_AFTER_RE = re.compile(r'^\s*(?:까지|마감)')
+_DEADLINE_BEFORE_RE = re.compile(r'(?:~|∼|〜)\s*$')
+
+# 신청 기간을 가리키는 문맥 키워드 (날짜 앞 같은 줄)
+# "기간"만으로는 신청 기간으로 보지 않음 ("신청기간", "접수 기간", "모집기간"은 앞 단어로 일치)
+_APPLICATION_KEYWORD_RE = re.compile(r'신청|접수|모집|마감|제출|지원|응모|등록')
+
+# 신청 기간이 아닌 기간 표현 (교육·행사·활동 기간 등, 신청 키워드보다 날짜에 가까우면 키워드 없음으로 판단)
+_OTHER_PERIOD_RE = re.compile(
+    r'(?:교육|행사|활동|운영|프로그램|사업|연수|실습|수업|강의|대회|공사|점검|휴관|파견|근무|계약|대여|이용)\s*기\s*간'
+)
+
+# 날짜 없이 기한을 나타내는 상대 표현 (이 경우 규칙으로 판단하지 않음)
+_RELATIVE_DATE_RE = re.compile(r'오늘|내일|모레|이번\s*주|다음\s*주|금주|[월화수목금토일]요일')
+
+# 정규식으로 날짜를 읽지 못했지만 기한이 있을 수 있는 표현 (이 경우 규칙으로 판단하지 않음)
+# "20일(금)까지", "9월 말", "이번 달", "Sep 30", "deadline" 등
+_DATE_HINT_RE = re.compile(
+    r'까지|마감|기한|\d{1,2}\s*일|\d{1,2}\s*월|이번\s*달|다음\s*달|월\s*(?:초|중순|말)'
+    r'|deadline|due|\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s*\d',
+    re.IGNORECASE
+)
+
+# 키워드 탐색 범위 (날짜 앞 글자 수)
+_CONTEXT_WINDOW = 40
+
+# 연도 추론 시 게시일 이전으로 허용하는 범위 (이보다 이전이면 다음 해로 판단)
+_PAST_TOLERANCE = timedelta(days=180)
+
+# ============================================================================
+
+# 확신도
+
+CONFIDENCE_SINGLE_RANGE = 0.95     # 신청 키워드가 붙은 기간 하나
+CONFIDENCE_SINGLE_DEADLINE = 0.9   # 신청 키워드가 붙은 마감일 하나
+CONFIDENCE_NO_DATE = 0.85          # 신청 키워드와 날짜 표현이 전혀 없음 (기간 없음)
+CONFIDENCE_UNLABELED = 0.6         # 키워드 없이 기간/마감 하나만 존재
+CONFIDENCE_AMBIGUOUS = 0.3         # 후보가 여러 개이거나 상대 날짜 표현 존재
+
+# ============================================================================
+
+# 날짜 추출
+
+def extract_period(content, pub_date=None):
+    """
+    본문에서 신청 기간을 규칙 기반으로 추출
+
+    연도가 없는 날짜는 게시일 기준으로 추론하고, 범위의 종료일이 시작일보다
+    앞서면 다음 해로 판단. 반환되는 확신도가 기준값 미만이면 AI 추출 권장.
+
+    Args:
+        content (str): 공지사항 본문 내용
+        pub_date (str | None): 게시일 ("YYYY-MM-DD" 또는 "YYYY-MM-DD hh:mm:ss")
+
+    Returns:
+        tuple[str | None, str | None, float]: (시작일, 종료일, 확신도 0.0 ~ 1.0)
+    """
+    if not content:
+        return None, None, CONFIDENCE_NO_DATE
+
+    base = _parse_pub_date(pub_date)
+    candidates = _find_candidates(content, base)
+
+    if not candidates:
+        if _RELATIVE_DATE_RE.search(content):
+            return None, None, CONFIDENCE_AMBIGUOUS
+        # 단일 날짜(행사일 등)만 있으면 기간이 아닐 가능성이 높지만 AI로 확인
+        if _DATE_RE.search(content):
+            return None, None, CONFIDENCE_UNLABELED
+        # 신청 키워드나 읽지 못한 날짜 표현이 있으면 기간이 없다고 단정하지 않음
+        if _APPLICATION_KEYWORD_RE.search(content) or _DATE_HINT_RE.search(content):
+            return None, None, CONFIDENCE_AMBIGUOUS
+        return None, None, CONFIDENCE_NO_DATE
+
+    labeled = {(start, end) for start, end, has_keyword in candidates if has_keyword}
+
+    if len(labeled) == 1:
+        start, end = labeled.pop()
+        confidence = CONFIDENCE_SINGLE_RANGE if start else CONFIDENCE_SINGLE_DEADLINE
+        return start, end, confidence
+
+    if not labeled and len({(start, end) for start, end, _ in candidates}) == 1:
+        start, end, _ = candidates[0]
+        return start, end, CONFIDENCE_UNLABELED
+
+    return None, None, CONFIDENCE_AMBIGUOUS
+
+def _find_candidates(content, base):
+    """
+    본문의 기간/마감일 후보 목록 생성
+
+    Returns:
+        list[tuple[str | None, str, bool]]: (시작일, 종료일, 신청 키워드 여부)
+    """
+    matches = list(_DATE_RE.finditer(content))
+    candidates = []
+    used_as_end = set()
+
+    for i, match in enumerate(matches):
+        if i in used_as_end:
+            continue
+
+        start = _resolve(match, base)
+        if start is None:
+            continue
+
+        has_keyword = _has_keyword(content, match.start())
+        following = content[match.end():]
+        next_match = matches[i + 1] if i + 1 < len(matches) else None
+
+        # "9월 16일 ~ 10월 5일" 형태의 범위
+        if next_match and _RANGE_GAP_RE.match(content[match.end():next_match.start()]):
+            end = _resolve_end(next_match, start)
+            if end:
+                candidates.append((start.isoformat(), end.isoformat(), has_keyword))
+                used_as_end.add(i + 1)
+                continue
+
+        # "9월 16일 ~ 20일" 형태의 범위
+        day_only = _DAY_ONLY_END_RE.match(following)
+        if day_only:
+            end = _safe_date(start.year, start.month, int(day_only.group('day')))
+            if end and end >= start:
+                candidates.append((start.isoformat(), end.isoformat(), has_keyword))
+                continue
+
+        # "10월 5일까지", "~10/5" 형태의 마감일
+        before = content[max(0, match.start() - 3):match.start()]
+        if _DEADLINE_AFTER_RE.match(following) or _DEADLINE_BEFORE_RE.search(before):
+            candidates.append((None, start.isoformat(), has_keyword))
+
+    return candidates
+
+def _has_keyword(content, position):
+    """
+    날짜 앞 같은 줄에 신청 관련 키워드가 있는지 확인
+
+    날짜에 더 가까운 쪽에 교육·행사·활동 기간 같은 다른 기간 표현이 있으면 키워드가 없는 것으로 봄
+    (예: "참가 신청 후 활동기간: 8/1 ~ 12/31")
+    """
+    line_start = content.rfind('\n', 0, position) + 1
+    context = content[max(line_start, position - _CONTEXT_WINDOW):position]
+
+    keywords = [match.end() for match in _APPLICATION_KEYWORD_RE.finditer(context)]
+    if not keywords:
+        return False
+    others = [match.end() for match in _OTHER_PERIOD_RE.finditer(context)]
+    return not others or keywords[-1] > others[-1]
+
+def _resolve(match, base):
+    """
+    정규식 매치를 날짜로 변환 (연도 없으면 기준일로부터 추론)
+    """
+    month, day = int(match.group('month')), int(match.group('day'))
+
+    if match.group('year'):
+        return _safe_date(int(match.group('year')), month, day)
+
+    candidate = _safe_date(base.year, month, day)
+    if candidate and candidate < base - _PAST_TOLERANCE:
+        candidate = _safe_date(base.year + 1, month, day)
+    return candidate
+
+def _resolve_end(match, start):
+    """
+    범위의 종료일 변환 (연도 없이 시작일보다 앞서면 다음 해로 판단)
+    """
+    end = _resolve(match, start)
+    if end and end < start and not match.group('year'):
+        end = _safe_date(start.year + 1, end.month, end.day)
+    return end if end and end >= start else None
+
+def _safe_date(year, month, day):
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+def _parse_pub_date(pub_date):
+    """
+    게시일 문자열을 날짜로 변환 (없거나 잘못된 형식이면 오늘)
+    """
+    if pub_date:
+        try:
+            return datetime.strptime(pub_date.split(' ')[0], "%Y-%m-%d").date()
+        except ValueError:
+            pass
+    return date.today()
@@ -3,9 +3,73 @@ HANA (Hansung AI for Notice & Assistance)
 한성대학교 공지사항 크롤링 시스템 데이터베이스 모듈
 
 크롤링한 공지사항 데이터를 구조화된 형식으로 저장
+- TextFileDB: 텍스트 파일에 추가 저장
+- NoticeStore: SQLite에 저장하고 텍스트 형식으로 내보내기
 """
 
 import os
+import json
+import sqlite3
+
+from crawler_config import DB_PATH, DB_WRITE_BATCH_SIZE
+
+
+# ============================================================================
+
+# 텍스트 형식
+
+def format_notice(notice_id, title, link, pub_date, category,
+                  start_date, end_date, content, image_urls=None, attachments=None):
+    """
+    공지사항 하나를 notice_db.txt 텍스트 블록으로 변환
+
+    Args:
+        TextFileDB.save_notice와 동일
+
+    Returns:
+        str: 구분선까지 포함한 텍스트 블록
+    """
+    # None 값을 빈 리스트로 변환
+    image_urls = image_urls or []
+    attachments = attachments or []
+
+    # 기본 정보
+    lines = [
+        f"ID: {notice_id}\n",
+        f"제목: {title}\n",
+        f"링크: {link}?layout=unknown\n",
+        f"게시 날짜: {pub_date}\n",
+        f"카테고리: {category}\n",
+    ]
+
+    # 신청 기간 정보
+    lines.append(f"시작일: {start_date if start_date else '없음'}\n")
+    lines.append(f"종료일: {end_date if end_date else '없음'}\n")
+
+    # 이미지 URL 정보
+    if image_urls:
+        lines.append("이미지 URL:\n")
+        lines.extend(f"\t- {img}\n" for img in image_urls)
+    else:
+        lines.append("이미지 URL: 없음\n")
+
+    # 첨부파일 정보
+    if attachments:
+        lines.append("첨부파일:\n")
+        lines.extend(f"\t- {att}\n" for att in attachments)
+    else:
+        lines.append("첨부파일: 없음\n")
+
+    # 본문 내용
+    lines.append(f"내용:\n{content}\n")
+
+    # 구분선 (다음 공지사항과 구분)
+    lines.append("\n" + "-" * 50 + "\n\n")
+    return "".join(lines)
+
+# ============================================================================
+
+# 텍스트 파일 DB
 
 
 class TextFileDB:
@@ -36,7 +100,9 @@ class TextFileDB:
                 pass
     
     def save_notice(self, notice_id, title, link, pub_date, category, 
-                    start_date, end_date, content, image_urls=None, attachments=None):
+                    start_date, end_date, content, image_urls=None, attachments=None,
+                    fingerprint=None, content_fingerprint=None,
+                    simhash=None, number_fingerprint=None, duplicate_of=None):
         """
         공지사항 데이터를 파일에 추가 저장
         
@@ -51,42 +117,385 @@ class TextFileDB:
             content (str): 공지사항 본문 내용
             image_urls (list, optional): 이미지 URL 리스트
             attachments (list, optional): 첨부파일 정보 리스트
+            fingerprint (str, optional): RSS 항목 지문 (텍스트 파일에는 저장하지 않음)
+            content_fingerprint (str, optional): 상세 페이지 지문 (텍스트 파일에는 저장하지 않음)
+            simhash (str, optional): 유사 중복 판별용 SimHash (텍스트 파일에는 저장하지 않음)
+            number_fingerprint (str, optional): 본문 숫자 지문 (텍스트 파일에는 저장하지 않음)
+            duplicate_of (str, optional): 원본 공지 ID (유사 중복이면, 텍스트 파일에는 저장하지 않음)
         """
-        # None 값을 빈 리스트로 변환
-        image_urls = image_urls or []
-        attachments = attachments or []
-        
         # 파일에 추가 모드로 쓰기
         with open(self.filename, "a", encoding="utf-8") as f:
-            # 기본 정보
-            f.write(f"ID: {notice_id}\n")
-            f.write(f"제목: {title}\n")
-            f.write(f"링크: {link}?layout=unknown\n")
-            f.write(f"게시 날짜: {pub_date}\n")
-            f.write(f"카테고리: {category}\n")
-            
-            # 신청 기간 정보
-            f.write(f"시작일: {start_date if start_date else '없음'}\n")
-            f.write(f"종료일: {end_date if end_date else '없음'}\n")
-            
-            # 이미지 URL 정보
-            if image_urls:
-                f.write("이미지 URL:\n")
-                for img in image_urls:
-                    f.write(f"\t- {img}\n")
-            else:
-                f.write("이미지 URL: 없음\n")
-            
-            # 첨부파일 정보
-            if attachments:
-                f.write("첨부파일:\n")
-                for att in attachments:
-                    f.write(f"\t- {att}\n")
-            else:
-                f.write("첨부파일: 없음\n")
-            
-            # 본문 내용
-            f.write(f"내용:\n{content}\n")
-            
-            # 구분선 (다음 공지사항과 구분)
-            f.write("\n" + "-" * 50 + "\n\n")
+            f.write(format_notice(
+                notice_id, title, link, pub_date, category,
+                start_date, end_date, content, image_urls, attachments
+            ))
+
+# ============================================================================
+
+# SQLite DB
+
+_COLUMNS = (
+    "notice_id", "title", "link", "pub_date", "category",
+    "start_date", "end_date", "content", "image_urls", "attachments"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notices (
+    notice_id   TEXT PRIMARY KEY,
+    title       TEXT NOT NULL,
+    link        TEXT NOT NULL,
+    pub_date    TEXT NOT NULL,
+    category    TEXT,
+    start_date  TEXT,
+    end_date    TEXT,
+    content     TEXT,
+    image_urls  TEXT NOT NULL DEFAULT '[]',
+    attachments TEXT NOT NULL DEFAULT '[]',
+    fingerprint TEXT,
+    content_fingerprint TEXT,
+    simhash     TEXT,
+    number_fingerprint TEXT,
+    duplicate_of TEXT,
+    version     INTEGER NOT NULL DEFAULT 1,
+    change_seq  INTEGER NOT NULL DEFAULT 0,
+    updated_at  TEXT NOT NULL DEFAULT (datetime('now', 'localtime'))
+);
+CREATE INDEX IF NOT EXISTS idx_notices_category ON notices(category);
+CREATE INDEX IF NOT EXISTS idx_notices_pub_date ON notices(pub_date);
+CREATE INDEX IF NOT EXISTS idx_notices_end_date ON notices(end_date);
+CREATE TABLE IF NOT EXISTS sync_state (
+    target      TEXT PRIMARY KEY,
+    cursor      INTEGER NOT NULL,
+    updated_at  TEXT NOT NULL DEFAULT (datetime('now', 'localtime'))
+);
+"""
+
+_STORED_COLUMNS = _COLUMNS + ("fingerprint", "content_fingerprint", "simhash", "number_fingerprint", "duplicate_of")
+
+# 저장 시 변경 순번(change_seq)을 저장소 전체에서 1씩 증가시키고,
+# 기존 공지는 내용이 실제로 바뀐 경우에만 버전·변경 순번 갱신
+_UPSERT = f"""
+INSERT INTO notices ({", ".join(_STORED_COLUMNS)}, change_seq)
+VALUES ({", ".join("?" for _ in _STORED_COLUMNS)}, (SELECT COALESCE(MAX(change_seq), 0) + 1 FROM notices))
+ON CONFLICT(notice_id) DO UPDATE SET
+    {", ".join(f"{column} = excluded.{column}" for column in _STORED_COLUMNS[1:])},
+    version = notices.version + 1,
+    change_seq = excluded.change_seq,
+    updated_at = datetime('now', 'localtime')
+WHERE ({", ".join(f"notices.{column}" for column in _STORED_COLUMNS[1:])})
+    IS NOT ({", ".join(f"excluded.{column}" for column in _STORED_COLUMNS[1:])})
+"""
+
+
+class NoticeStore:
+    """
+    SQLite 기반 공지사항 저장소
+
+    TextFileDB와 같은 save_notice 시그니처를 제공하며,
+    notice_id 기준으로 덮어쓰기(upsert)하고 여러 건을 한 트랜잭션으로 모아 저장.
+    notice_id(기본 키), category, pub_date, end_date에 인덱스가 있어
+    ID·카테고리·날짜 조회에 파일 전체를 읽을 필요가 없음
+
+    Attributes:
+        path (str): SQLite 파일 경로
+        batch_size (int): 한 트랜잭션으로 모아 저장할 공지 수
+        saved_ids (list[str]): 이번 실행에서 저장한 공지 ID (저장 순서)
+    """
+
+    def __init__(self, path=DB_PATH, batch_size=DB_WRITE_BATCH_SIZE):
+        """
+        NoticeStore 초기화
+
+        Args:
+            path (str): SQLite 파일 경로
+            batch_size (int): 한 트랜잭션으로 모아 저장할 공지 수
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.saved_ids = []
+        self._pending = []
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+        # 지문·버전·중복 열이 없던 이전 버전 파일 보완
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(notices)")}
+        for column in ("fingerprint", "content_fingerprint", "simhash", "number_fingerprint", "duplicate_of"):
+            if column not in columns:
+                self.conn.execute(f"ALTER TABLE notices ADD COLUMN {column} TEXT")
+        if "version" not in columns:
+            self.conn.execute("ALTER TABLE notices ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+        if "change_seq" not in columns:
+            # 기존 공지는 저장 순서대로 변경 순번 부여 (다음 동기화에서 모두 전송)
+            with self.conn:
+                self.conn.execute("ALTER TABLE notices ADD COLUMN change_seq INTEGER NOT NULL DEFAULT 0")
+                self.conn.execute("UPDATE notices SET change_seq = rowid")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_notices_change_seq ON notices(change_seq)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_notices_duplicate_of ON notices(duplicate_of)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # ------------------------------------------------------------------------
+    # 저장
+
+    def save_notice(self, notice_id, title, link, pub_date, category,
+                    start_date, end_date, content, image_urls=None, attachments=None,
+                    fingerprint=None, content_fingerprint=None,
+                    simhash=None, number_fingerprint=None, duplicate_of=None):
+        """
+        공지사항 저장 (batch_size건이 모이면 한 트랜잭션으로 기록)
+
+        Args:
+            TextFileDB.save_notice와 동일
+        """
+        self._pending.append((
+            str(notice_id), title, link, pub_date, category,
+            start_date, end_date, content,
+            json.dumps(image_urls or [], ensure_ascii=False),
+            json.dumps(attachments or [], ensure_ascii=False),
+            fingerprint,
+            content_fingerprint,
+            simhash,
+            number_fingerprint,
+            duplicate_of,
+        ))
+        self.saved_ids.append(str(notice_id))
+
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        모아 둔 공지사항을 한 트랜잭션으로 기록
+        """
+        if not self._pending:
+            return
+        with self.conn:
+            self.conn.executemany(_UPSERT, self._pending)
+        self._pending = []
+
+    def close(self):
+        """
+        남은 공지사항을 기록하고 연결 종료
+        """
+        self.flush()
+        self.conn.close()
+
+    # ------------------------------------------------------------------------
+    # 조회
+
+    @staticmethod
+    def _to_notice(row):
+        notice = {column: row[column] for column in _STORED_COLUMNS}
+        notice["image_urls"] = json.loads(notice["image_urls"])
+        notice["attachments"] = json.loads(notice["attachments"])
+        return notice
+
+    def has(self, notice_id):
+        """
+        공지사항 저장 여부 확인
+
+        Args:
+            notice_id (str): 공지사항 ID
+
+        Returns:
+            bool: 저장되어 있으면 True
+        """
+        self.flush()
+        row = self.conn.execute(
+            "SELECT 1 FROM notices WHERE notice_id = ?", (str(notice_id),)
+        ).fetchone()
+        return row is not None
+
+    def fingerprints(self):
+        """
+        저장된 공지 ID별 RSS 항목 지문 (증분 크롤링에서 변경 여부 판단용)
+
+        Returns:
+            dict[str, str | None]: 공지 ID별 지문
+        """
+        self.flush()
+        return dict(self.conn.execute("SELECT notice_id, fingerprint FROM notices"))
+
+    def get(self, notice_id):
+        """
+        공지사항 하나 조회
+
+        Args:
+            notice_id (str): 공지사항 ID
+
+        Returns:
+            dict | None: save_notice 인자와 같은 키의 공지 (없으면 None)
+        """
+        self.flush()
+        row = self.conn.execute(
+            "SELECT * FROM notices WHERE notice_id = ?", (str(notice_id),)
+        ).fetchone()
+        return self._to_notice(row) if row else None
+
+    def find(self, category=None, pub_from=None, pub_to=None, open_on=None, end_from=None,
+             notice_ids=None, include_duplicates=True):
+        """
+        조건에 맞는 공지사항 조회 (게시일 최신순)
+
+        Args:
+            category (str, optional): 카테고리
+            pub_from (str, optional): 게시일 하한 (YYYY-MM-DD, 포함)
+            pub_to (str, optional): 게시일 상한 (YYYY-MM-DD, 포함)
+            open_on (str, optional): 이 날짜(YYYY-MM-DD)에 신청기간 중인 공지만
+            end_from (str, optional): 신청 종료일이 이 날짜(YYYY-MM-DD) 이후인 공지만
+            notice_ids (list[str], optional): 조회할 공지 ID 목록
+            include_duplicates (bool): 다른 공지의 유사 중복(duplicate_of가 있는 공지) 포함 여부
+
+        Returns:
+            list[dict]: 공지 목록
+        """
+        self.flush()
+        conditions, params = [], []
+
+        if category is not None:
+            conditions.append("category = ?")
+            params.append(category)
+        if pub_from is not None:
+            conditions.append("pub_date >= ?")
+            params.append(pub_from)
+        if pub_to is not None:
+            # "YYYY-MM-DD HH:MM:SS" 형식도 해당 날짜에 포함
+            conditions.append("pub_date < ?")
+            params.append(pub_to + "~")
+        if open_on is not None:
+            conditions.append("end_date >= ? AND (start_date IS NULL OR start_date <= ?)")
+            params.extend([open_on, open_on])
+        if end_from is not None:
+            conditions.append("end_date >= ?")
+            params.append(end_from)
+        if notice_ids is not None:
+            notice_ids = [str(notice_id) for notice_id in notice_ids]
+            conditions.append(f"notice_id IN ({', '.join('?' for _ in notice_ids)})")
+            params.extend(notice_ids)
+        if not include_duplicates:
+            conditions.append("duplicate_of IS NULL")
+
+        query = "SELECT * FROM notices"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY pub_date DESC, rowid"
+
+        return [self._to_notice(row) for row in self.conn.execute(query, params)]
+
+    def near_duplicate_keys(self):
+        """
+        유사 중복 판별에 사용할 원본 공지의 SimHash·숫자 지문 (다른 공지의 중복인 공지 제외)
+
+        Returns:
+            list[tuple[str, str, str, str]]: (공지 ID, SimHash, 숫자 지문, 게시일)
+        """
+        self.flush()
+        return self.conn.execute(
+            "SELECT notice_id, simhash, number_fingerprint, pub_date FROM notices"
+            " WHERE simhash IS NOT NULL AND duplicate_of IS NULL"
+        ).fetchall()
+
+    def __len__(self):
+        self.flush()
+        return self.conn.execute("SELECT COUNT(*) FROM notices").fetchone()[0]
+
+    # ------------------------------------------------------------------------
+    # 변경 이력 (동기화)
+
+    def iter_changes(self, since=0, batch_size=500):
+        """
+        변경 순번이 since보다 큰 공지를 변경 순서대로 반환
+
+        batch_size건씩 나누어 조회하므로 저장소 전체를 메모리에 올리지 않음
+
+        Args:
+            since (int): 마지막으로 확인한 변경 순번 (0이면 전체)
+            batch_size (int): 한 번에 조회할 공지 수
+
+        Yields:
+            dict: 공지 (find 결과 키 + version, change_seq, updated_at)
+        """
+        self.flush()
+        while True:
+            rows = self.conn.execute(
+                "SELECT * FROM notices WHERE change_seq > ? ORDER BY change_seq LIMIT ?",
+                (since, batch_size)
+            ).fetchall()
+            for row in rows:
+                notice = self._to_notice(row)
+                notice.update(version=row["version"], change_seq=row["change_seq"], updated_at=row["updated_at"])
+                yield notice
+            if len(rows) < batch_size:
+                return
+            since = rows[-1]["change_seq"]
+
+    def last_change_seq(self):
+        """
+        가장 최근 변경 순번 (저장된 공지가 없으면 0)
+        """
+        self.flush()
+        return self.conn.execute("SELECT COALESCE(MAX(change_seq), 0) FROM notices").fetchone()[0]
+
+    def get_sync_cursor(self, target):
+        """
+        동기화 대상이 마지막으로 확인(ack)한 변경 순번
+
+        Args:
+            target (str): 동기화 대상 (업로드 URL 등)
+
+        Returns:
+            int: 변경 순번 (동기화한 적이 없으면 0)
+        """
+        row = self.conn.execute("SELECT cursor FROM sync_state WHERE target = ?", (target,)).fetchone()
+        return row["cursor"] if row else 0
+
+    def set_sync_cursor(self, target, cursor):
+        """
+        동기화 대상이 확인한 변경 순번 기록
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO sync_state (target, cursor) VALUES (?, ?)"
+                " ON CONFLICT(target) DO UPDATE SET cursor = excluded.cursor,"
+                " updated_at = datetime('now', 'localtime')",
+                (target, cursor)
+            )
+
+    # ------------------------------------------------------------------------
+    # 내보내기
+
+    def export_text(self, filename, notice_ids=None):
+        """
+        저장된 공지사항을 notice_db.txt와 같은 텍스트 형식으로 내보내기
+
+        Args:
+            filename (str): 출력 파일 경로
+            notice_ids (list[str], optional): 내보낼 공지 ID 목록
+                (지정하면 목록 순서대로, 없으면 전체를 게시일 최신순으로)
+
+        Returns:
+            int: 내보낸 공지 수
+        """
+        if notice_ids is None:
+            notices = self.find()
+        else:
+            by_id = {notice["notice_id"]: notice for notice in self.find(notice_ids=notice_ids)}
+            notices = [by_id[str(notice_id)] for notice_id in dict.fromkeys(notice_ids)
+                       if str(notice_id) in by_id]
+
+        with open(filename, "w", encoding="utf-8") as f:
+            for notice in notices:
+                f.write(format_notice(**{column: notice[column] for column in _COLUMNS}))
+        return len(notices)
@@ -0,0 +1,276 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 유사 중복 공지 판별 모듈
+
+같은 공지가 여러 세부 카테고리(장학 세부 카테고리, 진로 및 취·창업 등)에 다른 ID로 다시 게시되면
+OCR·신청기간 추출을 다시 하지 않고 먼저 처리한 공지(원본)의 결과를 재사용하고 원본 ID를 연결
+- 제목·본문(OCR 전)을 정규화하여 검색 색인과 같은 토큰(한국어 바이그램)으로 64비트 SimHash 계산
+- SimHash를 (DEDUP_MAX_DISTANCE + 1)개 구간으로 나눈 LSH 버킷에서 후보를 찾고,
+  해밍 거리가 DEDUP_MAX_DISTANCE 이하인 공지만 유사 중복으로 판단
+  (거리가 기준 이하이면 적어도 한 구간은 완전히 같으므로 후보를 빠뜨리지 않음)
+- 연도·날짜만 다른 매년 반복 공지를 중복으로 보지 않도록 본문 숫자 집합(숫자 지문)이 같고
+  게시일 차이가 DEDUP_WINDOW_DAYS 이내인 경우만 중복으로 판단
+- OCR이 필요한 공지(본문이 짧고 이미지가 있는 공지)는 이미지 URL 목록도 같아야 중복으로 판단
+- 같은 실행에서 함께 처리 중인 원본은 처리가 끝날 때까지 기다렸다가 결과 재사용
+"""
+
+import re
+import asyncio
+import hashlib
+from datetime import datetime
+
+import numpy as np
+
+from crawler_config import (
+    MIN_TEXT_LENGTH,
+    DEDUP_MAX_DISTANCE, DEDUP_WINDOW_DAYS, DEDUP_MIN_TOKENS
+)
+from search_index import tokenize
+
+
+# 본문의 URL·Markdown 링크 주소 (다시 올리면 바뀌는 업로드 경로는 비교에서 제외)
+_URL = re.compile(r"https?://\S+|\]\([^)]*\)")
+
+# 제목 앞의 말머리 (예: [장학], (재공지))
+_TITLE_PREFIX = re.compile(r"^\s*(?:[\[(【<][^\])】>]{0,20}[\])】>]\s*)+")
+
+_DIGITS = re.compile(r"\d+")
+
+_BITS = np.arange(64, dtype=np.uint64)
+
+# ============================================================================
+
+# 유사 중복 지문
+
+
+def _feature_hash(token):
+    return int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def simhash(features):
+    """
+    가중치가 있는 특징 목록의 64비트 SimHash
+
+    Args:
+        features (dict[str, float]): 특징 → 가중치
+
+    Returns:
+        int: SimHash (특징이 없으면 0)
+    """
+    if not features:
+        return 0
+    hashes = np.array([_feature_hash(feature) for feature in features], dtype=np.uint64)
+    weights = np.array(list(features.values()), dtype=np.float64)
+    bits = ((hashes[:, None] >> _BITS) & np.uint64(1)).astype(np.float64)
+    totals = weights @ (bits * 2 - 1)
+    return int(sum(1 << i for i in range(64) if totals[i] > 0))
+
+
+def near_duplicate_key(title, content):
+    """
+    제목·본문(OCR 전)의 유사 중복 지문
+
+    Args:
+        title (str): 제목
+        content (str | None): 상세 페이지 본문 (Markdown)
+
+    Returns:
+        tuple[str, str, int]: (SimHash 16진수, 숫자 지문, 토큰 수)
+    """
+    title = _TITLE_PREFIX.sub("", title or "")
+    content = _URL.sub(" ", content or "")
+
+    # 제목 토큰은 본문보다 가중치를 높게 둠
+    features = {}
+    tokens = tokenize(content)
+    for token in tokens:
+        features[token] = features.get(token, 0) + 1
+    title_tokens = tokenize(title)
+    for token in title_tokens:
+        features[f"t:{token}"] = features.get(f"t:{token}", 0) + 3
+
+    numbers = sorted({digits.lstrip("0") or "0" for digits in _DIGITS.findall(f"{title}\n{content}")})
+    number_fingerprint = hashlib.sha1(" ".join(numbers).encode("utf-8")).hexdigest()[:16]
+    return f"{simhash(features):016x}", number_fingerprint, len(tokens) + len(title_tokens)
+
+
+def set_near_duplicate_key(notice):
+    """
+    상세 페이지를 받은 공지에 유사 중복 지문 기록 (simhash, number_fingerprint, dedup_tokens)
+    """
+    notice["simhash"], notice["number_fingerprint"], notice["dedup_tokens"] = near_duplicate_key(
+        notice["title"], notice["content"]
+    )
+
+
+def _needs_ocr(notice):
+    content = notice.get("content")
+    return bool(notice.get("image_urls")) and (not content or len(content) < MIN_TEXT_LENGTH)
+
+
+def _pub_day(pub_date):
+    try:
+        return datetime.strptime((pub_date or "")[:10], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+# ============================================================================
+
+# 유사 중복 판별
+
+
+class DuplicateDetector:
+    """
+    크롤링 한 번 동안 사용하는 유사 중복 판별기
+
+    저장소의 원본 공지와 이번 실행에서 처리 중인 공지를 LSH 버킷에 두고,
+    OCR 단계 직전에 공지마다 원본을 찾음
+
+    Attributes:
+        db: 데이터베이스 객체 (NoticeStore면 저장된 원본도 비교)
+        max_distance (int): 유사 중복으로 볼 최대 해밍 거리
+    """
+
+    def __init__(self, db, max_distance=DEDUP_MAX_DISTANCE):
+        """
+        DuplicateDetector 초기화 (저장된 원본 공지의 지문 로드)
+
+        Args:
+            db: 데이터베이스 객체
+            max_distance (int): 최대 해밍 거리 (0~15)
+        """
+        self.db = db
+        self.max_distance = max_distance
+        self._band_bits = 64 // (max_distance + 1)
+        self._buckets = {}
+        self._entries = {}
+        self._pending = {}
+
+        keys = getattr(db, "near_duplicate_keys", None)
+        for notice_id, key, number_fingerprint, pub_date in (keys() if keys else []):
+            self._add(notice_id, int(key, 16), number_fingerprint, pub_date)
+
+    def _bands(self, value):
+        mask = (1 << self._band_bits) - 1
+        return [
+            (band, (value >> (band * self._band_bits)) & mask)
+            for band in range(self.max_distance + 1)
+        ]
+
+    def _add(self, notice_id, value, number_fingerprint, pub_date, notice=None):
+        self._entries[notice_id] = (value, number_fingerprint, _pub_day(pub_date), notice)
+        for band in self._bands(value):
+            self._buckets.setdefault(band, set()).add(notice_id)
+
+    def _remove(self, notice_id):
+        entry = self._entries.pop(notice_id, None)
+        if entry:
+            for band in self._bands(entry[0]):
+                self._buckets.get(band, set()).discard(notice_id)
+
+    def _candidates(self, notice):
+        """
+        지문이 가까운 원본 공지 ID (해밍 거리 순)
+        """
+        value = int(notice["simhash"], 16)
+        day = _pub_day(notice["pub_date"])
+        found = set()
+        for band in self._bands(value):
+            found.update(self._buckets.get(band, ()))
+
+        matches = []
+        for notice_id in found:
+            if notice_id == notice["notice_id"]:
+                continue
+            other, number_fingerprint, other_day, _ = self._entries[notice_id]
+            distance = bin(value ^ other).count("1")
+            if distance > self.max_distance or number_fingerprint != notice["number_fingerprint"]:
+                continue
+            if day and other_day and abs((day - other_day).days) > DEDUP_WINDOW_DAYS:
+                continue
+            matches.append((distance, notice_id))
+        return [notice_id for _, notice_id in sorted(matches)]
+
+    async def _original(self, notice_id):
+        """
+        원본 공지 (처리 중이면 끝날 때까지 기다림, 실패했거나 없으면 None)
+        """
+        if notice_id in self._pending:
+            return await asyncio.shield(self._pending[notice_id])
+        entry = self._entries.get(notice_id)
+        if entry and entry[3] is not None:
+            return entry[3]
+        get = getattr(self.db, "get", None)
+        return get(notice_id) if get else None
+
+    async def find_original(self, notice):
+        """
+        공지의 원본 찾기 (OCR 단계 직전에 호출)
+
+        원본이 없으면 이 공지를 처리 중인 원본으로 등록하여
+        뒤따르는 중복 공지가 처리 결과를 기다렸다가 재사용하도록 함
+
+        Args:
+            notice (dict): 상세 페이지를 받은 공지 (set_near_duplicate_key 적용)
+
+        Returns:
+            dict | None: 원본 공지 (notice_id, content, image_urls, start_date, end_date 등)
+        """
+        if "simhash" not in notice:
+            return None
+
+        needs_ocr = _needs_ocr(notice)
+        if needs_ocr or notice["dedup_tokens"] >= DEDUP_MIN_TOKENS:
+            for notice_id in self._candidates(notice):
+                original = await self._original(notice_id)
+                if original is None:
+                    continue
+                # OCR 결과를 재사용하려면 이미지가 같아야 함
+                if needs_ocr and original.get("image_urls") != notice["image_urls"]:
+                    continue
+                return original
+
+        # 원본으로 등록 (처리가 끝나면 finish에서 결과 전달)
+        if notice["notice_id"] not in self._pending:
+            self._pending[notice["notice_id"]] = asyncio.get_running_loop().create_future()
+            self._add(notice["notice_id"], int(notice["simhash"], 16), notice["number_fingerprint"], notice["pub_date"])
+        return None
+
+    def finish(self, notice):
+        """
+        공지 처리 완료 (저장 단계에 도착했을 때 호출)
+
+        처리 중인 원본으로 등록된 공지면 기다리는 중복 공지에 결과를 전달하고,
+        실패한 공지는 원본 후보에서 제외
+        """
+        future = self._pending.pop(notice["notice_id"], None)
+        if future is None:
+            return
+
+        if notice.get("failed") or notice.get("unchanged"):
+            self._remove(notice["notice_id"])
+            future.set_result(None)
+            return
+
+        original = {
+            field: notice.get(field)
+            for field in ("notice_id", "content", "image_urls", "start_date", "end_date")
+        }
+        value, number_fingerprint, day, _ = self._entries[notice["notice_id"]]
+        self._entries[notice["notice_id"]] = (value, number_fingerprint, day, original)
+        future.set_result(original)
+
+
+def reuse_original(notice, original):
+    """
+    원본 공지의 OCR 결과와 신청기간을 중복 공지에 적용하고 원본 ID 연결
+
+    본문은 OCR이 필요한 공지이고 원본 본문(OCR 결과)이 더 길 때만 대체하므로
+    중복 공지 자신의 본문 차이(재공지 문구 등)는 유지됨
+    """
+    if _needs_ocr(notice):
+        content = original.get("content")
+        if content and len(content) > len(notice["content"] or ""):
+            notice["content"] = content
+    notice["start_date"], notice["end_date"] = original.get("start_date"), original.get("end_date")
+    notice["duplicate_of"] = original.get("duplicate_of") or original["notice_id"]
@@ -0,0 +1,620 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 임베딩 색인 모듈
+
+검색·질의응답용으로 공지 본문을 조각(chunk)으로 나누어 임베딩하고 질문과 가까운 공지를 찾음
+- Markdown 본문을 문단·줄 경계에서 EMBEDDING_CHUNK_CHARS 이하 조각으로 나누고 제목을 앞에 붙여 임베딩
+- 조각 텍스트의 해시를 키로 벡터를 재사용하므로 새로 생기거나 바뀐 조각만 임베딩 API 호출
+- 벡터는 정규화한 float32 행렬 파일(vectors.f32)에 이어 쓰고 메모리 매핑하여 조회,
+  해시 → 행 번호와 공지 → 조각 목록은 SQLite(chunks.sqlite3)에 기록
+- 저장소의 변경 순번(change_seq) 기준으로 바뀐 공지만 다시 나눔 (크롤링 마지막 단계에서 실행)
+- 검색은 코사인 유사도 전수 비교, 벡터가 EMBEDDING_IVF_MIN_VECTORS개 이상이면 IVF(k-means 군집) 근사 검색
+- 임베딩 방식은 교체 가능하며 방식·모델·차원마다 디렉토리를 따로 사용
+  (openai: OpenAI Embeddings API, local: 네트워크 없이 같은 입력에 항상 같은 벡터를 주는 해시 임베딩)
+
+파일 구조 (EMBEDDING_DIR/<방식-모델-차원>/)
+    vectors.f32       행 하나가 벡터 하나인 float32 행렬 (행 수 = 파일 크기 / (차원 × 4))
+    chunks.sqlite3    vectors(content_hash → row), chunks(notice_id, chunk_no → content_hash, text), meta
+"""
+
+import os
+import re
+import math
+import uuid
+import asyncio
+import hashlib
+import sqlite3
+
+import numpy as np
+from openai import RateLimitError
+
+from crawler_config import (
+    EMBEDDING_BACKEND, EMBEDDING_MODEL, EMBEDDING_DIMENSIONS, EMBEDDING_DIR,
+    EMBEDDING_CHUNK_CHARS, EMBEDDING_CHUNK_OVERLAP, EMBEDDING_BATCH_SIZE,
+    EMBEDDING_COMPACT_RATIO, EMBEDDING_IVF_MIN_VECTORS, EMBEDDING_IVF_NPROBE,
+    EMBEDDING_SEARCH_K,
+    RATE_LIMIT_MAX_RETRIES
+)
+from llm_client import get_async_openai_client
+from rate_limiter import get_limiter, retry_after_from_error, estimate_tokens
+from search_index import tokenize
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS vectors (
+    content_hash TEXT PRIMARY KEY,
+    row          INTEGER NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    notice_id    TEXT NOT NULL,
+    chunk_no     INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    text         TEXT NOT NULL,
+    PRIMARY KEY (notice_id, chunk_no)
+);
+CREATE INDEX IF NOT EXISTS idx_chunks_hash ON chunks(content_hash);
+"""
+
+# 문단 구분 (빈 줄)
+_PARAGRAPH = re.compile(r"\n\s*\n")
+
+# ============================================================================
+
+# 본문 나누기
+
+
+def _pieces(paragraph, max_chars, overlap):
+    """
+    긴 문단을 줄 단위로, 그래도 긴 줄은 overlap만큼 겹치게 잘라 max_chars 이하 조각으로 나눔
+    """
+    if len(paragraph) <= max_chars:
+        return [paragraph]
+
+    pieces = []
+    step = max(1, max_chars - overlap)
+    for line in paragraph.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        if len(line) <= max_chars:
+            pieces.append(line)
+        else:
+            pieces.extend(line[i:i + max_chars] for i in range(0, len(line) - overlap, step))
+    return pieces
+
+
+def chunk_markdown(content, max_chars=EMBEDDING_CHUNK_CHARS, overlap=EMBEDDING_CHUNK_OVERLAP):
+    """
+    Markdown 본문을 max_chars 이하 조각으로 나눔
+
+    문단을 순서대로 이어 붙이다가 max_chars를 넘으면 새 조각을 시작하므로
+    같은 문단은 가능한 한 같은 조각에 들어가고, 앞부분이 바뀌지 않은 조각은 해시가 유지됨
+
+    Args:
+        content (str | None): Markdown 본문
+        max_chars (int): 조각 최대 글자 수
+        overlap (int): 한 줄을 자를 때 앞 조각과 겹치는 글자 수
+
+    Returns:
+        list[str]: 조각 목록 (본문이 없으면 빈 목록)
+    """
+    chunks, current = [], ""
+    for paragraph in _PARAGRAPH.split(content or ""):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        for piece in _pieces(paragraph, max_chars, overlap):
+            if current and len(current) + 2 + len(piece) > max_chars:
+                chunks.append(current)
+                current = piece
+            else:
+                current = f"{current}\n\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def notice_chunks(notice):
+    """
+    공지 하나의 임베딩할 조각 (조각마다 제목을 앞에 붙임, 본문이 없으면 제목만)
+
+    Args:
+        notice (dict): 저장소 공지
+
+    Returns:
+        list[str]: 조각 목록
+    """
+    title = notice.get("title") or ""
+    chunks = chunk_markdown(notice.get("content"))
+    return [f"{title}\n\n{chunk}" for chunk in chunks] if chunks else [title]
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _normalize(vectors):
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+# ============================================================================
+
+# 임베딩 방식
+
+
+class OpenAIEmbedding:
+    """
+    OpenAI Embeddings API 임베딩 (openai_embedding 제한기 사용)
+
+    Attributes:
+        model (str): 임베딩 모델
+        dimensions (int): 벡터 차원
+        signature (str): 벡터 저장 디렉토리 이름 (방식·모델·차원이 다르면 벡터를 섞지 않음)
+    """
+
+    def __init__(self, model=EMBEDDING_MODEL, dimensions=EMBEDDING_DIMENSIONS):
+        self.model = model
+        self.dimensions = dimensions
+        self.signature = f"openai-{model}-{dimensions}"
+
+    async def embed(self, texts):
+        """
+        텍스트 목록 임베딩 (429 응답은 Retry-After만큼 대기 후 재시도)
+
+        Args:
+            texts (list[str]): 텍스트 목록
+
+        Returns:
+            np.ndarray: (len(texts), dimensions) float32 행렬
+
+        Raises:
+            RuntimeError: 요청 한도 초과 재시도 횟수 초과
+        """
+        limiter = get_limiter("openai_embedding")
+        client = get_async_openai_client()
+
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            await limiter.acquire(sum(estimate_tokens(text) for text in texts))
+            try:
+                response = await client.embeddings.create(
+                    model=self.model, input=texts, dimensions=self.dimensions
+                )
+            except RateLimitError as e:
+                limiter.on_rate_limited(retry_after_from_error(e))
+                continue
+
+            data = sorted(response.data, key=lambda item: item.index)
+            return np.array([item.embedding for item in data], dtype=np.float32)
+
+        raise RuntimeError("임베딩 요청 실패: 요청 한도 초과 재시도 횟수 초과")
+
+
+class LocalHashEmbedding:
+    """
+    네트워크 없이 동작하는 결정적 임베딩 (오프라인 실행·테스트용)
+
+    검색 색인과 같은 토큰(한국어 바이그램)을 해시하여 부호를 붙여 차원에 누적하므로
+    같은 텍스트는 항상 같은 벡터가 되고, 겹치는 단어가 많은 텍스트끼리 가까워짐
+    """
+
+    def __init__(self, dimensions=EMBEDDING_DIMENSIONS):
+        self.dimensions = dimensions
+        self.signature = f"local-hash-v1-{dimensions}"
+
+    def _embed_one(self, text):
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for token in tokenize(text):
+            h = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+            vector[h % self.dimensions] += 1.0 if h >> 63 else -1.0
+        return vector
+
+    async def embed(self, texts):
+        return np.stack([self._embed_one(text) for text in texts]) if texts else \
+            np.zeros((0, self.dimensions), dtype=np.float32)
+
+
+# 임베딩 방식 이름 → 생성 함수 (register_embedding_backend로 추가)
+EMBEDDING_BACKENDS = {
+    "openai": OpenAIEmbedding,
+    "local": LocalHashEmbedding,
+}
+
+
+def register_embedding_backend(name, factory):
+    """
+    임베딩 방식 등록
+
+    Args:
+        name (str): 방식 이름 (EMBEDDING_BACKEND에 지정)
+        factory (Callable[[], object]): dimensions, signature 속성과 async embed(texts) 메서드를 가진 객체 생성 함수
+    """
+    EMBEDDING_BACKENDS[name] = factory
+
+
+def get_embedding_backend(name=EMBEDDING_BACKEND):
+    """
+    이름에 해당하는 임베딩 방식 생성
+
+    Raises:
+        KeyError: 등록되지 않은 방식
+    """
+    return EMBEDDING_BACKENDS[name]()
+
+# ============================================================================
+
+# 임베딩 색인
+
+
+class EmbeddingIndex:
+    """
+    공지 조각 임베딩의 디스크 색인
+
+    vectors.f32에는 행을 덧붙이기만 하고 SQLite에는 벡터를 모두 기록한 뒤 행 번호를 커밋하므로,
+    중간에 중단되어도 커밋되지 않은 행은 참조되지 않는 행으로 남을 뿐 색인이 깨지지 않음.
+    참조되지 않는 행이 EMBEDDING_COMPACT_RATIO를 넘으면 압축
+
+    Attributes:
+        backend: 임베딩 방식
+        directory (str): 벡터·메타데이터 디렉토리
+        dimensions (int): 벡터 차원
+        store_id (str): 색인 식별자 (색인을 새로 만들면 바뀌어 저장소 진행 상황을 처음부터 다시 처리)
+        stats (dict): 누적 처리 통계 (notices, chunks, embedded)
+    """
+
+    def __init__(self, backend=None, directory=EMBEDDING_DIR):
+        """
+        EmbeddingIndex 초기화
+
+        Args:
+            backend: 임베딩 방식 (기본값: EMBEDDING_BACKEND)
+            directory (str): 색인 상위 디렉토리 (방식마다 하위 디렉토리 사용)
+        """
+        self.backend = backend or get_embedding_backend()
+        self.dimensions = self.backend.dimensions
+        self.directory = os.path.join(directory, re.sub(r"[^\w.-]", "_", self.backend.signature))
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(os.path.join(self.directory, "chunks.sqlite3"))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+        meta = dict(self.conn.execute("SELECT key, value FROM meta"))
+        if "store_id" not in meta:
+            meta = {"store_id": uuid.uuid4().hex, "vectors_file": "vectors.f32"}
+            with self.conn:
+                self.conn.executemany("INSERT INTO meta (key, value) VALUES (?, ?)", meta.items())
+        self.store_id = meta["store_id"]
+        self.vectors_path = os.path.join(self.directory, meta["vectors_file"])
+
+        # 압축 중 중단되어 남은 벡터 파일 삭제
+        for filename in os.listdir(self.directory):
+            path = os.path.join(self.directory, filename)
+            if filename.startswith("vectors") and path != self.vectors_path:
+                os.remove(path)
+
+        # 기록 중 중단되어 잘린 마지막 행 제거
+        if not os.path.exists(self.vectors_path):
+            open(self.vectors_path, "wb").close()
+        row_bytes = self.dimensions * 4
+        size = os.path.getsize(self.vectors_path)
+        if size % row_bytes:
+            with open(self.vectors_path, "r+b") as f:
+                f.truncate(size - size % row_bytes)
+
+        self.stats = {"notices": 0, "chunks": 0, "embedded": 0}
+        self._lock = asyncio.Lock()
+        self._matrix = None
+        self._live = None
+        self._ivf = None
+
+    def close(self):
+        self._matrix = None
+        self.conn.close()
+
+    # ------------------------------------------------------------------------
+    # 벡터 파일
+
+    @property
+    def rows(self):
+        """
+        벡터 파일의 행 수 (참조되지 않는 행 포함)
+        """
+        return os.path.getsize(self.vectors_path) // (self.dimensions * 4)
+
+    def matrix(self):
+        """
+        벡터 파일의 읽기 전용 메모리 매핑 (행이 추가되면 다시 매핑)
+
+        Returns:
+            np.ndarray: (rows, dimensions) float32 행렬
+        """
+        rows = self.rows
+        if self._matrix is None or len(self._matrix) != rows:
+            if rows == 0:
+                self._matrix = np.zeros((0, self.dimensions), dtype=np.float32)
+            else:
+                self._matrix = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dimensions))
+        return self._matrix
+
+    def _append(self, vectors):
+        """
+        벡터를 파일 끝에 기록하고 첫 행 번호 반환 (SQLite 커밋 전에 디스크에 기록)
+        """
+        start = self.rows
+        with open(self.vectors_path, "ab") as f:
+            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+        return start
+
+    # ------------------------------------------------------------------------
+    # 색인 갱신
+
+    async def _embed_missing(self, chunks):
+        """
+        벡터가 없는 조각만 임베딩하여 기록
+
+        Args:
+            chunks (list[tuple[str, int, str, str]]): (공지 ID, 조각 번호, 해시, 텍스트)
+
+        Returns:
+            dict[str, int]: 새로 기록한 해시 → 행 번호
+        """
+        hashes = list(dict.fromkeys(chunk_hash for _, _, chunk_hash, _ in chunks))
+        known = set()
+        for i in range(0, len(hashes), 500):
+            batch = hashes[i:i + 500]
+            known.update(row[0] for row in self.conn.execute(
+                f"SELECT content_hash FROM vectors WHERE content_hash IN ({', '.join('?' for _ in batch)})", batch
+            ))
+
+        texts = {chunk_hash: text for _, _, chunk_hash, text in chunks if chunk_hash not in known}
+        missing = list(texts)
+        new_rows = {}
+        for i in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+            batch = missing[i:i + EMBEDDING_BATCH_SIZE]
+            vectors = await self.backend.embed([texts[chunk_hash] for chunk_hash in batch])
+            start = self._append(_normalize(vectors))
+            new_rows.update((chunk_hash, start + offset) for offset, chunk_hash in enumerate(batch))
+        return new_rows
+
+    async def update(self, db, batch_size=200):
+        """
+        마지막 갱신 이후 바뀐 공지만 다시 나누고, 새로 생기거나 바뀐 조각만 임베딩
+
+        batch_size개 공지마다 벡터·조각 목록을 커밋하고 저장소에 진행 상황(변경 순번)을 기록하므로
+        임베딩 API 오류로 중단되어도 다음 갱신은 커밋한 공지 이후부터 처리
+
+        Args:
+            db (NoticeStore): SQLite 저장소
+            batch_size (int): 한 번에 처리할 공지 수
+
+        Returns:
+            dict: 이번 갱신 통계 (notices: 다시 나눈 공지, chunks: 조각, embedded: 새로 임베딩한 조각)
+        """
+        async with self._lock:
+            target = f"embedding_index:{self.store_id}"
+            stats = {"notices": 0, "chunks": 0, "embedded": 0}
+
+            batch = []
+            for notice in db.iter_changes(since=db.get_sync_cursor(target), batch_size=batch_size):
+                batch.append(notice)
+                if len(batch) >= batch_size:
+                    await self._index_notices(db, target, batch, stats)
+                    batch = []
+            if batch:
+                await self._index_notices(db, target, batch, stats)
+
+            if stats["notices"]:
+                self._live = None
+                self._ivf = None
+                for key, value in stats.items():
+                    self.stats[key] += value
+                self._compact_if_needed()
+            return stats
+
+    async def _index_notices(self, db, target, notices, stats):
+        """
+        공지 묶음의 조각 목록을 바꾸고 저장소에 진행 상황 기록
+        """
+        chunks = [
+            (notice["notice_id"], chunk_no, content_hash(text), text)
+            for notice in notices
+            for chunk_no, text in enumerate(notice_chunks(notice))
+        ]
+        new_rows = await self._embed_missing(chunks)
+
+        with self.conn:
+            self.conn.executemany("INSERT INTO vectors (content_hash, row) VALUES (?, ?)", new_rows.items())
+            self.conn.executemany("DELETE FROM chunks WHERE notice_id = ?", [(notice["notice_id"],) for notice in notices])
+            self.conn.executemany(
+                "INSERT INTO chunks (notice_id, chunk_no, content_hash, text) VALUES (?, ?, ?, ?)", chunks
+            )
+        db.set_sync_cursor(target, notices[-1]["change_seq"])
+
+        stats["notices"] += len(notices)
+        stats["chunks"] += len(chunks)
+        stats["embedded"] += len(new_rows)
+
+    def _compact_if_needed(self):
+        """
+        참조되지 않는 행 비율이 EMBEDDING_COMPACT_RATIO를 넘으면 참조되는 행만 남겨 다시 기록
+        """
+        total = self.rows
+        live_rows = [row[0] for row in self.conn.execute(
+            "SELECT row FROM vectors WHERE content_hash IN (SELECT content_hash FROM chunks) ORDER BY row"
+        )]
+        if not total or (total - len(live_rows)) / total <= EMBEDDING_COMPACT_RATIO:
+            return
+
+        # 새 이름의 파일에 기록한 뒤 행 번호와 파일 이름을 한 트랜잭션으로 바꾸므로
+        # 중간에 중단되면 이전 파일과 행 번호가 그대로 남음
+        new_file = f"vectors-{uuid.uuid4().hex[:8]}.f32"
+        new_path = os.path.join(self.directory, new_file)
+        matrix = self.matrix()
+        with open(new_path, "wb") as f:
+            for i in range(0, len(live_rows), 4096):
+                f.write(np.ascontiguousarray(matrix[live_rows[i:i + 4096]]).tobytes())
+            f.flush()
+            os.fsync(f.fileno())
+
+        with self.conn:
+            self.conn.execute("DELETE FROM vectors WHERE content_hash NOT IN (SELECT content_hash FROM chunks)")
+            self.conn.execute("UPDATE vectors SET row = -1 - row")
+            self.conn.executemany(
+                "UPDATE vectors SET row = ? WHERE row = ?",
+                [(new_row, -1 - old_row) for new_row, old_row in enumerate(live_rows)]
+            )
+            self.conn.execute("UPDATE meta SET value = ? WHERE key = 'vectors_file'", (new_file,))
+
+        self._matrix = None
+        old_path, self.vectors_path = self.vectors_path, new_path
+        os.remove(old_path)
+        print(f"임베딩 색인 압축: {total}행 → {len(live_rows)}행", flush=True)
+
+    # ------------------------------------------------------------------------
+    # 검색
+
+    def _live_chunks(self):
+        """
+        공지에 연결된 조각 목록과 행 번호 (갱신 전까지 재사용)
+        """
+        if self._live is None:
+            rows = self.conn.execute(
+                "SELECT c.notice_id, c.chunk_no, c.text, v.row"
+                " FROM chunks c JOIN vectors v ON v.content_hash = c.content_hash"
+                " ORDER BY v.row"
+            ).fetchall()
+            self._live = (rows, np.array([row[3] for row in rows], dtype=np.int64))
+        return self._live
+
+    def _build_ivf(self, vectors):
+        """
+        구면 k-means로 군집 중심을 만들고 각 조각을 가장 가까운 군집에 배정
+        """
+        count = len(vectors)
+        nlist = max(1, int(math.sqrt(count)))
+        rng = np.random.default_rng(0)
+        sample = vectors[np.sort(rng.choice(count, size=min(count, nlist * 40), replace=False))]
+        centroids = sample[rng.choice(len(sample), size=nlist, replace=False)]
+
+        for _ in range(10):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, sample)
+            empty = ~sums.any(axis=1)
+            sums[empty] = centroids[empty]
+            centroids = _normalize(sums)
+
+        assign = np.concatenate([
+            np.argmax(vectors[i:i + 8192] @ centroids.T, axis=1) for i in range(0, count, 8192)
+        ])
+        order = np.argsort(assign, kind="stable")
+        bounds = np.searchsorted(assign[order], np.arange(nlist + 1))
+        return centroids, order, bounds
+
+    def search_vector(self, vector, k=EMBEDDING_SEARCH_K):
+        """
+        벡터와 가까운 공지 검색 (공지마다 가장 가까운 조각 하나)
+
+        Args:
+            vector (np.ndarray): 질의 벡터
+            k (int): 최대 공지 수
+
+        Returns:
+            list[dict]: {"notice_id", "chunk_no", "text", "score"} (코사인 유사도 높은 순)
+        """
+        chunks, rows = self._live_chunks()
+        if not chunks:
+            return []
+
+        query = _normalize(vector)
+        matrix = self.matrix()
+
+        if len(rows) >= EMBEDDING_IVF_MIN_VECTORS:
+            # IVF: 질의와 가까운 군집 EMBEDDING_IVF_NPROBE개의 조각만 비교
+            # (k-means가 빈 군집을 남길 수 있으므로 조각이 있는 군집만 고름)
+            if self._ivf is None:
+                self._ivf = self._build_ivf(np.asarray(matrix[rows]))
+            centroids, order, bounds = self._ivf
+            filled = np.flatnonzero(bounds[1:] > bounds[:-1])
+            probes = filled[np.argsort(centroids[filled] @ query)[::-1][:EMBEDDING_IVF_NPROBE]]
+            candidates = np.concatenate([order[bounds[c]:bounds[c + 1]] for c in probes])
+            scores = np.asarray(matrix[rows[candidates]]) @ query
+        else:
+            # 전수 비교: 메모리 매핑한 행렬 전체와 내적 후 참조되는 행만 사용
+            candidates = np.arange(len(rows))
+            scores = (matrix @ query)[rows]
+
+        # 상위 조각만 정렬하고, 한 공지의 조각이 몰려 공지가 k개보다 적으면 전체를 정렬
+        best = {}
+        limit = min(len(scores), k * 8)
+        if limit <= 0:
+            return []
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        for order in (top[np.argsort(-scores[top])], np.argsort(-scores)):
+            for index in order:
+                notice_id, chunk_no, text, _ = chunks[candidates[index]]
+                if notice_id not in best:
+                    best[notice_id] = {
+                        "notice_id": notice_id, "chunk_no": chunk_no, "text": text, "score": float(scores[index])
+                    }
+                    if len(best) >= k:
+                        return list(best.values())
+            if limit == len(scores):
+                break
+        return list(best.values())
+
+    async def search(self, query, k=EMBEDDING_SEARCH_K):
+        """
+        질문과 가까운 공지 검색
+
+        Args:
+            query (str): 질문
+            k (int): 최대 공지 수
+
+        Returns:
+            list[dict]: search_vector 결과
+        """
+        vectors = await self.backend.embed([query])
+        return self.search_vector(vectors[0], k)
+
+# ============================================================================
+
+# 공유 색인 관리
+
+_embedding_index = None
+
+def get_embedding_index():
+    """
+    프로세스 전체에서 공유하는 임베딩 색인 반환
+
+    Returns:
+        EmbeddingIndex: 공유 색인
+    """
+    global _embedding_index
+    if _embedding_index is None:
+        _embedding_index = EmbeddingIndex()
+    return _embedding_index
+
+
+async def update_embedding_index(db):
+    """
+    저장소의 임베딩 색인 갱신 (크롤링 마지막 단계, 실패해도 크롤링은 계속)
+
+    Args:
+        db (NoticeStore): SQLite 저장소
+
+    Returns:
+        dict | None: 갱신 통계 (실패하면 None)
+    """
+    try:
+        return await get_embedding_index().update(db)
+    except Exception as e:
+        print(f"임베딩 색인 갱신 실패 (다음 크롤링에서 이어서 처리): {e}", flush=True)
+        return None
@@ -0,0 +1,248 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 구조화 내보내기·동기화 모듈
+
+SQLite 저장소의 공지를 텍스트 형식 대신 구조화된 레코드로 내보내고,
+서버가 마지막으로 확인한 이후 바뀐 공지만 업로드
+- JSONL: 공지 하나당 한 줄의 JSON, 저장소에서 나누어 읽으며 바로 기록
+- Parquet: 열 단위 압축 스냅샷 (pyarrow가 설치된 경우에만)
+- 변경분 동기화: 변경 순번(change_seq) 기준으로 묶음 단위 업로드
+
+동기화 요청 형식 (POST FASTAPI_SYNC_PATH)
+- 본문: gzip 압축한 JSONL (Content-Type: application/x-ndjson, Content-Encoding: gzip)
+- X-Sync-From / X-Sync-To: 묶음 앞의 변경 순번(서버가 확인한 순번)과 묶음 마지막 변경 순번
+- Idempotency-Key: "<from>-<to>" (같은 묶음을 다시 보내도 서버가 한 번만 반영)
+- 응답 2xx {"cursor": n}: 서버가 n까지 반영했음을 확인
+- 응답 409 {"cursor": n}: 서버가 가진 순번이 다르므로 n 이후부터 다시 전송
+"""
+
+import os
+import gzip
+import json
+import time
+
+import requests
+
+from crawler_config import (
+    FASTAPI_SYNC_PATH,
+    SYNC_CHUNK_SIZE, SYNC_MAX_RETRIES, SYNC_BACKOFF_BASE,
+    EXPORT_JSONL_FILENAME, EXPORT_PARQUET_FILENAME,
+    EXPORT_PARQUET_COMPRESSION, EXPORT_PARQUET_ROW_GROUP_SIZE
+)
+from utils import fastapi_url
+
+
+# 내보내는 레코드 필드 (순서 유지)
+RECORD_FIELDS = (
+    "notice_id", "title", "link", "pub_date", "category",
+    "start_date", "end_date", "content", "image_urls", "attachments",
+    "duplicate_of", "version", "change_seq", "updated_at"
+)
+
+
+def to_record(notice):
+    """
+    저장소 공지를 내보내기 레코드로 변환 (지문 등 내부 필드 제외)
+    """
+    return {field: notice.get(field) for field in RECORD_FIELDS}
+
+
+def _atomic_path(filename):
+    """
+    임시 파일에 쓴 뒤 바꿔치기하기 위한 임시 경로 (같은 디렉토리)
+    """
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return f"{filename}.tmp"
+
+# ============================================================================
+
+# 파일 내보내기
+
+def write_jsonl(notices, filename=EXPORT_JSONL_FILENAME):
+    """
+    공지를 JSONL 파일로 기록 (파일명이 .gz로 끝나면 gzip 압축)
+
+    임시 파일에 모두 쓴 뒤 바꿔치기하므로 읽는 쪽은 반쯤 쓴 파일을 보지 않음
+
+    Args:
+        notices (Iterable[dict]): 저장소 공지 (NoticeStore.iter_changes 결과)
+        filename (str): 출력 파일 경로
+
+    Returns:
+        int: 기록한 공지 수
+    """
+    tmp_path = _atomic_path(filename)
+    opener = gzip.open if filename.endswith(".gz") else open
+
+    count = 0
+    with opener(tmp_path, "wt", encoding="utf-8") as f:
+        for notice in notices:
+            f.write(json.dumps(to_record(notice), ensure_ascii=False))
+            f.write("\n")
+            count += 1
+
+    os.replace(tmp_path, filename)
+    return count
+
+
+def write_parquet(notices, filename=EXPORT_PARQUET_FILENAME,
+                  compression=EXPORT_PARQUET_COMPRESSION, row_group_size=EXPORT_PARQUET_ROW_GROUP_SIZE):
+    """
+    공지를 Parquet 스냅샷으로 기록 (row_group_size개씩 나누어 기록)
+
+    Args:
+        notices (Iterable[dict]): 저장소 공지
+        filename (str): 출력 파일 경로
+        compression (str): 압축 방식 ("zstd", "snappy", "gzip" 등)
+        row_group_size (int): 한 번에 기록할 공지 수
+
+    Returns:
+        int | None: 기록한 공지 수 (pyarrow가 없으면 None)
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("pyarrow가 설치되어 있지 않아 Parquet 내보내기를 건너뜁니다. (pip install pyarrow)")
+        return None
+
+    schema = pa.schema([
+        ("notice_id", pa.string()),
+        ("title", pa.string()),
+        ("link", pa.string()),
+        ("pub_date", pa.string()),
+        ("category", pa.string()),
+        ("start_date", pa.string()),
+        ("end_date", pa.string()),
+        ("content", pa.string()),
+        ("image_urls", pa.list_(pa.string())),
+        ("attachments", pa.list_(pa.string())),
+        ("duplicate_of", pa.string()),
+        ("version", pa.int64()),
+        ("change_seq", pa.int64()),
+        ("updated_at", pa.string()),
+    ])
+
+    tmp_path = _atomic_path(filename)
+    count = 0
+    with pq.ParquetWriter(tmp_path, schema, compression=compression) as writer:
+        batch = []
+        for notice in notices:
+            batch.append(to_record(notice))
+            if len(batch) >= row_group_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+
+    os.replace(tmp_path, filename)
+    return count
+
+# ============================================================================
+
+# 변경분 동기화
+
+def _chunks(notices, size):
+    chunk = []
+    for notice in notices:
+        chunk.append(notice)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _post_chunk(session, url, chunk, cursor):
+    """
+    묶음 하나를 업로드하고 서버가 확인한 변경 순번 반환 (연결 오류·5xx는 재시도)
+
+    Returns:
+        tuple[int, bool]: (서버가 확인한 변경 순번, 순번 불일치로 다시 보내야 하는지)
+
+    Raises:
+        requests.RequestException: 재시도 후에도 업로드 실패
+    """
+    last = chunk[-1]["change_seq"]
+    body = gzip.compress("".join(
+        json.dumps(to_record(notice), ensure_ascii=False) + "\n" for notice in chunk
+    ).encode("utf-8"))
+    headers = {
+        "Content-Type": "application/x-ndjson",
+        "Content-Encoding": "gzip",
+        "X-Sync-From": str(cursor),
+        "X-Sync-To": str(last),
+        "Idempotency-Key": f"{cursor}-{last}",
+    }
+
+    for attempt in range(SYNC_MAX_RETRIES + 1):
+        try:
+            resp = session.post(url, data=body, headers=headers, timeout=30)
+            if resp.status_code == 409:
+                return int(resp.json()["cursor"]), True
+            if 200 <= resp.status_code < 300:
+                return int(resp.json().get("cursor", last)), False
+            if resp.status_code < 500:
+                # 4xx: 다시 보내도 같은 결과이므로 재시도하지 않음
+                resp.raise_for_status()
+            error = requests.HTTPError(f"{resp.status_code}: {resp.text[:200]}", response=resp)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = e
+
+        if attempt == SYNC_MAX_RETRIES:
+            raise error
+        delay = SYNC_BACKOFF_BASE * (2 ** attempt)
+        print(f"동기화 업로드 재시도 ({attempt + 1}/{SYNC_MAX_RETRIES}, {delay:.1f}초 후): {error}")
+        time.sleep(delay)
+
+
+def sync_notices(db, url=None, chunk_size=SYNC_CHUNK_SIZE):
+    """
+    서버가 마지막으로 확인한 이후 바뀐 공지만 묶음 단위로 업로드
+
+    묶음마다 서버가 확인한 변경 순번을 저장소에 기록하므로, 중간에 실패해도
+    다음 실행은 확인받지 못한 묶음부터 이어서 전송
+
+    Args:
+        db (NoticeStore): SQLite 저장소
+        url (str, optional): 동기화 엔드포인트 (기본값: FASTAPI_SYNC_PATH)
+        chunk_size (int): 묶음당 공지 수
+
+    Returns:
+        int | None: 업로드한 공지 수 (실패하면 None)
+    """
+    url = url or fastapi_url(FASTAPI_SYNC_PATH)
+    cursor = db.get_sync_cursor(url)
+    uploaded = 0
+    restarted_from = set()
+
+    with requests.Session() as session:
+        try:
+            while True:
+                restarted = False
+                for chunk in _chunks(db.iter_changes(since=cursor), chunk_size):
+                    acked, restarted = _post_chunk(session, url, chunk, cursor)
+                    if restarted:
+                        # 같은 순번으로 다시 돌아가라는 응답이 반복되면 중단
+                        if acked == cursor or acked in restarted_from:
+                            raise ValueError(f"서버가 변경 순번 {cursor} 이후 묶음을 거부했습니다 (서버 순번 {acked})")
+                        restarted_from.add(acked)
+                        print(f"서버 변경 순번이 달라 {acked} 이후부터 다시 전송합니다.")
+                    else:
+                        uploaded += len(chunk)
+                    cursor = acked
+                    db.set_sync_cursor(url, cursor)
+                    if restarted:
+                        break
+                if not restarted:
+                    break
+        except (requests.RequestException, ValueError, KeyError) as e:
+            print(f"동기화 실패 (변경 순번 {cursor}까지 전송 완료): {e}")
+            return None
+
+    print(f"동기화 완료: {uploaded}개 공지 업로드 (변경 순번 {cursor})")
+    return uploaded
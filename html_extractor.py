@@ -0,0 +1,147 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 상세 페이지 추출 모듈
+
+상세 페이지 HTML에서 본문(Markdown), 이미지, 첨부파일 추출
+- fast: 본문·첨부파일 블록만 한 번 파싱하고, 파싱된 본문 트리를 바로 Markdown으로 변환
+- legacy: 페이지 전체를 html.parser로 파싱한 뒤 본문을 문자열로 되돌려 markdownify로 다시 파싱
+
+fast의 파서는 HTML_PARSER로 선택
+- "html.parser": legacy와 같은 트리를 만들어 결과가 동일
+- "lxml": 더 빠르지만 닫는 태그를 생략한 목록·표(<li>, <td> 등)를 HTML5 규칙대로 닫으므로
+  그런 페이지에서는 결과가 legacy와 다를 수 있음
+"""
+
+from functools import lru_cache
+
+from bs4 import BeautifulSoup as bs, SoupStrainer
+from markdownify import MarkdownConverter, markdownify as md
+
+from crawler_config import (
+    BASE_DOMAIN, HTML_CONTENT_CLASS, HTML_FILE_CLASS,
+    HTML_EXTRACTOR, HTML_PARSER
+)
+
+
+@lru_cache(maxsize=None)
+def _block_strainer(content_class, file_class):
+    """
+    본문·첨부파일 블록만 파싱하도록 하는 선택자 (게시판의 클래스 조합별로 한 번만 생성)
+    """
+    return SoupStrainer("div", class_=[content_class, file_class])
+
+# 본문 Markdown 변환기 (링크·이미지 태그는 텍스트만 남김)
+_CONVERTER = MarkdownConverter(strip=["a", "img"])
+
+
+def _collect(view_con_div, file_div, base_domain):
+    """
+    본문·첨부파일 블록에서 이미지 URL과 첨부파일 목록 추출
+    """
+    image_urls, attachments = [], []
+
+    # 이미지 URL 수집
+    if view_con_div:
+        for img_tag in view_con_div.find_all('img', src=True):
+            src = img_tag['src']
+            # 상대 경로를 절대 경로로 변환
+            if src.startswith('/'):
+                src = f"{base_domain}{src}"
+            image_urls.append(src)
+
+    # 첨부파일 추출
+    if file_div:
+        for a_tag in file_div.find_all('a', href=True):
+            href = a_tag['href']
+            # 다운로드 링크만 수집
+            if "download.do" in href:
+                file_url = f"{base_domain}{href}" if href.startswith('/') else href
+                file_name = a_tag.get_text(strip=True)
+                attachments.append(f"{file_name} | {file_url}")
+
+    return image_urls, attachments
+
+def parse_html_fast(html, base_domain=BASE_DOMAIN, content_class=HTML_CONTENT_CLASS,
+                    file_class=HTML_FILE_CLASS, parser=HTML_PARSER):
+    """
+    본문·첨부파일 블록만 파싱하여 추출 (나머지 요소는 트리로 만들지 않음)
+
+    Args:
+        html (str): 상세 페이지 HTML
+        base_domain (str): 기본 도메인
+        content_class (str): 본문 div 클래스
+        file_class (str): 첨부파일 div 클래스
+        parser (str): BeautifulSoup 파서 ("html.parser" 또는 "lxml")
+
+    Returns:
+        tuple[str | None, list[str], list[str]]: (본문, 이미지 URL 목록, 첨부파일 목록)
+    """
+    soup = bs(html, parser, parse_only=_block_strainer(content_class, file_class))
+
+    view_con_div = soup.find('div', class_=content_class)
+    file_div = soup.find('div', class_=file_class)
+
+    # 파싱된 본문 트리를 바로 Markdown으로 변환
+    content = _CONVERTER.convert_soup(view_con_div).strip() if view_con_div else None
+
+    return (content, *_collect(view_con_div, file_div, base_domain))
+
+def parse_html_legacy(html, base_domain=BASE_DOMAIN, content_class=HTML_CONTENT_CLASS,
+                      file_class=HTML_FILE_CLASS):
+    """
+    페이지 전체를 html.parser로 파싱하여 추출 (이전 방식, 비교·대체용)
+
+    Args:
+        html (str): 상세 페이지 HTML
+        base_domain (str): 기본 도메인
+        content_class (str): 본문 div 클래스
+        file_class (str): 첨부파일 div 클래스
+
+    Returns:
+        tuple[str | None, list[str], list[str]]: (본문, 이미지 URL 목록, 첨부파일 목록)
+    """
+    soup = bs(html, 'html.parser')
+
+    view_con_div = soup.find('div', class_=content_class)
+    file_div = soup.find('div', class_=file_class)
+
+    # HTML을 Markdown으로 변환
+    content = md(str(view_con_div), strip=['a', 'img']).strip() if view_con_div else None
+
+    return (content, *_collect(view_con_div, file_div, base_domain))
+
+def parse_html(html, base_domain=BASE_DOMAIN, content_class=HTML_CONTENT_CLASS,
+               file_class=HTML_FILE_CLASS):
+    """
+    상세 페이지 HTML에서 본문, 이미지, 첨부파일 추출 (HTML_EXTRACTOR 설정에 따라 방식 선택)
+
+    Args:
+        html (str): 상세 페이지 HTML
+        base_domain (str): 기본 도메인
+        content_class (str): 본문 div 클래스
+        file_class (str): 첨부파일 div 클래스
+
+    Returns:
+        tuple[str | None, list[str], list[str]]: (본문, 이미지 URL 목록, 첨부파일 목록)
+    """
+    if HTML_EXTRACTOR == "legacy":
+        return parse_html_legacy(html, base_domain, content_class, file_class)
+    return parse_html_fast(html, base_domain, content_class, file_class)
+
+def parse_html_bytes(body, encoding=None, base_domain=BASE_DOMAIN,
+                     content_class=HTML_CONTENT_CLASS, file_class=HTML_FILE_CLASS):
+    """
+    응답 원본 바이트를 디코딩하여 추출 (CPU 작업 풀에서 실행하기 위한 진입점)
+
+    Args:
+        body (bytes): 상세 페이지 응답 본문
+        encoding (str | None): 응답 문자 인코딩 (없으면 UTF-8)
+        base_domain (str): 기본 도메인
+        content_class (str): 본문 div 클래스
+        file_class (str): 첨부파일 div 클래스
+
+    Returns:
+        tuple[str | None, list[str], list[str]]: (본문, 이미지 URL 목록, 첨부파일 목록)
+    """
+    html = body.decode(encoding or "utf-8", errors="replace")
+    return parse_html(html, base_domain, content_class, file_class)
@@ -0,0 +1,131 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 HTTP 캐시 모듈
+
+RSS 페이지와 상세 페이지 응답을 디스크에 압축 저장하고
+ETag/Last-Modified 기반 조건부 요청에 사용
+"""
+
+import os
+import json
+import time
+import zlib
+import hashlib
+
+from crawler_config import HTTP_CACHE_DIR
+
+
+class CacheMissError(LookupError):
+    """
+    오프라인 재실행 중 캐시에 없는 URL을 요청했을 때 발생
+    """
+
+
+class HttpCache:
+    """
+    URL 단위 디스크 캐시
+
+    URL의 SHA-256 해시를 키로 메타데이터(.json)와 zlib 압축 본문(.body.z)을 저장
+
+    Attributes:
+        directory (str): 캐시 저장 디렉토리
+    """
+
+    def __init__(self, directory=HTTP_CACHE_DIR):
+        """
+        HttpCache 초기화
+
+        Args:
+            directory (str): 캐시 저장 디렉토리
+        """
+        self.directory = directory
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key[:2], key)
+        return f"{base}.json", f"{base}.body.z"
+
+    def load(self, url):
+        """
+        캐시된 응답 로드
+
+        Args:
+            url (str): 요청 URL
+
+        Returns:
+            tuple[dict, bytes] | None: (메타데이터, 본문), 없으면 None
+        """
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = zlib.decompress(f.read())
+        except (OSError, ValueError, zlib.error):
+            return None
+        return meta, body
+
+    def store(self, url, headers, body, encoding=None):
+        """
+        응답 저장 (임시 파일에 쓴 뒤 교체하여 동시 요청에도 안전)
+
+        Args:
+            url (str): 요청 URL
+            headers (Mapping): 응답 헤더
+            body (bytes): 응답 본문
+            encoding (str | None): 본문 인코딩
+        """
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "content_type": headers.get("Content-Type"),
+            "encoding": encoding,
+            "fetched_at": time.time(),
+        }
+
+        meta_path, body_path = self._paths(url)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+
+        _atomic_write(body_path, zlib.compress(body, 6))
+        _atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+    def touch(self, url):
+        """
+        304 응답 시 캐시 확인 시각 갱신
+
+        Args:
+            url (str): 요청 URL
+        """
+        cached = self.load(url)
+        if cached is None:
+            return
+        meta, _ = cached
+        meta["fetched_at"] = time.time()
+        meta_path, _ = self._paths(url)
+        _atomic_write(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+    @staticmethod
+    def conditional_headers(meta):
+        """
+        캐시 메타데이터로 조건부 요청 헤더 생성
+
+        Args:
+            meta (dict): 캐시 메타데이터
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since 헤더
+        """
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+
+def _atomic_write(path, data):
+    tmp_path = f"{path}.{os.getpid()}.{id(data)}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
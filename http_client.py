@@ -0,0 +1,287 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 HTTP 클라이언트 모듈
+
+RSS, 상세 페이지, 이미지 요청에 공통으로 사용하는 비동기 HTTP 클라이언트
+"""
+
+import asyncio
+from collections import namedtuple
+
+import aiohttp
+
+from crawler_config import (
+    REQUEST_TIMEOUT, HTTP_USER_AGENT,
+    HTTP_POOL_SIZE, HTTP_LIMIT_PER_HOST,
+    HTTP_MAX_RETRIES, HTTP_BACKOFF_BASE,
+    HTTP_CACHE_ENABLED, HTTP_CACHE_OFFLINE
+)
+from http_cache import HttpCache, CacheMissError
+from rate_limiter import get_limiter, parse_retry_after
+
+# aiohttp는 brotli(또는 brotlicffi) 패키지가 있어야 br 응답을 풀 수 있으므로 있을 때만 요청
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip, deflate"
+
+
+# HTTP 응답 (본문은 bytes, 인코딩은 Content-Type 기준)
+# - not_modified: 304 응답 또는 오프라인 재실행으로 캐시 본문을 돌려준 경우 True
+HttpResponse = namedtuple(
+    "HttpResponse",
+    ["url", "status", "headers", "body", "encoding", "not_modified"],
+    defaults=(False,)
+)
+
+
+class HttpStatusError(Exception):
+    """
+    재시도 후에도 성공(2xx)이 아닌 응답을 받았을 때 발생 (오류 페이지를 본문으로 쓰지 않도록)
+
+    Attributes:
+        url (str): 요청 URL
+        status (int): HTTP 상태 코드
+    """
+
+    def __init__(self, url, status):
+        super().__init__(f"HTTP {status}: {url}")
+        self.url = url
+        self.status = status
+
+
+def response_text(response):
+    """
+    응답 본문을 문자열로 디코딩
+
+    Args:
+        response (HttpResponse): HTTP 응답
+
+    Returns:
+        str: 디코딩된 본문
+    """
+    return response.body.decode(response.encoding or "utf-8", errors="replace")
+
+# ============================================================================
+
+# HTTP 클라이언트
+
+class HttpClient:
+    """
+    연결 풀을 공유하는 비동기 HTTP 클라이언트
+
+    - 호스트별 동시 연결 수 제한 및 Keep-Alive 재사용
+    - gzip/deflate 압축 응답 자동 해제 (brotli 패키지가 있으면 br도 요청)
+    - 연결 오류·5xx 응답은 지수 백오프로 재시도
+    - 429 응답은 Retry-After만큼 해당 서비스 제한기를 멈춘 뒤 재시도
+    - fetch_cached: ETag/Last-Modified 조건부 요청 및 디스크 캐시 사용
+
+    Attributes:
+        timeout (aiohttp.ClientTimeout): 요청 타임아웃
+        cache (HttpCache | None): 디스크 캐시 (비활성화 시 None)
+        offline (bool): True면 네트워크 없이 캐시만으로 응답
+    """
+
+    def __init__(self, timeout=REQUEST_TIMEOUT, cache=None, offline=HTTP_CACHE_OFFLINE):
+        """
+        HttpClient 초기화
+
+        Args:
+            timeout (float): 요청 타임아웃 (초)
+            cache (HttpCache | None): 디스크 캐시 (기본값: HTTP_CACHE_ENABLED 설정에 따름)
+            offline (bool): 캐시 전용 재실행 여부
+        """
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.cache = cache if cache is not None else (HttpCache() if HTTP_CACHE_ENABLED else None)
+        self.offline = offline
+        self._session = None
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_POOL_SIZE,
+                limit_per_host=HTTP_LIMIT_PER_HOST,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={
+                    "User-Agent": HTTP_USER_AGENT,
+                    "Accept-Encoding": _ACCEPT_ENCODING
+                }
+            )
+        return self._session
+
+    async def fetch(self, url, method="GET", limiter="school", **kwargs):
+        """
+        HTTP 요청 후 응답 전체를 읽어 반환
+
+        Args:
+            url (str): 요청 URL
+            method (str): HTTP 메서드
+            limiter (str | None): 요청 전 사용할 제한기 이름 (None이면 제한 없음)
+            **kwargs: aiohttp 요청 인자 (headers, data 등)
+
+        Returns:
+            HttpResponse: HTTP 응답 (2xx 또는 조건부 요청의 304)
+
+        Raises:
+            aiohttp.ClientError | asyncio.TimeoutError: 재시도 후에도 요청 실패
+            HttpStatusError: 재시도 후에도 성공이 아닌 응답 (404, 429, 5xx 등)
+            CacheMissError: 오프라인 모드에서는 네트워크 요청 불가
+        """
+        if self.offline:
+            raise CacheMissError(url)
+
+        rate_limiter = get_limiter(limiter) if limiter else None
+
+        for attempt in range(HTTP_MAX_RETRIES + 1):
+            if rate_limiter:
+                await rate_limiter.acquire()
+
+            last_attempt = attempt == HTTP_MAX_RETRIES
+            try:
+                async with self._get_session().request(method, url, **kwargs) as resp:
+                    body = await resp.read()
+                    response = HttpResponse(
+                        url=str(resp.url),
+                        status=resp.status,
+                        headers=resp.headers,
+                        body=body,
+                        encoding=resp.charset
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if last_attempt:
+                    raise
+                delay = HTTP_BACKOFF_BASE * (2 ** attempt)
+                print(f"HTTP 요청 실패, {delay:.1f}초 후 재시도: {url} - {e}")
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status == 429 and not last_attempt:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if rate_limiter:
+                    rate_limiter.on_rate_limited(retry_after)
+                else:
+                    await asyncio.sleep(retry_after or HTTP_BACKOFF_BASE * (2 ** attempt))
+                continue
+
+            if response.status >= 500 and not last_attempt:
+                delay = HTTP_BACKOFF_BASE * (2 ** attempt)
+                print(f"서버 오류 {response.status}, {delay:.1f}초 후 재시도: {url}")
+                await asyncio.sleep(delay)
+                continue
+
+            if response.status != 304 and not 200 <= response.status < 300:
+                raise HttpStatusError(url, response.status)
+            return response
+
+    async def fetch_cached(self, url, limiter="school"):
+        """
+        디스크 캐시를 사용하는 GET 요청
+
+        캐시된 응답이 있으면 If-None-Match/If-Modified-Since를 보내고,
+        304 응답이면 캐시 본문을 반환. 200 응답은 캐시에 저장.
+        오프라인 모드에서는 네트워크 없이 캐시만 사용
+
+        Args:
+            url (str): 요청 URL
+            limiter (str | None): 요청 전 사용할 제한기 이름
+
+        Returns:
+            HttpResponse: HTTP 응답 (캐시 응답이면 not_modified=True)
+
+        Raises:
+            HttpStatusError: 재시도 후에도 성공이 아닌 응답 (오류 페이지는 캐시하지 않음)
+            CacheMissError: 오프라인 모드에서 캐시에 없는 URL 요청
+        """
+        if self.cache is None:
+            if self.offline:
+                raise CacheMissError(url)
+            return await self.fetch(url, limiter=limiter)
+
+        cached = await asyncio.to_thread(self.cache.load, url)
+
+        if self.offline:
+            if cached is None:
+                raise CacheMissError(url)
+            return _cached_response(url, *cached)
+
+        headers = HttpCache.conditional_headers(cached[0]) if cached else {}
+        response = await self.fetch(url, limiter=limiter, headers=headers)
+
+        if response.status == 304:
+            if not cached:
+                raise HttpStatusError(url, response.status)
+            await asyncio.to_thread(self.cache.touch, url)
+            return _cached_response(url, *cached)
+
+        if response.status == 200:
+            await asyncio.to_thread(
+                self.cache.store, url, response.headers, response.body, response.encoding
+            )
+        return response
+
+    async def close(self):
+        """
+        연결 풀 종료
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+def _cached_response(url, meta, body):
+    headers = {
+        "Content-Type": meta.get("content_type"),
+        "ETag": meta.get("etag"),
+        "Last-Modified": meta.get("last_modified"),
+    }
+    headers = {key: value for key, value in headers.items() if value}
+    return HttpResponse(
+        url=url,
+        status=200,
+        headers=headers,
+        body=body,
+        encoding=meta.get("encoding"),
+        not_modified=True
+    )
+
+# ============================================================================
+
+# 공유 클라이언트 관리
+
+_client = None
+
+def get_http_client():
+    """
+    프로세스 전체에서 공유하는 HTTP 클라이언트 반환
+
+    Returns:
+        HttpClient: 공유 클라이언트
+    """
+    global _client
+    if _client is None:
+        _client = HttpClient()
+    return _client
+
+def set_offline(enabled=True):
+    """
+    공유 클라이언트의 오프라인(캐시 전용) 재실행 모드 설정
+
+    Args:
+        enabled (bool): 오프라인 모드 여부
+    """
+    get_http_client().offline = enabled
+
+async def close_http_client():
+    """
+    공유 HTTP 클라이언트의 연결 풀 종료 (설정은 유지되고 다음 요청 시 새 연결 풀 생성)
+    """
+    if _client is not None:
+        await _client.close()
@@ -0,0 +1,153 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 이미지 전처리 모듈
+
+OCR 전에 아이콘·여백 이미지처럼 글자가 없을 이미지를 걸러내고,
+같은 이미지를 한 번만 남기며, 너무 큰 스캔 이미지는 축소·재인코딩하여
+zerox로 보내는 이미지 수와 크기를 줄임
+"""
+
+import io
+
+from PIL import Image, ImageFilter
+
+from crawler_config import (
+    OCR_MIN_IMAGE_BYTES, OCR_MIN_IMAGE_DIMENSION,
+    OCR_MAX_IMAGE_DIMENSION, OCR_JPEG_QUALITY,
+    OCR_TEXT_CHECK_ENABLED, OCR_TEXT_MIN_EDGE_RATIO
+)
+from ocr_cache import content_hash
+
+
+# 글자 가능성 판단 시 축소할 긴 변 길이 (픽셀)
+_TEXT_CHECK_SIZE = 256
+
+# 경계(엣지) 픽셀로 볼 밝기 변화량
+_EDGE_THRESHOLD = 64
+
+# ============================================================================
+
+# 개별 이미지 검사
+
+def open_image(image):
+    """
+    이미지 바이트를 열어 크기 확인
+
+    Args:
+        image (bytes): 이미지 바이트
+
+    Returns:
+        PIL.Image.Image | None: 열린 이미지 (열 수 없으면 None)
+    """
+    try:
+        img = Image.open(io.BytesIO(image))
+        img.load()
+        return img
+    except Exception:
+        return None
+
+def is_text_likely(img, min_edge_ratio=OCR_TEXT_MIN_EDGE_RATIO):
+    """
+    이미지에 글자가 있을 가능성을 경계 픽셀 비율로 판단
+
+    글자는 작고 대비가 강한 획이 많아 경계 픽셀 비율이 높고,
+    단색 배너나 흐릿한 사진은 비율이 낮음
+
+    Args:
+        img (PIL.Image.Image): 이미지
+        min_edge_ratio (float): 글자가 있다고 볼 최소 경계 픽셀 비율
+
+    Returns:
+        bool: 글자가 있을 가능성이 있으면 True
+    """
+    gray = img.convert("L")
+    gray.thumbnail((_TEXT_CHECK_SIZE, _TEXT_CHECK_SIZE))
+    edges = gray.filter(ImageFilter.FIND_EDGES)
+
+    histogram = edges.histogram()
+    edge_pixels = sum(histogram[_EDGE_THRESHOLD:])
+    total = gray.width * gray.height
+    return total > 0 and edge_pixels / total >= min_edge_ratio
+
+def downscale_image(image, img, max_dimension=OCR_MAX_IMAGE_DIMENSION, quality=OCR_JPEG_QUALITY):
+    """
+    긴 변이 상한을 넘는 이미지를 축소하여 JPEG로 재인코딩
+
+    Args:
+        image (bytes): 원본 이미지 바이트
+        img (PIL.Image.Image): 열린 원본 이미지
+        max_dimension (int): 긴 변 최대 길이 (픽셀)
+        quality (int): JPEG 품질
+
+    Returns:
+        bytes: 축소한 이미지 바이트 (상한 이하이거나 재인코딩 결과가 더 크면 원본)
+    """
+    if max(img.size) <= max_dimension:
+        return image
+
+    resized = img.convert("RGB")
+    resized.thumbnail((max_dimension, max_dimension), Image.LANCZOS)
+
+    buffer = io.BytesIO()
+    resized.save(buffer, "JPEG", quality=quality, optimize=True)
+    encoded = buffer.getvalue()
+    return encoded if len(encoded) < len(image) else image
+
+# ============================================================================
+
+# 이미지 목록 전처리
+
+def filter_images(images):
+    """
+    OCR할 가치가 있는 이미지만 남김
+
+    - 파일 크기나 짧은 변이 기준보다 작은 이미지(아이콘, 여백 이미지) 제외
+    - OCR_TEXT_CHECK_ENABLED이면 글자가 없어 보이는 이미지 제외
+    - 내용 해시가 같은 이미지는 처음 것만 유지
+      (같은 템플릿의 다른 포스터는 지각 해시가 같을 수 있으므로 바이트가 같은 이미지만 중복으로 봄)
+
+    Args:
+        images (list[bytes]): 이미지 바이트 리스트
+
+    Returns:
+        list[bytes]: 남은 이미지 (원래 순서 유지)
+    """
+    kept, seen = [], set()
+
+    for image in images:
+        if len(image) < OCR_MIN_IMAGE_BYTES:
+            continue
+
+        img = open_image(image)
+        if img is None or min(img.size) < OCR_MIN_IMAGE_DIMENSION:
+            continue
+
+        if OCR_TEXT_CHECK_ENABLED and not is_text_likely(img):
+            continue
+
+        digest = content_hash(image)
+        if digest in seen:
+            continue
+        seen.add(digest)
+
+        kept.append(image)
+
+    if len(kept) < len(images):
+        print(f"OCR 대상 이미지: {len(images)}개 중 {len(kept)}개")
+    return kept
+
+def prepare_images(images):
+    """
+    OCR 요청 전에 큰 이미지를 Vision 모델에 필요한 해상도로 축소
+
+    Args:
+        images (list[bytes]): 이미지 바이트 리스트
+
+    Returns:
+        list[bytes]: 축소한 이미지 리스트
+    """
+    prepared = []
+    for image in images:
+        img = open_image(image)
+        prepared.append(downscale_image(image, img) if img is not None else image)
+    return prepared
@@ -0,0 +1,125 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 캐시 저장소 모듈
+
+AI 호출 결과 등을 재사용하기 위한 SQLite 기반 LRU 키-값 캐시
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+
+
+class LRUCache:
+    """
+    크기 제한이 있는 영구 키-값 캐시
+
+    최근 사용 시각을 기록하여 최대 개수를 넘으면 가장 오래 사용되지 않은 항목부터 삭제
+    (항목 수를 메모리에 세어 두고 넘은 만큼만 last_used 인덱스 앞쪽에서 삭제)
+
+    Attributes:
+        path (str): SQLite 파일 경로
+        max_entries (int): 최대 저장 항목 수
+        hits (int): 캐시 적중 횟수
+        misses (int): 캐시 미적중 횟수
+    """
+
+    def __init__(self, path, max_entries):
+        """
+        LRUCache 초기화
+
+        Args:
+            path (str): SQLite 파일 경로
+            max_entries (int): 최대 저장 항목 수
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_last_used ON cache(last_used)")
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+    def get(self, key):
+        """
+        캐시 조회 (적중 시 최근 사용 시각 갱신)
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            Any | None: 저장된 값 (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._conn.execute("UPDATE cache SET last_used = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            return json.loads(row[0])
+
+    def set(self, key, value):
+        """
+        캐시 저장 (최대 개수를 넘으면 오래된 항목 삭제)
+
+        Args:
+            key (str): 캐시 키
+            value (Any): JSON으로 직렬화 가능한 값
+        """
+        row = (key, json.dumps(value, ensure_ascii=False), time.time())
+        with self._lock:
+            inserted = self._conn.execute(
+                "INSERT OR IGNORE INTO cache (key, value, last_used) VALUES (?, ?, ?)", row
+            ).rowcount
+            if inserted:
+                self._count += 1
+            else:
+                self._conn.execute("UPDATE cache SET value = ?, last_used = ? WHERE key = ?", row[1:] + row[:1])
+
+            if self._count > self.max_entries:
+                deleted = self._conn.execute(
+                    "DELETE FROM cache WHERE key IN ("
+                    " SELECT key FROM cache ORDER BY last_used LIMIT ?)",
+                    (self._count - self.max_entries,)
+                ).rowcount
+                self._count -= deleted
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._count
+
+    def stats(self):
+        """
+        캐시 적중 통계
+
+        Returns:
+            dict: hits, misses, entries
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self)}
+
+    def close(self):
+        """
+        SQLite 연결 종료
+        """
+        with self._lock:
+            self._conn.close()
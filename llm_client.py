@@ -0,0 +1,145 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 OpenAI 클라이언트 모듈
+
+프로세스 전체에서 공유하는 비동기 OpenAI 클라이언트와
+JSON 스키마 기반 구조화 응답 요청, 본문 길이 제한 기능 제공
+"""
+
+import re
+
+from openai import AsyncOpenAI, RateLimitError
+
+from crawler_config import (
+    OPENAI_API_KEY, MODEL, TEMPERATURE,
+    RATE_LIMIT_MAX_RETRIES,
+    LLM_CONTENT_TOKEN_CAP, LLM_CONTEXT_LINES
+)
+from rate_limiter import get_limiter, retry_after_from_error, estimate_tokens
+
+
+# 날짜·기간 관련 내용을 담은 줄 판별 패턴
+_DATE_LINE_RE = re.compile(
+    r'\d{1,2}\s*(?:월|[./-])\s*\d{1,2}|\d{1,2}\s*일|~|∼|까지|부터|'
+    r'신청|접수|모집|마감|기간|제출|지원|응모|등록'
+)
+
+# 생략 구간 표시
+_OMITTED = "(...)"
+
+# ============================================================================
+
+# 공유 클라이언트 관리
+
+_client = None
+
+def get_async_openai_client():
+    """
+    프로세스 전체에서 공유하는 비동기 OpenAI 클라이언트 반환
+
+    연결 풀을 재사용하며, 재시도는 호출 측 제한기가 담당하므로
+    클라이언트 자체 재시도는 사용하지 않음
+
+    Returns:
+        AsyncOpenAI: 공유 클라이언트
+    """
+    global _client
+    if _client is None:
+        _client = AsyncOpenAI(api_key=OPENAI_API_KEY, max_retries=0)
+    return _client
+
+async def close_llm_client():
+    """
+    공유 OpenAI 클라이언트 연결 종료
+    """
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+# ============================================================================
+
+# 구조화 응답 요청
+
+async def request_json(prompt, schema, max_tokens):
+    """
+    JSON 스키마를 강제한 Chat API 요청
+
+    openai_chat 제한기에서 요청 한도를 확보하고,
+    429 응답을 받으면 Retry-After만큼 대기 후 재시도
+
+    Args:
+        prompt (str): 사용자 프롬프트
+        schema (dict): response_format의 json_schema 값 (name, strict, schema)
+        max_tokens (int): 응답 최대 토큰 수
+
+    Returns:
+        str | None: 응답 JSON 문자열, 재시도 횟수를 넘기면 None
+
+    Raises:
+        Exception: 요청 한도 초과 외의 API 오류
+    """
+    limiter = get_limiter("openai_chat")
+    client = get_async_openai_client()
+
+    for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+        await limiter.acquire(estimate_tokens(prompt) + max_tokens)
+        try:
+            response = await client.chat.completions.create(
+                model=MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=TEMPERATURE,
+                max_tokens=max_tokens,
+                response_format={"type": "json_schema", "json_schema": schema}
+            )
+        except RateLimitError as e:
+            limiter.on_rate_limited(retry_after_from_error(e))
+            continue
+
+        return (response.choices[0].message.content or "").strip()
+
+    print("AI 요청 실패: 요청 한도 초과 재시도 횟수 초과")
+    return None
+
+# ============================================================================
+
+# 본문 길이 제한
+
+def trim_content(content, token_cap=LLM_CONTENT_TOKEN_CAP, context_lines=LLM_CONTEXT_LINES):
+    """
+    AI로 보낼 본문을 날짜 관련 부분 위주로 줄임
+
+    예상 토큰 수가 상한 이하면 그대로 반환하고, 넘으면 날짜·신청 관련 표현이 있는 줄과
+    앞뒤 context_lines줄만 남김. 그래도 넘으면 상한 길이에서 자름
+
+    Args:
+        content (str): 공지사항 본문
+        token_cap (int): 예상 토큰 수 상한
+        context_lines (int): 날짜 관련 줄 앞뒤로 함께 남길 줄 수
+
+    Returns:
+        str: 줄인 본문
+    """
+    if not content or estimate_tokens(content) <= token_cap:
+        return content
+
+    lines = content.splitlines()
+    keep = set()
+    for i, line in enumerate(lines):
+        if _DATE_LINE_RE.search(line):
+            keep.update(range(max(0, i - context_lines), min(len(lines), i + context_lines + 1)))
+
+    if not keep:
+        return content[:token_cap]
+
+    parts, previous = [], -1
+    for i in sorted(keep):
+        if i != previous + 1:
+            parts.append(_OMITTED)
+        parts.append(lines[i])
+        previous = i
+    if previous != len(lines) - 1:
+        parts.append(_OMITTED)
+
+    trimmed = "\n".join(parts)
+    return trimmed[:token_cap] if estimate_tokens(trimmed) > token_cap else trimmed
@@ -0,0 +1,277 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 텍스트 DB 읽기 모듈
+
+TextFileDB·NoticeStore.export_text가 기록한 notice_db.txt 형식의 파일을 다시 읽음
+- 파일을 메모리 매핑(mmap)하여 전체를 읽어 들이지 않고 필요한 블록만 디코딩
+- 처음 열 때 공지 ID → 바이트 범위 색인을 만들고 파일 옆(<파일>.idx)에 저장하여 다음에 재사용
+  (파일 크기·수정 시각이 바뀌면 다시 생성)
+- 공지는 순회하거나 ID로 조회할 때 그 블록만 파싱
+- 여러 줄 본문, 탭 들여쓰기된 이미지 URL·첨부파일 목록 처리
+
+블록 형식 (db.format_notice)
+    ID: ...
+    제목: ...
+    링크: <URL>?layout=unknown
+    게시 날짜: ...
+    카테고리: ...
+    시작일: YYYY-MM-DD 또는 없음
+    종료일: YYYY-MM-DD 또는 없음
+    이미지 URL: 없음 | 이미지 URL:\\n\\t- <URL> ...
+    첨부파일: 없음 | 첨부파일:\\n\\t- <이름 | URL> ...
+    내용:
+    <본문 여러 줄>
+
+    --------------------------------------------------
+"""
+
+import os
+import re
+import json
+import mmap
+
+
+# 블록 구분선: 빈 줄 + 50개 대시 + 빈 줄 (본문 안의 대시 줄과 구분하기 위해 다음 블록 시작 또는 파일 끝 확인)
+_SEPARATOR = re.compile(rb"\n-{50}\n\n(?=ID: |\Z)")
+
+# 블록 첫 줄의 공지 ID
+_ID_LINE = re.compile(rb"ID: ([^\n]*)\n")
+
+# 한 줄 필드 → save_notice 인자
+_FIELDS = {
+    "ID": "notice_id",
+    "제목": "title",
+    "링크": "link",
+    "게시 날짜": "pub_date",
+    "카테고리": "category",
+    "시작일": "start_date",
+    "종료일": "end_date",
+}
+
+# 목록 필드 → save_notice 인자
+_LIST_FIELDS = {
+    "이미지 URL": "image_urls",
+    "첨부파일": "attachments",
+}
+
+_LINK_SUFFIX = "?layout=unknown"
+
+# 색인 파일 형식 버전
+_INDEX_VERSION = 1
+
+
+def parse_block(text):
+    """
+    공지 블록 하나를 save_notice 인자와 같은 키의 dict로 변환
+
+    Args:
+        text (str): 구분선을 제외한 블록 텍스트
+
+    Returns:
+        dict: 공지 (notice_id, title, link, pub_date, category, start_date, end_date,
+              content, image_urls, attachments)
+    """
+    notice = {"image_urls": [], "attachments": [], "content": None}
+    lines = text.split("\n")
+    current_list = None
+
+    for i, line in enumerate(lines):
+        # 탭 들여쓰기된 목록 항목
+        if current_list is not None and line.startswith("\t- "):
+            notice[current_list].append(line[3:])
+            continue
+        current_list = None
+
+        key, sep, value = line.partition(": ")
+        if not sep:
+            key, value = line.rstrip(":"), ""
+
+        if key == "내용":
+            # 나머지 줄은 모두 본문 (마지막 줄바꿈은 형식에서 붙인 것)
+            content = "\n".join(lines[i + 1:])
+            if content.endswith("\n"):
+                content = content[:-1]
+            notice["content"] = None if content == "None" else content
+            break
+
+        if key in _LIST_FIELDS:
+            current_list = _LIST_FIELDS[key] if value != "없음" else None
+        elif key in _FIELDS:
+            notice[_FIELDS[key]] = value
+
+    for field in ("start_date", "end_date"):
+        if notice.get(field) in ("없음", "None", ""):
+            notice[field] = None
+    if notice.get("link", "").endswith(_LINK_SUFFIX):
+        notice["link"] = notice["link"][:-len(_LINK_SUFFIX)]
+    return notice
+
+# ============================================================================
+
+# 파일 읽기
+
+
+class NoticeFileReader:
+    """
+    notice_db.txt 형식 파일의 메모리 매핑 읽기 도구
+
+    같은 ID가 여러 번 기록된 파일(여러 날의 결과를 이어 붙인 파일 등)은
+    순회하면 모두 반환하고, ID로 조회하면 마지막 기록을 반환
+
+    Attributes:
+        filename (str): 파일 경로
+        index_path (str | None): 색인 파일 경로 (None이면 저장하지 않음)
+        entries (list[tuple[str, int, int]]): 파일 순서의 (공지 ID, 시작, 끝) 바이트 범위
+    """
+
+    def __init__(self, filename, index_path=""):
+        """
+        파일을 메모리 매핑하고 색인 로드 (없거나 오래되었으면 생성)
+
+        Args:
+            filename (str): 파일 경로
+            index_path (str | None): 색인 파일 경로 (기본값: "<파일>.idx", None이면 저장하지 않음)
+        """
+        self.filename = filename
+        self.index_path = f"{filename}.idx" if index_path == "" else index_path
+
+        self._file = open(filename, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        # 빈 파일은 매핑할 수 없음
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+        self.entries = self._load_index() or self._build_index()
+        self._by_id = {notice_id: (start, end) for notice_id, start, end in self.entries}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self._file.close()
+
+    # ------------------------------------------------------------------------
+    # 색인
+
+    def _signature(self):
+        stat = os.fstat(self._file.fileno())
+        return {"version": _INDEX_VERSION, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _load_index(self):
+        """
+        저장된 색인 로드 (파일 크기·수정 시각이 같을 때만)
+        """
+        if not self.index_path or not os.path.exists(self.index_path):
+            return None
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if index.get("signature") != self._signature():
+            return None
+        return [tuple(entry) for entry in index["entries"]]
+
+    def _build_index(self):
+        """
+        구분선을 찾아 블록별 바이트 범위 색인 생성 (블록 첫 줄의 ID만 디코딩)
+        """
+        entries = []
+        start = 0
+        size = len(self._mm)
+
+        while start < size:
+            match = _SEPARATOR.search(self._mm, start)
+            end = match.start() if match else size
+            id_match = _ID_LINE.match(self._mm, start, end)
+            if id_match:
+                entries.append((id_match.group(1).decode("utf-8", errors="replace"), start, end))
+            if not match:
+                break
+            start = match.end()
+
+        if self.index_path:
+            tmp_path = f"{self.index_path}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"signature": self._signature(), "entries": entries}, f)
+                os.replace(tmp_path, self.index_path)
+            except OSError as e:
+                print(f"색인 저장 실패 ({self.index_path}): {e}")
+        return entries
+
+    # ------------------------------------------------------------------------
+    # 조회
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, notice_id):
+        return str(notice_id) in self._by_id
+
+    def ids(self):
+        """
+        파일에 있는 공지 ID (파일 순서, 중복 제외)
+        """
+        return list(dict.fromkeys(notice_id for notice_id, _, _ in self.entries))
+
+    def raw(self, start, end):
+        """
+        바이트 범위의 블록 텍스트
+        """
+        return self._mm[start:end].decode("utf-8", errors="replace")
+
+    def get(self, notice_id):
+        """
+        ID로 공지 조회 (같은 ID가 여러 번 있으면 마지막 기록)
+
+        Args:
+            notice_id (str): 공지 ID
+
+        Returns:
+            dict | None: 공지 (없으면 None)
+        """
+        byte_range = self._by_id.get(str(notice_id))
+        return parse_block(self.raw(*byte_range)) if byte_range else None
+
+    def __iter__(self):
+        """
+        파일 순서대로 공지를 하나씩 파싱하여 반환
+        """
+        for _, start, end in self.entries:
+            yield parse_block(self.raw(start, end))
+
+    def latest(self):
+        """
+        ID별 마지막 기록만 파일 순서대로 반환 (중복 제거)
+        """
+        for notice_id, start, end in self.entries:
+            if self._by_id[notice_id] == (start, end):
+                yield parse_block(self.raw(start, end))
+
+# ============================================================================
+
+# 저장소로 옮기기
+
+
+def import_text_file(db, filename):
+    """
+    notice_db.txt 형식 파일의 공지를 저장소에 저장 (ID별 마지막 기록)
+
+    Args:
+        db: 데이터베이스 객체 (save_notice 제공)
+        filename (str): 파일 경로
+
+    Returns:
+        int: 저장한 공지 수
+    """
+    count = 0
+    with NoticeFileReader(filename) as reader:
+        for notice in reader.latest():
+            db.save_notice(**notice)
+            count += 1
+    return count
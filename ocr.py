@@ -0,0 +1,207 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 OCR 모듈
+
+공지 이미지를 동시에 내려받아 작업별 임시 PDF로 변환한 뒤 zerox로 텍스트 추출
+(OCR할 필요가 없는 이미지는 미리 거르고, 이미 OCR한 이미지는 캐시된 결과 재사용)
+"""
+
+import os
+import asyncio
+import tempfile
+
+import img2pdf
+from pyzerox import zerox
+
+from crawler_config import (
+    OUTPUT_DIR, MODEL,
+    OCR_CONCURRENCY,
+    RATE_LIMIT_MAX_RETRIES
+)
+from cpu_pool import run_cpu
+from http_cache import CacheMissError
+from http_client import get_http_client
+from image_preprocess import filter_images, prepare_images
+from ocr_cache import get_ocr_cache
+from rate_limiter import get_limiter, is_rate_limit_error, retry_after_from_error
+
+
+# 동시 zerox 작업 수 제한 (첫 사용 시 생성)
+_ocr_semaphore = None
+
+def _get_semaphore():
+    global _ocr_semaphore
+    if _ocr_semaphore is None:
+        _ocr_semaphore = asyncio.Semaphore(OCR_CONCURRENCY)
+    return _ocr_semaphore
+
+# ============================================================================
+
+# 이미지 다운로드 및 PDF 변환
+
+async def download_images(image_urls):
+    """
+    이미지 URL들을 동시에 다운로드 (HTTP 캐시 사용)
+
+    이미지도 캐시에 저장하므로 오프라인 재실행에서 이전에 받은 이미지로 OCR할 수 있음
+
+    Args:
+        image_urls (list[str]): 이미지 URL 리스트
+
+    Returns:
+        list[bytes]: 다운로드에 성공한 이미지 (원래 순서 유지)
+
+    Raises:
+        CacheMissError: 오프라인 재실행 중 캐시에 없는 이미지
+            (OCR 결과 없이 저장하여 기존 본문을 덮어쓰지 않도록 공지 처리를 실패로 둠)
+    """
+    client = get_http_client()
+
+    async def download(url):
+        try:
+            response = await client.fetch_cached(url)
+        except CacheMissError:
+            raise
+        except Exception as e:
+            print(f"이미지 다운로드 실패: {url} - {e}")
+            return None
+        return response.body
+
+    results = await asyncio.gather(*(download(url) for url in image_urls))
+    return [image for image in results if image]
+
+def images_to_pdf(images):
+    """
+    이미지들을 한 페이지에 한 장씩 담은 PDF로 변환
+
+    Args:
+        images (list[bytes]): 이미지 바이트 리스트
+
+    Returns:
+        bytes | None: PDF 바이트 (변환 실패 시 None)
+    """
+    try:
+        return img2pdf.convert(images)
+    except Exception as e:
+        print(f"이미지 -> PDF 변환 중 오류 발생: {e}")
+        return None
+
+# ============================================================================
+
+# OCR 처리
+
+async def get_text_from_pdf(file_path, page_count=1):
+    """
+    PDF에서 zerox로 페이지별 텍스트 추출
+
+    zerox는 페이지마다 Vision 모델을 호출하므로 페이지 수만큼 zerox 제한기에서
+    요청 한도를 확보하고, 429 응답을 받으면 Retry-After만큼 대기 후 재시도
+
+    Args:
+        file_path (str): PDF 파일 경로
+        page_count (int): PDF 페이지 수
+
+    Returns:
+        list[str] | None: 페이지별 텍스트
+    """
+    limiter = get_limiter("zerox")
+
+    for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+        for _ in range(page_count):
+            await limiter.acquire()
+
+        try:
+            result = await zerox(
+                file_path=file_path,
+                model=MODEL
+            )
+        except Exception as e:
+            if is_rate_limit_error(e):
+                limiter.on_rate_limited(retry_after_from_error(e))
+                continue
+            print(f"OCR 처리 실패: {e}")
+            return None
+
+        return [page.content for page in result.pages]
+
+    print("OCR 처리 실패: 요청 한도 초과 재시도 횟수 초과")
+    return None
+
+async def ocr_images(images):
+    """
+    이미지들을 OCR하여 페이지(이미지)별 텍스트 추출
+
+    작업마다 별도 임시 PDF 파일을 사용하므로 여러 작업을 동시에 실행해도 안전하며,
+    동시 zerox 작업 수는 OCR_CONCURRENCY로 제한
+
+    Args:
+        images (list[bytes]): 이미지 바이트 리스트
+
+    Returns:
+        list[str] | None: 이미지별 텍스트 (PDF 변환 또는 OCR 실패 시 None)
+    """
+    pdf_bytes = await asyncio.to_thread(images_to_pdf, images)
+    if not pdf_bytes:
+        return None
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    fd, pdf_path = tempfile.mkstemp(suffix=".pdf", dir=OUTPUT_DIR)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf_bytes)
+
+        async with _get_semaphore():
+            return await get_text_from_pdf(pdf_path, len(images))
+
+    finally:
+        # 임시 파일 정리
+        try:
+            os.remove(pdf_path)
+        except OSError as e:
+            print(f"임시 파일 삭제 실패: {e}")
+
+async def image_urls_to_text(image_urls):
+    """
+    이미지 URL들에서 텍스트 추출 (동시 다운로드 + 전처리 + 캐시 조회 + PDF 변환 + OCR)
+
+    작은 이미지·중복 이미지를 거른 뒤 이미지별로 OCR 캐시를 먼저 확인하고,
+    캐시에 없는 이미지만 축소하여 OCR한 뒤 원래 이미지 순서대로 텍스트를 합침
+
+    Args:
+        image_urls (list[str]): 이미지 URL 리스트
+
+    Returns:
+        str | None: 추출된 텍스트 (OCR할 이미지가 없으면 None, 변환·OCR 실패 시 빈 문자열)
+    """
+    images = await download_images(image_urls)
+    if not images:
+        print("다운로드된 이미지가 없습니다")
+        return None
+
+    images = await run_cpu(filter_images, images)
+    if not images:
+        print("OCR할 이미지가 없습니다")
+        return None
+
+    cache = get_ocr_cache()
+    keys = await asyncio.to_thread(lambda: [cache.keys(image) for image in images])
+    texts = [cache.get(image_keys) for image_keys in keys]
+
+    missing = [i for i, text in enumerate(texts) if text is None]
+    if missing:
+        prepared = await run_cpu(prepare_images, [images[i] for i in missing])
+        pages = await ocr_images(prepared)
+        if pages is None:
+            print("OCR 텍스트 추출 실패")
+            if len(missing) == len(images):
+                return ""
+        elif len(pages) == len(missing):
+            # 이미지 한 장이 PDF 한 페이지이므로 페이지별 결과를 이미지별로 캐시
+            for i, page in zip(missing, pages):
+                texts[i] = page
+                cache.set(keys[i], page)
+        else:
+            # 여러 프레임 이미지 등으로 페이지 수가 다르면 캐시하지 않고 순서대로 합침
+            texts[missing[0]] = "\n\n".join(pages)
+
+    return "".join(text + "\n\n" for text in texts if text is not None)
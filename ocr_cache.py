@@ -0,0 +1,132 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 OCR 결과 캐시 모듈
+
+여러 공지에 반복 사용되는 포스터·배너 이미지의 OCR 결과를
+이미지 내용 해시 기준으로 저장하여 재사용
+
+템플릿이 같은 포스터는 날짜만 달라도 지각 해시(dHash)가 같게 나오므로
+지각 해시만 일치하는 이미지에는 캐시된 텍스트를 돌려주지 않음
+"""
+
+import hashlib
+
+from crawler_config import (
+    MODEL,
+    OCR_CACHE_PATH, OCR_CACHE_MAX_ENTRIES
+)
+from kv_cache import LRUCache
+
+
+# ============================================================================
+
+# 이미지 해시
+
+def content_hash(image):
+    """
+    이미지 바이트의 SHA-256 해시
+
+    Args:
+        image (bytes): 이미지 바이트
+
+    Returns:
+        str: 16진수 해시
+    """
+    return hashlib.sha256(image).hexdigest()
+
+# ============================================================================
+
+# OCR 결과 캐시
+
+class OCRCache:
+    """
+    이미지 단위 OCR 결과 캐시
+
+    이미지 내용 해시(SHA-256)가 같은 이미지만 적중으로 처리.
+    OCR 모델이 바뀌면 다른 키가 되도록 모델명을 키에 포함
+
+    Attributes:
+        store (LRUCache): 영구 저장소
+        hits (int): 이미지 단위 캐시 적중 횟수
+        misses (int): 이미지 단위 캐시 미적중 횟수
+    """
+
+    def __init__(self, path=OCR_CACHE_PATH, max_entries=OCR_CACHE_MAX_ENTRIES):
+        """
+        OCRCache 초기화
+
+        Args:
+            path (str): SQLite 파일 경로
+            max_entries (int): 최대 저장 항목 수
+        """
+        self.store = LRUCache(path, max_entries)
+        self.hits = 0
+        self.misses = 0
+
+    def keys(self, image):
+        """
+        이미지의 캐시 키 목록 (내용 해시)
+
+        Args:
+            image (bytes): 이미지 바이트
+
+        Returns:
+            list[str]: 캐시 키 목록
+        """
+        return [f"{MODEL}:sha256:{content_hash(image)}"]
+
+    def get(self, keys):
+        """
+        캐시된 OCR 텍스트 조회
+
+        Args:
+            keys (list[str]): keys()로 만든 캐시 키 목록
+
+        Returns:
+            str | None: OCR 텍스트 (없으면 None)
+        """
+        for key in keys:
+            text = self.store.get(key)
+            if text is not None:
+                self.hits += 1
+                return text
+        self.misses += 1
+        return None
+
+    def set(self, keys, text):
+        """
+        OCR 텍스트 저장
+
+        Args:
+            keys (list[str]): keys()로 만든 캐시 키 목록
+            text (str): OCR 텍스트
+        """
+        for key in keys:
+            self.store.set(key, text)
+
+    def stats(self):
+        """
+        캐시 적중 통계
+
+        Returns:
+            dict: hits, misses, entries
+        """
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.store)}
+
+# ============================================================================
+
+# 공유 캐시 관리
+
+_ocr_cache = None
+
+def get_ocr_cache():
+    """
+    프로세스 전체에서 공유하는 OCR 결과 캐시 반환
+
+    Returns:
+        OCRCache: 공유 캐시
+    """
+    global _ocr_cache
+    if _ocr_cache is None:
+        _ocr_cache = OCRCache()
+    return _ocr_cache
@@ -0,0 +1,341 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 신청기간 일괄 추출 모듈
+
+여러 공지를 한 번의 OpenAI 요청으로 처리하는 일괄 추출과
+대량 백필용 Batch API(파일 기반 비동기 작업) 제출/수집 기능 제공
+"""
+
+import os
+import json
+import asyncio
+from datetime import datetime
+
+from crawler_config import (
+    MODEL, TEMPERATURE, MAX_TOKENS, PROMPT,
+    PERIOD_BATCH_PROMPT, PERIOD_BATCH_TOKEN_BUDGET,
+    BATCH_JOB_DIR
+)
+from llm_client import get_async_openai_client, request_json, trim_content
+from rate_limiter import estimate_tokens
+from utils import (
+    PERIOD_SCHEMA,
+    get_period_cache, period_cache_key,
+    extract_period_with_llm, parse_application_period
+)
+
+
+# Batch API 작업의 실패 종료 상태
+_BATCH_FAILED_STATUSES = {"failed", "expired", "cancelled"}
+
+
+# 일괄 추출 응답 JSON 스키마 (structured output)
+PERIOD_BATCH_SCHEMA = {
+    "name": "application_periods",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "results": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "notice_id": {"type": "string"},
+                        "has_period": {"type": "boolean"},
+                        "start_date": {"type": ["string", "null"]},
+                        "end_date": {"type": ["string", "null"]},
+                    },
+                    "required": ["notice_id", "has_period", "start_date", "end_date"],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["results"],
+        "additionalProperties": False,
+    },
+}
+
+# ============================================================================
+
+# 일괄 요청 구성
+
+def build_batches(notices, token_budget=PERIOD_BATCH_TOKEN_BUDGET):
+    """
+    공지 목록을 예상 토큰 합계가 예산 이하인 묶음으로 분할
+
+    예산보다 큰 공지 하나는 단독 묶음으로 구성
+
+    Args:
+        notices (list[tuple[str, str]]): (공지 ID, 본문) 목록
+        token_budget (int): 묶음당 본문 예상 토큰 합계 상한
+
+    Returns:
+        list[list[tuple[str, str]]]: 묶음 목록
+    """
+    batches, current, used = [], [], 0
+
+    for notice_id, content in notices:
+        tokens = estimate_tokens(content)
+        if current and used + tokens > token_budget:
+            batches.append(current)
+            current, used = [], 0
+        current.append((notice_id, content))
+        used += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+def _format_notices(batch):
+    return "\n\n".join(f"### 공지 ID: {notice_id}\n{content}" for notice_id, content in batch)
+
+# ============================================================================
+
+# 응답 검증
+
+def _is_valid_date(value):
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+        return True
+    except (TypeError, ValueError):
+        return False
+
+def validate_period_entry(entry):
+    """
+    일괄 응답의 공지별 결과 검증
+
+    Args:
+        entry (dict): has_period, start_date, end_date
+
+    Returns:
+        tuple[str | None, str | None] | None: (시작일, 종료일), 형식이 잘못되면 None
+    """
+    if not isinstance(entry, dict):
+        return None
+
+    start_date, end_date = entry.get("start_date"), entry.get("end_date")
+
+    if not entry.get("has_period"):
+        return (None, None) if start_date is None and end_date is None else None
+
+    if not _is_valid_date(end_date):
+        return None
+    if start_date is not None and (not _is_valid_date(start_date) or start_date > end_date):
+        return None
+    return start_date, end_date
+
+# ============================================================================
+
+# 일괄 추출
+
+async def _extract_batch(batch):
+    """
+    묶음 하나를 한 번의 요청으로 처리
+
+    Returns:
+        dict[str, tuple[str | None, str | None]]: 검증을 통과한 공지별 결과
+    """
+    prompt = PERIOD_BATCH_PROMPT.format(notices=_format_notices(batch))
+
+    try:
+        ai_response = await request_json(prompt, PERIOD_BATCH_SCHEMA, MAX_TOKENS * len(batch))
+    except Exception as e:
+        print(f"AI 신청기간 일괄 추출 실패: {e}")
+        return {}
+
+    if ai_response is None:
+        return {}
+
+    try:
+        entries = json.loads(ai_response)["results"]
+    except (TypeError, ValueError, KeyError) as e:
+        print(f"일괄 추출 응답 파싱 오류: {e}")
+        return {}
+
+    expected = {notice_id for notice_id, _ in batch}
+    results = {}
+    for entry in entries:
+        notice_id = str(entry.get("notice_id")) if isinstance(entry, dict) else None
+        period = validate_period_entry(entry)
+        if notice_id in expected and period is not None:
+            results[notice_id] = period
+    return results
+
+async def extract_periods_batch(notices):
+    """
+    여러 공지의 신청기간을 일괄 추출
+
+    본문은 날짜 관련 부분 위주로 줄이고, 캐시에 있는 공지는 건너뛰고,
+    나머지를 토큰 예산 단위로 묶어 요청.
+    응답에서 빠졌거나 검증에 실패한 공지는 개별 요청으로 다시 처리
+
+    Args:
+        notices (list[tuple[str, str]]): (공지 ID, 본문) 목록
+
+    Returns:
+        dict[str, tuple[str | None, str | None]]: 공지 ID별 (시작일, 종료일)
+    """
+    cache = get_period_cache()
+    results, pending = {}, []
+
+    for notice_id, content in notices:
+        content = trim_content(content)
+        cached = cache.get(period_cache_key(content))
+        if cached is not None:
+            results[notice_id] = (cached["start_date"], cached["end_date"])
+        else:
+            pending.append((notice_id, content))
+
+    contents = dict(pending)
+    batch_results = await asyncio.gather(*(_extract_batch(batch) for batch in build_batches(pending)))
+
+    for batch_result in batch_results:
+        for notice_id, (start_date, end_date) in batch_result.items():
+            results[notice_id] = (start_date, end_date)
+            cache.set(
+                period_cache_key(contents[notice_id]),
+                {"start_date": start_date, "end_date": end_date}
+            )
+
+    # 검증 실패 공지는 개별 요청으로 처리
+    failed = [notice_id for notice_id, _ in pending if notice_id not in results]
+    if failed:
+        print(f"일괄 추출 결과가 없는 공지 {len(failed)}건을 개별 요청으로 처리합니다.")
+        periods = await asyncio.gather(*(extract_period_with_llm(contents[notice_id]) for notice_id in failed))
+        results.update(zip(failed, periods))
+
+    return results
+
+# ============================================================================
+
+# Batch API (파일 기반 비동기 작업)
+
+async def submit_batch_job(notices, job_dir=BATCH_JOB_DIR):
+    """
+    공지 목록을 OpenAI Batch API 작업으로 제출
+
+    공지마다 개별 추출 프롬프트로 요청을 만들어 JSONL 파일로 업로드하고,
+    결과는 24시간 내에 처리되어 collect_batch_job으로 수집.
+    수집한 결과는 신청기간 캐시에도 저장되므로 이후 크롤링에서 AI 호출 없이 재사용
+
+    Args:
+        notices (list[tuple[str, str]]): (공지 ID, 본문) 목록
+        job_dir (str): 입력/결과 파일 저장 디렉토리
+
+    Returns:
+        str: 배치 작업 ID
+    """
+    os.makedirs(job_dir, exist_ok=True)
+    input_path = os.path.join(job_dir, f"input_{datetime.now():%Y%m%d_%H%M%S}.jsonl")
+
+    notices = [(notice_id, trim_content(content)) for notice_id, content in notices]
+
+    with open(input_path, "w", encoding="utf-8") as f:
+        for notice_id, content in notices:
+            request = {
+                "custom_id": str(notice_id),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": MODEL,
+                    "messages": [{"role": "user", "content": PROMPT.format(content=content)}],
+                    "temperature": TEMPERATURE,
+                    "max_tokens": MAX_TOKENS,
+                    "response_format": {"type": "json_schema", "json_schema": PERIOD_SCHEMA},
+                },
+            }
+            f.write(json.dumps(request, ensure_ascii=False) + "\n")
+
+    client = get_async_openai_client()
+    with open(input_path, "rb") as f:
+        input_file = await client.files.create(file=f, purpose="batch")
+
+    batch = await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+
+    # 결과 수집 시 캐시에 저장할 수 있도록 공지 ID별 캐시 키 기록
+    keys = {str(notice_id): period_cache_key(content) for notice_id, content in notices}
+    with open(os.path.join(job_dir, f"keys_{batch.id}.json"), "w", encoding="utf-8") as f:
+        json.dump(keys, f)
+
+    print(f"배치 작업 제출: {batch.id} (공지 {len(notices)}건, 입력 파일: {input_path})")
+    return batch.id
+
+async def collect_batch_job(batch_id, job_dir=BATCH_JOB_DIR):
+    """
+    Batch API 작업 결과 수집
+
+    Args:
+        batch_id (str): 배치 작업 ID
+        job_dir (str): 결과 파일 저장 디렉토리
+
+    Returns:
+        dict[str, tuple[str | None, str | None]] | None:
+            공지 ID별 (시작일, 종료일), 작업이 아직 끝나지 않았으면 None
+
+    Raises:
+        RuntimeError: 작업이 실패·만료·취소된 경우
+    """
+    client = get_async_openai_client()
+    batch = await client.batches.retrieve(batch_id)
+
+    if batch.status in _BATCH_FAILED_STATUSES:
+        raise RuntimeError(f"배치 작업 {batch_id} 종료 상태: {batch.status}")
+
+    if batch.status != "completed":
+        print(f"배치 작업 {batch_id} 상태: {batch.status}")
+        return None
+
+    output = (await client.files.content(batch.output_file_id)).text
+
+    os.makedirs(job_dir, exist_ok=True)
+    with open(os.path.join(job_dir, f"output_{batch_id}.jsonl"), "w", encoding="utf-8") as f:
+        f.write(output)
+
+    keys_path = os.path.join(job_dir, f"keys_{batch_id}.json")
+    keys = {}
+    if os.path.exists(keys_path):
+        with open(keys_path, "r", encoding="utf-8") as f:
+            keys = json.load(f)
+
+    cache = get_period_cache()
+    results = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        try:
+            ai_response = record["response"]["body"]["choices"][0]["message"]["content"].strip()
+        except (KeyError, IndexError, TypeError):
+            continue
+        period = parse_application_period(ai_response)
+        if period is None:
+            continue
+
+        notice_id = record["custom_id"]
+        results[notice_id] = period
+        if notice_id in keys:
+            cache.set(keys[notice_id], {"start_date": period[0], "end_date": period[1]})
+    return results
+
+async def wait_batch_job(batch_id, poll_interval=60, job_dir=BATCH_JOB_DIR):
+    """
+    Batch API 작업이 끝날 때까지 주기적으로 확인 후 결과 반환
+
+    Args:
+        batch_id (str): 배치 작업 ID
+        poll_interval (float): 상태 확인 간격 (초)
+        job_dir (str): 결과 파일 저장 디렉토리
+
+    Returns:
+        dict[str, tuple[str | None, str | None]]: 공지 ID별 (시작일, 종료일)
+    """
+    while True:
+        results = await collect_batch_job(batch_id, job_dir)
+        if results is not None:
+            return results
+        await asyncio.sleep(poll_interval)
@@ -0,0 +1,206 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 요청 속도 제한 모듈
+
+외부 서비스(학교 홈페이지, OpenAI, zerox OCR)별 토큰 버킷으로 요청 속도를 제어
+"""
+
+import asyncio
+import time
+from email.utils import parsedate_to_datetime
+
+from crawler_config import RATE_LIMITS, RATE_LIMIT_DEFAULT_BACKOFF
+
+
+# ============================================================================
+
+# 토큰 버킷
+
+class TokenBucket:
+    """
+    분당 허용량을 기준으로 일정하게 채워지는 토큰 버킷
+
+    대기 중인 요청은 도착 순서대로 처리되어 특정 작업이 계속 밀리지 않음
+
+    Attributes:
+        rate (float): 초당 충전량
+        capacity (float): 최대 저장량 (1분 허용량)
+        tokens (float): 현재 남은 토큰
+    """
+
+    def __init__(self, per_minute):
+        """
+        TokenBucket 초기화
+
+        Args:
+            per_minute (int): 분당 허용량
+        """
+        self.rate = per_minute / 60
+        self.capacity = float(per_minute)
+        self.tokens = float(per_minute)
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self, amount=1):
+        """
+        토큰을 사용할 수 있을 때까지 대기 후 차감
+
+        Args:
+            amount (float): 사용할 토큰 수 (최대 저장량을 넘으면 최대 저장량으로 제한)
+        """
+        amount = min(amount, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= amount
+
+
+class UpstreamLimiter:
+    """
+    외부 서비스 하나에 대한 요청 수(RPM)·토큰 수(TPM) 제한
+
+    Retry-After 응답을 받으면 해당 시간 동안 모든 요청을 멈춤
+
+    Attributes:
+        name (str): 서비스 이름
+        requests (TokenBucket): 분당 요청 수 버킷
+        tokens (TokenBucket | None): 분당 토큰 수 버킷 (제한 없으면 None)
+    """
+
+    def __init__(self, name, rpm, tpm=None):
+        """
+        UpstreamLimiter 초기화
+
+        Args:
+            name (str): 서비스 이름
+            rpm (int): 분당 요청 수
+            tpm (int | None): 분당 토큰 수
+        """
+        self.name = name
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm) if tpm else None
+        self.blocked_until = 0.0
+
+    async def acquire(self, tokens=0):
+        """
+        요청 1건(및 예상 토큰 수)을 사용할 수 있을 때까지 대기
+
+        Args:
+            tokens (int): 요청에 사용될 예상 토큰 수
+        """
+        # Retry-After로 지정된 시간까지 대기
+        delay = self.blocked_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        await self.requests.acquire()
+        if self.tokens and tokens:
+            await self.tokens.acquire(tokens)
+
+    def on_rate_limited(self, retry_after=None):
+        """
+        429 응답을 받았을 때 호출하여 이후 요청을 지연
+
+        Args:
+            retry_after (float | None): 서버가 알려준 대기 시간(초)
+        """
+        if retry_after is None:
+            retry_after = RATE_LIMIT_DEFAULT_BACKOFF
+
+        self.blocked_until = max(self.blocked_until, time.monotonic() + retry_after)
+        print(f"[{self.name}] 요청 한도 초과, {retry_after:.1f}초 대기")
+
+# ============================================================================
+
+# 서비스별 제한기 관리
+
+_limiters = {}
+
+def get_limiter(name):
+    """
+    서비스 이름에 해당하는 공유 제한기 반환 (RATE_LIMITS 설정 사용)
+
+    Args:
+        name (str): 서비스 이름 ("school", "openai_chat", "zerox" 등)
+
+    Returns:
+        UpstreamLimiter: 공유 제한기
+    """
+    if name not in _limiters:
+        budget = RATE_LIMITS[name]
+        _limiters[name] = UpstreamLimiter(name, budget["rpm"], budget.get("tpm"))
+    return _limiters[name]
+
+# ============================================================================
+
+# 429 응답 처리
+
+def parse_retry_after(value):
+    """
+    Retry-After 헤더 값을 초 단위로 변환
+
+    Args:
+        value (str | None): 초 단위 숫자 또는 HTTP 날짜
+
+    Returns:
+        float | None: 대기 시간(초), 해석할 수 없으면 None
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def is_rate_limit_error(error):
+    """
+    예외가 요청 한도 초과(429)로 인한 것인지 확인
+
+    Args:
+        error (Exception): 발생한 예외
+
+    Returns:
+        bool: 요청 한도 초과 여부
+    """
+    if getattr(error, "status_code", None) == 429:
+        return True
+    return "rate limit" in str(error).lower()
+
+def retry_after_from_error(error):
+    """
+    예외에 포함된 HTTP 응답에서 Retry-After 값 추출
+
+    Args:
+        error (Exception): 발생한 예외
+
+    Returns:
+        float | None: 대기 시간(초)
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    return parse_retry_after(headers.get("retry-after"))
+
+def estimate_tokens(text):
+    """
+    텍스트의 대략적인 토큰 수 추정 (한글은 글자당 약 1토큰)
+
+    Args:
+        text (str): 입력 텍스트
+
+    Returns:
+        int: 예상 토큰 수
+    """
+    return len(text) if text else 0
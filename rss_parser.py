@@ -0,0 +1,67 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 RSS 파서 모듈
+
+RSS 페이지 전체를 트리로 만들지 않고 lxml iterparse로 item을 하나씩 읽어
+필요한 필드만 담은 가벼운 레코드로 반환. 처리한 요소는 바로 해제하며,
+호출 측이 중단 조건에 도달해 순회를 멈추면 남은 부분은 파싱하지 않음
+"""
+
+import io
+from collections import namedtuple
+
+from lxml import etree
+
+
+# RSS item 레코드
+RssItem = namedtuple("RssItem", ["title", "link", "pub_date", "category", "description"])
+
+# item 하위 요소 이름 → RssItem 필드
+_FIELDS = {
+    "title": "title",
+    "link": "link",
+    "pubDate": "pub_date",
+    "category": "category",
+    "description": "description",
+}
+
+
+def iter_items(body):
+    """
+    RSS 본문에서 item을 순서대로 읽어 반환
+
+    같은 이름의 하위 요소가 여러 개면 첫 번째 값을 사용하고,
+    없는 필드는 빈 문자열. XML이 중간에 깨져 있으면 그 앞까지만 반환
+
+    Args:
+        body (bytes): RSS 응답 본문
+
+    Yields:
+        RssItem: item 레코드
+    """
+    if not body:
+        return
+
+    parser = etree.iterparse(io.BytesIO(body), events=("end",), tag="{*}item",
+                             resolve_entities=False, no_network=True)
+    try:
+        for _, element in parser:
+            values = {}
+            for child in element:
+                if not isinstance(child.tag, str):
+                    # 주석·처리 지시문
+                    continue
+                field = _FIELDS.get(etree.QName(child).localname)
+                if field and field not in values:
+                    values[field] = "".join(child.itertext()).strip()
+
+            # 처리한 item과 앞선 형제 요소 해제
+            element.clear()
+            parent = element.getparent()
+            while parent is not None and element.getprevious() is not None:
+                del parent[0]
+
+            yield RssItem(**{field: values.get(field, "") for field in RssItem._fields})
+
+    except etree.XMLSyntaxError as e:
+        print(f"RSS 파싱 오류: {e}")
@@ -0,0 +1,258 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+한성대학교 공지사항 크롤링 시스템 검색 색인 모듈
+
+SQLite 저장소 안에 FTS5 역색인을 두고 제목·카테고리·본문을 BM25로 검색
+- 한국어는 형태소 분석 없이 음절 바이그램(2글자씩 겹쳐 자른 토큰)으로 색인하여
+  "장학금"이 "국가장학금신청", "장학금을" 등 붙여 쓴 표현과도 일치
+- 영문·숫자는 소문자로 바꾼 단어 단위로 색인
+- 변경 순번(change_seq) 기준으로 바뀐 공지만 다시 색인 (크롤링 마지막 단계에서 실행)
+- 카테고리와 신청기간(start_date/end_date)으로 거를 수 있어 "이번 주 신청 가능한 장학 공지" 같은
+  질의를 파일 전체를 읽지 않고 인덱스만으로 처리
+
+사용 예:
+    with NoticeStore() as db:
+        index = NoticeSearchIndex(db)
+        index.search("장학금", category="장학", open_from="2025-03-03", open_to="2025-03-09")
+"""
+
+import re
+import sqlite3
+
+from crawler_config import SEARCH_BM25_WEIGHTS, SEARCH_RESULT_LIMIT
+
+
+# 토큰화 방식이 바뀌면 올려서 다음 갱신 때 모든 공지를 다시 색인
+_TOKENIZER_VERSION = 1
+
+# 색인 진행 상황(마지막으로 색인한 변경 순번)을 기록하는 sync_state 대상 이름
+_CURSOR_TARGET = f"search_index:v{_TOKENIZER_VERSION}"
+
+# 한글 음절 연속 또는 그 밖의 문자·숫자 연속
+_WORD = re.compile(r"[가-힣]+|[^\W_가-힣]+")
+
+# 바이그램으로 만든 토큰을 공백으로 이어 저장하므로 FTS5는 공백 기준으로만 나눔
+_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS notice_search USING fts5(
+    title, category, content,
+    tokenize = 'unicode61 remove_diacritics 0'
+)
+"""
+
+
+def tokenize(text):
+    """
+    검색용 토큰 목록 생성
+
+    한글 단어는 음절 바이그램(한 글자 단어는 그대로), 그 밖의 단어는 소문자 단어 하나
+
+    Args:
+        text (str | None): 원문
+
+    Returns:
+        list[str]: 토큰 목록 (원문 순서)
+    """
+    tokens = []
+    for word in _WORD.findall((text or "").lower()):
+        if len(word) > 1 and "가" <= word[0] <= "힣":
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def build_match_query(query):
+    """
+    검색어를 FTS5 MATCH 식으로 변환
+
+    단어마다 바이그램을 연속 구(phrase)로 묶고 모든 단어를 포함하는 공지만 일치.
+    한 글자 한글 단어는 그 글자로 시작하는 바이그램의 접두사 검색으로 처리.
+    토큰을 큰따옴표로 감싸므로 검색어의 FTS5 연산자 문자는 무시됨
+
+    Args:
+        query (str): 검색어
+
+    Returns:
+        str | None: MATCH 식 (검색할 단어가 없으면 None)
+    """
+    phrases = []
+    for word in _WORD.findall(query.lower()):
+        if "가" <= word[0] <= "힣" and len(word) == 1:
+            phrases.append(f'"{word}" *')
+        else:
+            phrases.append('"' + " ".join(tokenize(word)) + '"')
+    return " AND ".join(phrases) or None
+
+# ============================================================================
+
+# 검색 색인
+
+
+class NoticeSearchIndex:
+    """
+    NoticeStore 공지의 FTS5 검색 색인
+
+    색인 테이블(notice_search)의 rowid는 notices 테이블의 rowid와 같으므로
+    검색 결과를 저장소의 카테고리·신청기간 인덱스와 바로 조인하여 거름
+
+    Attributes:
+        db (NoticeStore): SQLite 저장소
+        weights (tuple[float, float, float]): BM25 열 가중치 (제목, 카테고리, 본문)
+    """
+
+    def __init__(self, db, weights=SEARCH_BM25_WEIGHTS):
+        """
+        NoticeSearchIndex 초기화 (색인 테이블이 없으면 생성)
+
+        Args:
+            db (NoticeStore): SQLite 저장소
+            weights (tuple[float, float, float]): BM25 열 가중치
+
+        Raises:
+            sqlite3.OperationalError: SQLite가 FTS5 없이 빌드된 경우
+        """
+        self.db = db
+        self.weights = tuple(weights)
+        self.conn = db.conn
+        self.conn.execute(_SCHEMA)
+
+    # ------------------------------------------------------------------------
+    # 색인 갱신
+
+    def update(self, batch_size=500):
+        """
+        마지막 색인 이후 바뀐 공지만 다시 색인
+
+        batch_size건마다 색인과 진행 상황을 한 트랜잭션으로 기록하므로
+        중간에 중단되어도 다음 갱신에서 이어서 처리
+
+        Args:
+            batch_size (int): 한 트랜잭션으로 색인할 공지 수
+
+        Returns:
+            int: 색인한 공지 수
+        """
+        self.db.flush()
+        cursor = self.db.get_sync_cursor(_CURSOR_TARGET)
+        count = 0
+
+        while True:
+            rows = self.conn.execute(
+                "SELECT rowid, title, category, content, change_seq FROM notices"
+                " WHERE change_seq > ? ORDER BY change_seq LIMIT ?",
+                (cursor, batch_size)
+            ).fetchall()
+            if not rows:
+                break
+
+            with self.conn:
+                self.conn.executemany(
+                    "DELETE FROM notice_search WHERE rowid = ?", [(row["rowid"],) for row in rows]
+                )
+                self.conn.executemany(
+                    "INSERT INTO notice_search (rowid, title, category, content) VALUES (?, ?, ?, ?)",
+                    [
+                        (row["rowid"], *(" ".join(tokenize(row[column])) for column in ("title", "category", "content")))
+                        for row in rows
+                    ]
+                )
+                cursor = rows[-1]["change_seq"]
+                self.conn.execute(
+                    "INSERT INTO sync_state (target, cursor) VALUES (?, ?)"
+                    " ON CONFLICT(target) DO UPDATE SET cursor = excluded.cursor,"
+                    " updated_at = datetime('now', 'localtime')",
+                    (_CURSOR_TARGET, cursor)
+                )
+            count += len(rows)
+            if len(rows) < batch_size:
+                break
+
+        return count
+
+    def rebuild(self):
+        """
+        색인을 비우고 모든 공지를 다시 색인
+
+        Returns:
+            int: 색인한 공지 수
+        """
+        with self.conn:
+            self.conn.execute("DELETE FROM notice_search")
+            self.conn.execute("DELETE FROM sync_state WHERE target LIKE 'search_index:%'")
+        return self.update()
+
+    # ------------------------------------------------------------------------
+    # 검색
+
+    def search(self, query=None, category=None, open_from=None, open_to=None, limit=SEARCH_RESULT_LIMIT,
+               include_duplicates=False):
+        """
+        공지 검색
+
+        검색어가 있으면 BM25 점수순, 없으면 조건에 맞는 공지를 신청 마감이 빠른 순으로 반환
+
+        Args:
+            query (str, optional): 검색어 (공백으로 구분한 단어를 모두 포함하는 공지)
+            category (str, optional): 카테고리
+            open_from (str, optional): 신청기간이 이 날짜(YYYY-MM-DD)와 open_to 사이에 걸친 공지만
+            open_to (str, optional): 신청기간 조회 구간의 끝 (YYYY-MM-DD, 기본값: open_from)
+            limit (int): 최대 결과 수
+            include_duplicates (bool): 다른 공지의 유사 중복(여러 카테고리에 다시 올린 공지) 포함 여부
+
+        Returns:
+            list[dict]: 공지 목록 (NoticeStore.find 결과 키 + score, 검색어가 없으면 score는 None)
+        """
+        self.db.flush()
+        conditions, params = [], []
+
+        if category is not None:
+            conditions.append("n.category = ?")
+            params.append(category)
+        if not include_duplicates:
+            conditions.append("n.duplicate_of IS NULL")
+        if open_from is not None or open_to is not None:
+            # 신청기간 [start_date, end_date]와 조회 구간 [open_from, open_to]가 겹치는 공지
+            # (시작일이 없는 공지는 종료일까지 신청 가능한 것으로 봄)
+            conditions.append("n.end_date >= ? AND (n.start_date IS NULL OR n.start_date <= ?)")
+            params.extend([open_from or open_to, open_to or open_from])
+
+        if query and query.strip():
+            match = build_match_query(query)
+            if match is None:
+                return []
+            sql = (
+                "SELECT n.notice_id, -bm25(notice_search, ?, ?, ?) AS score"
+                " FROM notice_search JOIN notices n ON n.rowid = notice_search.rowid"
+                " WHERE notice_search MATCH ?"
+            )
+            params = [*self.weights, match, *params]
+            order = "score DESC"
+        else:
+            sql = "SELECT n.notice_id, NULL AS score FROM notices n WHERE 1"
+            order = "n.end_date IS NULL, n.end_date, n.pub_date DESC"
+
+        for condition in conditions:
+            sql += f" AND {condition}"
+        sql += f" ORDER BY {order} LIMIT ?"
+        params.append(limit)
+
+        ranked = self.conn.execute(sql, params).fetchall()
+        by_id = {notice["notice_id"]: notice for notice in self.db.find(notice_ids=[row[0] for row in ranked])}
+        return [{**by_id[notice_id], "score": score} for notice_id, score in ranked if notice_id in by_id]
+
+
+def update_search_index(db):
+    """
+    저장소의 검색 색인 갱신 (크롤링 마지막 단계)
+
+    Args:
+        db (NoticeStore): SQLite 저장소
+
+    Returns:
+        int | None: 색인한 공지 수 (SQLite에 FTS5가 없으면 None)
+    """
+    try:
+        return NoticeSearchIndex(db).update()
+    except sqlite3.OperationalError as e:
+        print(f"검색 색인을 갱신하지 못했습니다: {e}", flush=True)
+        return None
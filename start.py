@@ -2,23 +2,226 @@
 HANA (Hansung AI for Notice & Assistance)
 한성대학교 공지사항 크롤링 시스템 실행 파일
 
-초기 크롤링 및 일일 크롤링 실행
+초기 크롤링 및 일일 크롤링 실행 (daemon: 연결·캐시를 유지한 채 주기적으로 크롤링)
 """
 
 import asyncio
+import os
 import sys
 import time
+from datetime import datetime
 
-from db import TextFileDB
-from crawling import rss_crawl
+from crawler_config import (
+    DB_BACKEND, DB_PATH, DB_TEXT_FILENAME, REVALIDATE_OPEN_NOTICES,
+    SYNC_ENABLED, EXPORT_PARQUET_ENABLED
+)
+from db import NoticeStore, TextFileDB
+from crawling import crawl_boards, revalidate_open_notices
+from checkpoint import pending_checkpoints
+from exporter import write_jsonl, write_parquet, sync_notices
+from notice_reader import import_text_file
+from period_batch import submit_batch_job, collect_batch_job, wait_batch_job
+from search_index import NoticeSearchIndex
+from embedding_index import get_embedding_index
+from cpu_pool import close_cpu_pool
+from http_client import close_http_client, set_offline
+from llm_client import close_llm_client, trim_content
 from utils import (
+    crawl_lock,
+    has_legacy_text_db,
     is_initial_crawl,
     remove_notice_db,
     reset_database,
-    send_to_file
+    rule_based_period,
+    get_period_cache,
+    period_cache_key
 )
 
 
+# ============================================================================
+
+# 크롤링 실행
+
+async def run_crawl(db, initial, rss=True, revalidate=REVALIDATE_OPEN_NOTICES):
+    """
+    게시판 RSS 크롤링 실행 (공유 연결과 CPU 작업 풀은 정리하지 않음)
+
+    CRAWL_BOARDS의 게시판을 동시에 크롤링하고,
+    일일 크롤링에서는 이어서 신청기간이 남은 기존 공지의 수정 여부도 재검증
+
+    Args:
+        db: 데이터베이스 객체
+        initial (bool): 초기 크롤링 여부
+        rss (bool): RSS 크롤링 여부 (False면 재검증만 실행)
+        revalidate (bool): 신청기간이 남은 공지 재검증 여부 (sqlite 저장소만)
+    """
+    try:
+        if rss:
+            await crawl_boards(db=db, initial=initial)
+        if revalidate and not initial and isinstance(db, NoticeStore):
+            await revalidate_open_notices(db, exclude_ids=db.saved_ids)
+    finally:
+        if isinstance(db, NoticeStore):
+            db.flush()
+
+async def close_clients():
+    """
+    공유 HTTP·OpenAI 연결과 CPU 작업 풀 정리
+    """
+    await close_http_client()
+    await close_llm_client()
+    close_cpu_pool()
+
+async def crawl(db, initial, rss=True, revalidate=REVALIDATE_OPEN_NOTICES):
+    """
+    크롤링 실행 후 공유 연결과 CPU 작업 풀 정리 (중간에 실패해도 저장한 공지는 기록)
+    
+    Args:
+        run_crawl과 동일
+    """
+    try:
+        await run_crawl(db, initial, rss, revalidate)
+    finally:
+        await close_clients()
+
+def export_notices(db, full=False):
+    """
+    이번 실행에서 저장한 공지를 텍스트 파일로 내보내기
+
+    기존 notice_db.txt와 같은 형식·내용(이번 실행분)을 유지하여
+    FastAPI 업로드 등 텍스트 파일을 쓰는 쪽은 그대로 동작
+
+    Args:
+        db (NoticeStore): SQLite 저장소
+        full (bool): 저장소의 모든 공지 내보내기 (초기 크롤링: 중단 전 실행에서 저장한 공지 포함)
+    """
+    count = db.export_text(DB_TEXT_FILENAME, None if full else db.saved_ids)
+    print(f"{DB_TEXT_FILENAME}로 {count}개 공지 내보내기 완료")
+
+def import_legacy_text_db():
+    """
+    sqlite 저장소 도입 전 배포의 notice_db.txt를 sqlite 저장소로 가져오기
+
+    저장소 파일 없이 notice_db.txt만 있으면 초기 크롤링(1년치 재수집)으로 판단하지 않도록
+    크롤링 전에 한 번 가져옴. 임시 파일에 모두 가져온 뒤 바꿔치기하므로
+    가져오다 실패하면 저장소 파일이 생기지 않고 다음 실행에서 다시 시도
+
+    Returns:
+        int | None: 가져온 공지 수 (가져올 파일이 없으면 None)
+    """
+    if not has_legacy_text_db():
+        return None
+
+    tmp_path = f"{DB_PATH}.import"
+    print(f"sqlite 저장소가 없어 기존 {DB_TEXT_FILENAME} 파일을 저장소로 가져옵니다...")
+    try:
+        with NoticeStore(tmp_path) as db:
+            count = import_text_file(db, DB_TEXT_FILENAME)
+    except Exception:
+        for filename in (tmp_path, f"{tmp_path}-wal", f"{tmp_path}-shm"):
+            if os.path.exists(filename):
+                os.remove(filename)
+        print(f"{DB_TEXT_FILENAME} 가져오기 실패: 파일을 확인한 뒤 'python start.py import {DB_TEXT_FILENAME}'로 가져오세요")
+        raise
+
+    os.replace(tmp_path, DB_PATH)
+    print(f"{DB_TEXT_FILENAME}에서 {count}개 공지 가져오기 완료")
+    return count
+
+def export_structured(db):
+    """
+    저장소 전체를 JSONL(및 설정 시 Parquet) 스냅샷으로 내보내기
+
+    Args:
+        db (NoticeStore): SQLite 저장소
+    """
+    count = write_jsonl(db.iter_changes())
+    print(f"JSONL로 {count}개 공지 내보내기 완료")
+    if EXPORT_PARQUET_ENABLED:
+        count = write_parquet(db.iter_changes())
+        if count is not None:
+            print(f"Parquet로 {count}개 공지 내보내기 완료")
+
+async def print_similar(db, query):
+    """
+    임베딩 색인을 갱신한 뒤 질문과 가까운 공지 출력
+    """
+    index = get_embedding_index()
+    try:
+        await index.update(db)
+        results = await index.search(query)
+    finally:
+        index.close()
+        await close_clients()
+
+    by_id = {notice["notice_id"]: notice for notice in db.find(notice_ids=[r["notice_id"] for r in results])}
+    for result in results:
+        notice = by_id.get(result["notice_id"])
+        if notice:
+            print(f"{result['score']:.3f} [{notice['category']}] {notice['title']} {notice['link']}")
+    print(f"검색 결과 {len(results)}개")
+
+async def submit_period_batch(db, pub_from=None):
+    """
+    저장소에서 AI 신청기간 추출이 필요한 공지를 Batch API 작업으로 제출 (대량 백필용)
+
+    규칙 기반 추출기로 처리되거나 신청기간 캐시에 결과가 있는 공지, 다른 공지의 유사 중복은 제외
+
+    Args:
+        db (NoticeStore): SQLite 저장소
+        pub_from (str, optional): 이 게시일(YYYY-MM-DD) 이후 공지만
+    """
+    cache = get_period_cache()
+    notices = [
+        (notice["notice_id"], notice["content"])
+        for notice in db.find(pub_from=pub_from, include_duplicates=False)
+        if notice["content"]
+        and rule_based_period(notice["content"], notice["pub_date"]) is None
+        and cache.get(period_cache_key(trim_content(notice["content"]))) is None
+    ]
+    if not notices:
+        print("Batch API로 제출할 공지가 없습니다")
+        return
+
+    try:
+        await submit_batch_job(notices)
+    finally:
+        await close_clients()
+
+async def collect_period_batch(db, batch_id, wait=False):
+    """
+    Batch API 작업 결과를 수집하여 저장소의 신청기간 갱신
+
+    결과는 신청기간 캐시에도 저장되므로 이후 크롤링에서 같은 본문은 AI 호출 없이 재사용
+
+    Args:
+        db (NoticeStore): SQLite 저장소
+        batch_id (str): 배치 작업 ID
+        wait (bool): 작업이 끝날 때까지 기다릴지 여부
+    """
+    try:
+        results = await (wait_batch_job(batch_id) if wait else collect_batch_job(batch_id))
+    finally:
+        await close_clients()
+    if results is None:
+        return
+
+    updated = 0
+    for notice_id, (start_date, end_date) in results.items():
+        notice = db.get(notice_id)
+        if notice is None:
+            continue
+        # 종료일만 있으면 게시일을 시작일로 사용 (크롤링과 동일)
+        if end_date and not start_date:
+            start_date = notice["pub_date"].split(" ")[0]
+        if (notice["start_date"], notice["end_date"]) == (start_date, end_date):
+            continue
+        notice["start_date"], notice["end_date"] = start_date, end_date
+        db.save_notice(**notice)
+        updated += 1
+    db.flush()
+    print(f"배치 작업 결과 {len(results)}건 수집, 신청기간이 바뀐 공지 {updated}개 저장")
+
 # ============================================================================
 
 # 메인 실행 함수
@@ -28,39 +231,160 @@ def main():
     크롤링 시스템 메인 실행 로직
     
     - 초기 크롤링: DB 파일이 없을 때 (1년치 데이터)
-    - 일일 크롤링: DB 파일이 있을 때 (최신 데이터만)
+    - 일일 크롤링: DB 파일이 있을 때 (새 공지와 수정된 공지만)
+    - daemon: 일회 실행 대신 주기적으로 크롤링
     """
     # 명령행 인수 확인
+    if len(sys.argv) > 1 and sys.argv[1] == "daemon":
+        from daemon import run_daemon
+        asyncio.run(run_daemon())
+        return
+
+    # 다른 크롤러가 실행 중이면 저장소·최고 수위 파일을 함께 수정하지 않도록 종료
+    with crawl_lock() as acquired:
+        if not acquired:
+            print("다른 크롤러가 실행 중입니다. 종료합니다.")
+            return
+        run_once()
+
+def run_once():
+    """
+    명령행 인수에 따라 초기화·재검증·크롤링을 한 번 실행 (실행 잠금을 획득한 상태에서 호출)
+    """
     if len(sys.argv) > 1 and sys.argv[1] == "reset":
         reset_database()
         return
 
+    # sqlite 저장소 도입 전 배포: 기존 notice_db.txt를 저장소로 가져온 뒤 일일 크롤링
+    if not (len(sys.argv) > 1 and sys.argv[1] == "import"):
+        import_legacy_text_db()
+
+    # 재검증만 실행: 신청기간이 남은 공지의 수정 여부만 확인
+    if len(sys.argv) > 1 and sys.argv[1] == "revalidate":
+        if DB_BACKEND != "sqlite" or is_initial_crawl():
+            print("재검증할 sqlite 저장소가 없습니다")
+            return
+        with NoticeStore() as db:
+            asyncio.run(crawl(db=db, initial=False, rss=False, revalidate=True))
+            export_notices(db)
+        return
+
+    # 구조화 내보내기 / 변경분 동기화만 실행
+    if len(sys.argv) > 1 and sys.argv[1] in ("export", "sync"):
+        if DB_BACKEND != "sqlite" or is_initial_crawl():
+            print("내보낼 sqlite 저장소가 없습니다")
+            return
+        with NoticeStore() as db:
+            if sys.argv[1] == "export":
+                export_structured(db)
+            else:
+                sync_notices(db)
+        return
+
+    # 보관해 둔 notice_db.txt 형식 파일을 sqlite 저장소로 옮기기
+    if len(sys.argv) > 2 and sys.argv[1] == "import":
+        if DB_BACKEND != "sqlite":
+            print("sqlite 저장소에서만 가져올 수 있습니다")
+            return
+        with NoticeStore() as db:
+            for filename in sys.argv[2:]:
+                print(f"{filename}에서 {import_text_file(db, filename)}개 공지 가져오기 완료")
+        return
+
+    # 검색 색인으로 공지 검색 (검색어가 없으면 오늘 신청 가능한 공지를 마감순으로)
+    if len(sys.argv) > 1 and sys.argv[1] == "search":
+        if DB_BACKEND != "sqlite" or is_initial_crawl():
+            print("검색할 sqlite 저장소가 없습니다")
+            return
+        query = " ".join(sys.argv[2:])
+        with NoticeStore() as db:
+            index = NoticeSearchIndex(db)
+            index.update()
+            if query:
+                results = index.search(query)
+            else:
+                results = index.search(open_from=datetime.now().strftime("%Y-%m-%d"))
+            for notice in results:
+                score = f"{notice['score']:6.2f} " if notice["score"] is not None else ""
+                period = f"{notice['start_date'] or ''} ~ {notice['end_date']}" if notice["end_date"] else "기간 없음"
+                print(f"{score}[{notice['category']}] {notice['title']} ({period}) {notice['link']}")
+            print(f"검색 결과 {len(results)}개")
+        return
+
+    # 임베딩 색인으로 질문과 가까운 공지 검색
+    if len(sys.argv) > 2 and sys.argv[1] == "similar":
+        if DB_BACKEND != "sqlite" or is_initial_crawl():
+            print("검색할 sqlite 저장소가 없습니다")
+            return
+        with NoticeStore() as db:
+            asyncio.run(print_similar(db, " ".join(sys.argv[2:])))
+        return
+
+    # OpenAI Batch API로 신청기간 백필 (submit [YYYY-MM-DD] / collect <작업 ID> / wait <작업 ID>)
+    if len(sys.argv) > 2 and sys.argv[1] == "batch":
+        if DB_BACKEND != "sqlite" or is_initial_crawl():
+            print("신청기간을 추출할 sqlite 저장소가 없습니다")
+            return
+        action, args = sys.argv[2], sys.argv[3:]
+        with NoticeStore() as db:
+            if action == "submit":
+                asyncio.run(submit_period_batch(db, args[0] if args else None))
+            elif action in ("collect", "wait") and args:
+                asyncio.run(collect_period_batch(db, args[0], wait=action == "wait"))
+            else:
+                print("사용법: batch submit [YYYY-MM-DD] | batch collect <작업 ID> | batch wait <작업 ID>")
+        return
+
+    # 중단된 초기 크롤링 이어서 실행
+    if len(sys.argv) > 1 and sys.argv[1] == "resume":
+        checkpoints = pending_checkpoints()
+        if not checkpoints:
+            print("이어서 실행할 초기 크롤링이 없습니다")
+            return
+        for checkpoint in checkpoints:
+            print(
+                f"[{checkpoint['board']}] 완료 페이지 {checkpoint['last_page']}, "
+                f"저장 완료 {checkpoint['saved']}개, 진행 중 {checkpoint['in_progress']}개, "
+                f"실패 {checkpoint['failed']}개"
+            )
+
+    # 오프라인 재실행: 네트워크 없이 HTTP 캐시만으로 크롤링
+    if "offline" in sys.argv[1:]:
+        set_offline()
+        print("오프라인 재실행 모드 (HTTP 캐시 사용)")
+
     # 초기 크롤링 여부 판단
     initial = is_initial_crawl()
     print("초기 크롤링" if initial else "일일 크롤링")
 
-    # 크롤링 페이지 수 설정
-    max_pages = 100 if initial else 2  # 초기: 100페이지, 일일: 2페이지
+    # 크롤링 페이지 수는 게시판별 설정 (crawler_config.BOARDS의 initial_pages/daily_pages)
 
-    # 일일 크롤링인 경우 기존 DB 삭제
-    if not initial:
+    # 일일 크롤링: sqlite 저장소는 새·수정 공지만 덮어쓰고, 텍스트 DB는 새로 작성
+    if not initial and DB_BACKEND == "text":
         remove_notice_db()
 
     # DB 인스턴스 생성
-    db = TextFileDB()
+    db = NoticeStore() if DB_BACKEND == "sqlite" else TextFileDB()
 
     # 크롤링 시간 측정 시작
     start_ts = time.perf_counter()
 
     # 크롤링 실행
     print("HANA 크롤링 시스템 시작...\n")
-    asyncio.run(rss_crawl(
+    asyncio.run(crawl(
         db=db,
-        max_pages=max_pages,
         initial=initial
     ))
     print("크롤링 완료!\n")
 
+    if isinstance(db, NoticeStore):
+        with db:
+            export_notices(db, full=initial)
+
+            # FastAPI 서버로 마지막 동기화 이후 바뀐 공지만 전송
+            if SYNC_ENABLED:
+                sync_notices(db)
+
     # 소요 시간 계산 및 출력
     elapsed = time.perf_counter() - start_ts
     hours = int(elapsed // 3600)
@@ -72,9 +396,6 @@ def main():
     else:
         print(f"소요시간: {minutes}분 {seconds}초, {elapsed:.2f}초")
 
-    # FastAPI 서버로 결과 파일 전송
-    # send_to_file(DB_TEXT_FILENAME)  # 현재는 서버가 없으므로 주석 처리
-
 # ============================================================================
 
 if __name__ == "__main__":
@@ -0,0 +1,14 @@
+"""
+pytest 공통 설정
+
+루트의 크롤러 모듈과 benchmarks·tools 스크립트를 테스트에서 import할 수 있도록 경로 추가
+"""
+
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+for path in (ROOT_DIR, os.path.join(ROOT_DIR, "benchmarks"), os.path.join(ROOT_DIR, "tools")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,114 @@
+"""
+초기 크롤링 체크포인트 테스트
+
+실패한 공지가 완료 페이지 이전에 있어도 이어서 실행할 때 다시 처리되는지 확인
+"""
+
+import asyncio
+
+import pytest
+
+import crawling
+from boards import Board
+from checkpoint import CrawlCheckpoint, pending_checkpoints
+from crawler_config import DEFAULT_BOARD
+from db import NoticeStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    with NoticeStore(str(tmp_path / "notice_db.sqlite3")) as db:
+        yield db
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "crawl_checkpoint.sqlite3")
+
+
+def rss_notice(seq, notice_id):
+    return {
+        "seq": seq, "notice_id": notice_id, "title": f"공지 {notice_id}",
+        "link": f"https://example.com/bbs/143/{notice_id}/artclView.do",
+        "pub_date": "2025-03-01", "category": "학사", "fingerprint": f"fp-{notice_id}",
+    }
+
+
+def run_first_pages(store, path):
+    """
+    1페이지(101 저장, 102 실패)와 2페이지(103 저장)를 완료한 뒤 중단
+    """
+    checkpoint = CrawlCheckpoint(DEFAULT_BOARD, store, path)
+    checkpoint.end_page(1, 1, "102")
+    checkpoint.processed(rss_notice(0, "101"))
+    checkpoint.processed({**rss_notice(1, "102"), "failed": True})
+    checkpoint.end_page(2, 2, "103")
+    checkpoint.processed(rss_notice(2, "103"))
+    assert checkpoint.last_page == 2
+    checkpoint.close()
+
+
+def test_failed_notice_is_kept_for_resume(store, path):
+    run_first_pages(store, path)
+    assert pending_checkpoints(path)[0]["failed"] == 1
+
+    checkpoint = CrawlCheckpoint(DEFAULT_BOARD, store, path)
+    assert checkpoint.start_page == 2
+    assert checkpoint.saved == {"101", "103"}
+    retries = checkpoint.retry_notices()
+    assert [notice["notice_id"] for notice in retries] == ["102"]
+    assert retries[0]["link"].endswith("/102/artclView.do")
+    assert checkpoint.retry_notices() == []
+
+    # 다시 처리하여 저장되면 실패 기록에서 지움
+    checkpoint.end_page(2, 0, "103")
+    checkpoint.processed({**retries[0], "seq": 0})
+    checkpoint.close()
+    assert pending_checkpoints(path)[0]["failed"] == 0
+    assert "102" in CrawlCheckpoint(DEFAULT_BOARD, store, path).saved
+
+
+def test_finish_clears_failed_notices(store, path):
+    run_first_pages(store, path)
+    CrawlCheckpoint(DEFAULT_BOARD, store, path).finish()
+    assert pending_checkpoints(path) == []
+
+
+def test_resume_requeues_failed_notice_before_pages(store, path, monkeypatch):
+    run_first_pages(store, path)
+
+    def rss(*notice_ids):
+        items = "".join(
+            f"<item><title>공지 {notice_id}</title>"
+            f"<link>https://example.com/bbs/143/{notice_id}/artclView.do</link>"
+            f"<pubDate>2099-03-01</pubDate><category>학사</category><description/></item>"
+            for notice_id in notice_ids
+        )
+        return f"<rss><channel>{items}</channel></rss>".encode("utf-8")
+
+    pages = {1: rss("101", "102"), 2: rss("102", "103"), 3: rss("104")}
+
+    async def fetch_rss_page(url, board):
+        return pages.get(int(url.rsplit("=", 1)[1]), b"")
+
+    monkeypatch.setattr(crawling, "_fetch_rss_page", fetch_rss_page)
+    # 기본 게시판 이름이면 저장소 ID에 게시판 이름을 붙이지 않음
+    board = Board(DEFAULT_BOARD, "https://example.com/rss?page={}", allowed_categories=None, initial_pages=3)
+    checkpoint = CrawlCheckpoint(DEFAULT_BOARD, store, path)
+    stats = {"resumed": 0, "unchanged": 0, "updated": 0}
+
+    async def produce():
+        queue = asyncio.Queue()
+        await crawling._produce_notices(queue, board, True, None, {}, stats, checkpoint=checkpoint)
+        queued = []
+        while (notice := queue.get_nowait()) is not crawling._STOP:
+            queued.append(notice)
+        return queued
+
+    queued = asyncio.run(produce())
+    checkpoint.close()
+
+    # 실패한 102를 먼저 다시 투입하고, 2페이지를 다시 읽을 때는 중복 투입하지 않음
+    assert [notice["notice_id"] for notice in queued] == ["102", "104"]
+    assert [notice["seq"] for notice in queued] == [0, 1]
+    assert stats["resumed"] == 1
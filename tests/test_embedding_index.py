@@ -0,0 +1,140 @@
+"""
+임베딩 색인 테스트
+
+LocalHashEmbedding으로 작은 색인을 만들어 추가·수정·조각 삭제·압축과
+빈 군집이 있는 IVF 검색을 확인 (네트워크 사용 안 함)
+"""
+
+import asyncio
+import os
+
+import numpy as np
+import pytest
+
+import embedding_index
+from crawler_config import EMBEDDING_CHUNK_CHARS
+from db import NoticeStore
+from embedding_index import EmbeddingIndex, LocalHashEmbedding
+
+
+@pytest.fixture
+def store(tmp_path):
+    with NoticeStore(str(tmp_path / "notice_db.sqlite3")) as db:
+        yield db
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = EmbeddingIndex(LocalHashEmbedding(dimensions=64), directory=str(tmp_path / "embeddings"))
+    yield index
+    index.close()
+
+
+def save(db, notice_id, title, content):
+    db.save_notice(notice_id, title, f"https://example.com/{notice_id}", "2025-03-01", "학사", None, None, content)
+    db.flush()
+
+
+def search(index, query, k=10):
+    return asyncio.run(index.search(query, k))
+
+
+def chunk_count(index, notice_id):
+    return index.conn.execute("SELECT COUNT(*) FROM chunks WHERE notice_id = ?", (notice_id,)).fetchone()[0]
+
+
+def test_add_and_search(store, index):
+    save(store, "1", "수강신청 안내", "2025학년도 1학기 수강신청 일정을 안내합니다.")
+    save(store, "2", "장학금 신청", "국가장학금 2차 신청 기간을 안내합니다.")
+    save(store, "3", "도서관 휴관", "도서관 시설 공사로 휴관합니다.")
+
+    stats = asyncio.run(index.update(store))
+    assert stats == {"notices": 3, "chunks": 3, "embedded": 3}
+    assert index.rows == 3
+    assert search(index, "국가장학금 신청")[0]["notice_id"] == "2"
+
+    # 바뀐 공지가 없으면 다시 나누지 않음
+    assert asyncio.run(index.update(store)) == {"notices": 0, "chunks": 0, "embedded": 0}
+
+
+def test_update_reembeds_only_changed_chunks(store, index):
+    save(store, "1", "수강신청 안내", "첫 문단입니다.\n\n둘째 문단입니다.")
+    asyncio.run(index.update(store))
+    rows = index.rows
+
+    # 제목이 같고 본문이 같으면 같은 조각이므로 임베딩하지 않음
+    save(store, "1", "수강신청 안내", "첫 문단입니다.\n\n둘째 문단입니다.")
+    assert asyncio.run(index.update(store))["embedded"] == 0
+    assert index.rows == rows
+
+    save(store, "1", "수강신청 안내", "첫 문단입니다.\n\n수정한 문단입니다.")
+    stats = asyncio.run(index.update(store))
+    assert stats["notices"] == 1
+    assert stats["embedded"] == 1
+    assert "수정한 문단" in search(index, "수정한 문단")[0]["text"]
+
+
+def test_removed_chunks_are_not_searched(store, index, monkeypatch):
+    monkeypatch.setattr(embedding_index, "EMBEDDING_COMPACT_RATIO", 1.0)
+    # 문단마다 EMBEDDING_CHUNK_CHARS의 절반을 넘겨 문단 하나가 조각 하나가 되도록 함
+    paragraphs = [
+        " ".join([text] * (EMBEDDING_CHUNK_CHARS // 2 // len(text) + 1))
+        for text in ("기숙사 입사 신청 안내", "식당 운영 시간 변경", "주차장 이용 제한 안내")
+    ]
+    save(store, "1", "생활관", "\n\n".join(paragraphs))
+    asyncio.run(index.update(store))
+    assert chunk_count(index, "1") == 3
+    assert "주차장" in search(index, "주차장 이용 제한")[0]["text"]
+
+    # 본문에서 빠진 문단의 조각은 색인에서 지워지고 검색되지 않음
+    save(store, "1", "생활관", paragraphs[0])
+    asyncio.run(index.update(store))
+    assert chunk_count(index, "1") == 1
+    assert all("주차장" not in result["text"] for result in search(index, "주차장 이용 제한"))
+
+
+def test_compaction_drops_orphan_rows(store, index, monkeypatch):
+    monkeypatch.setattr(embedding_index, "EMBEDDING_COMPACT_RATIO", 0.3)
+    for i in range(4):
+        save(store, str(i), f"공지 {i}", f"본문 {i} 내용")
+    asyncio.run(index.update(store))
+    old_path = index.vectors_path
+
+    # 6행 중 2행이 참조되지 않으면(33%) 압축
+    save(store, "0", "공지 0", "바뀐 본문 0")
+    save(store, "1", "공지 1", "바뀐 본문 1")
+    asyncio.run(index.update(store))
+
+    assert index.vectors_path != old_path
+    assert not os.path.exists(old_path)
+    assert index.rows == 4
+    assert search(index, "바뀐 본문 1")[0]["notice_id"] == "1"
+
+    # 다시 열어도 압축한 파일과 행 번호를 사용
+    index.close()
+    reopened = EmbeddingIndex(index.backend, directory=os.path.dirname(index.directory))
+    try:
+        assert reopened.vectors_path == index.vectors_path
+        assert reopened.rows == 4
+        assert search(reopened, "바뀐 본문 0")[0]["notice_id"] == "0"
+        assert search(reopened, "본문 3 내용")[0]["notice_id"] == "3"
+    finally:
+        reopened.close()
+
+
+def test_ivf_skips_empty_clusters(store, index, monkeypatch):
+    monkeypatch.setattr(embedding_index, "EMBEDDING_IVF_MIN_VECTORS", 1)
+    monkeypatch.setattr(embedding_index, "EMBEDDING_IVF_NPROBE", 1)
+
+    # 서로 다른 벡터가 2개뿐이고 군집은 √24 = 4개이므로 적어도 2개 군집은 비어 있음
+    for i in range(12):
+        save(store, f"a{i}", "수강신청 안내", "수강신청 일정")
+        save(store, f"b{i}", "장학금 신청", "국가장학금 신청 기간")
+    asyncio.run(index.update(store))
+
+    results = search(index, "장학금 신청\n\n국가장학금 신청 기간", k=5)
+    _, _, bounds = index._ivf
+    assert np.count_nonzero(bounds[1:] == bounds[:-1]) >= 2
+    assert len(results) == 5
+    assert all(result["notice_id"].startswith("b") for result in results)
+    assert results[0]["score"] == pytest.approx(1.0, abs=1e-5)
@@ -0,0 +1,32 @@
+"""
+상세 페이지 추출기 골든 파일 테스트
+
+benchmarks/html_golden의 모든 페이지를 fast(html.parser)·fast(lxml)·legacy 추출기로 처리하여
+골든 파일과 한 글자라도 다르면 실패 (lxml 전용 골든 파일이 있는 페이지는 그 파일과 비교)
+- 골든 파일 갱신: python benchmarks/html_golden.py --update
+"""
+
+import os
+
+import pytest
+
+from html_golden import BASE_DOMAIN, EXTRACTORS, golden_path, load_golden, load_pages, to_record
+
+PAGES = load_pages()
+
+
+@pytest.mark.parametrize("label, parse, variant", EXTRACTORS, ids=[label for label, _, _ in EXTRACTORS])
+@pytest.mark.parametrize("name, html", PAGES, ids=[name for name, _ in PAGES])
+def test_matches_golden(name, html, label, parse, variant):
+    assert to_record(parse(html, BASE_DOMAIN)) == load_golden(name, variant)
+
+
+def test_malformed_markup_has_lxml_golden():
+    # 닫는 태그 생략 페이지는 파서마다 결과가 달라 lxml 전용 골든 파일로 고정
+    assert os.path.exists(golden_path("malformed_markup", "lxml"))
+    assert load_golden("malformed_markup", "lxml") != load_golden("malformed_markup")
+
+
+def test_every_page_has_golden():
+    for name, _ in PAGES:
+        assert os.path.exists(golden_path(name)), name
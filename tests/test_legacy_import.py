@@ -0,0 +1,59 @@
+"""
+sqlite 저장소 도입 전 배포(notice_db.txt만 있는 경우) 업그레이드 테스트
+"""
+
+import os
+
+import pytest
+
+import start
+import utils
+from crawler_config import DB_PATH, DB_TEXT_FILENAME
+from db import NoticeStore, TextFileDB
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+def write_legacy_db():
+    db = TextFileDB(DB_TEXT_FILENAME)
+    db.save_notice("101", "수강신청 안내", "https://example.com/101", "2025-03-01", "학사",
+                   "2025-03-02", "2025-03-05", "본문")
+    db.save_notice("102", "장학금 신청", "https://example.com/102", "2025-03-02", "장학", None, None, "본문")
+
+
+def test_legacy_text_db_is_imported_instead_of_initial_crawl():
+    write_legacy_db()
+    assert utils.has_legacy_text_db()
+    assert utils.is_initial_crawl()
+
+    assert start.import_legacy_text_db() == 2
+    assert not utils.has_legacy_text_db()
+    assert not utils.is_initial_crawl()
+    with NoticeStore() as db:
+        assert len(db) == 2
+        assert db.get("101")["end_date"] == "2025-03-05"
+
+    # 저장소가 생긴 뒤에는 다시 가져오지 않음
+    assert start.import_legacy_text_db() is None
+
+
+def test_failed_import_leaves_no_store(monkeypatch):
+    write_legacy_db()
+
+    def broken(db, filename):
+        raise ValueError("잘린 파일")
+
+    monkeypatch.setattr(start, "import_text_file", broken)
+    with pytest.raises(ValueError):
+        start.import_legacy_text_db()
+    assert not any(name.startswith(os.path.basename(DB_PATH)) for name in os.listdir("."))
+    assert utils.has_legacy_text_db()
+
+
+def test_fresh_deployment_is_initial_crawl():
+    assert not utils.has_legacy_text_db()
+    assert start.import_legacy_text_db() is None
+    assert utils.is_initial_crawl()
@@ -0,0 +1,113 @@
+"""
+변경분 동기화 테스트
+
+tools/sync_server.py의 로컬 서버(fail_every로 503 주입)에 exporter.sync_notices를 실행하여
+실패한 묶음부터 이어서 전송하고 같은 공지를 두 번 반영하지 않는지 확인
+"""
+
+import threading
+
+import pytest
+
+import exporter
+from crawler_config import FASTAPI_SYNC_PATH
+from db import NoticeStore
+from sync_server import serve
+
+
+@pytest.fixture
+def store(tmp_path):
+    with NoticeStore(str(tmp_path / "notice_db.sqlite3")) as db:
+        yield db
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(exporter, "SYNC_BACKOFF_BASE", 0)
+
+
+def start_server(fail_every):
+    server, state = serve(port=0, fail_every=fail_every)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}{FASTAPI_SYNC_PATH}"
+
+    # 반영한 묶음의 공지 ID 기록 (중복 응답은 제외)
+    applied = []
+    apply = state.apply
+
+    def recording_apply(records, sync_from, sync_to, key):
+        status, payload = apply(records, sync_from, sync_to, key)
+        if status == 200 and not payload.get("duplicate"):
+            applied.extend(record["notice_id"] for record in records)
+        return status, payload
+
+    state.apply = recording_apply
+    return server, state, url, applied
+
+
+def save(db, count, version=""):
+    for i in range(count):
+        db.save_notice(
+            f"n{i}", f"공지 {i}{version}", f"https://example.com/{i}", "2025-03-01", "학사",
+            None, None, f"본문 {i}{version}"
+        )
+    db.flush()
+
+
+def test_sync_retries_failed_chunks(store):
+    save(store, 10)
+    server, state, url, applied = start_server(fail_every=3)
+    try:
+        assert exporter.sync_notices(store, url=url, chunk_size=3) == 10
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert state.requests > 4  # 503 응답 후 재시도 포함
+    assert sorted(applied) == sorted(f"n{i}" for i in range(10))
+    assert state.cursor == store.last_change_seq() == store.get_sync_cursor(url)
+
+
+def test_sync_resumes_after_failure_without_resending(store, monkeypatch):
+    save(store, 10)
+    server, state, url, applied = start_server(fail_every=3)
+    try:
+        # 재시도 없이 세 번째 요청(세 번째 묶음)에서 실패
+        monkeypatch.setattr(exporter, "SYNC_MAX_RETRIES", 0)
+        assert exporter.sync_notices(store, url=url, chunk_size=3) is None
+        partial = store.get_sync_cursor(url)
+        assert partial == state.cursor
+        assert len(applied) == 6
+
+        # 다음 실행은 확인받지 못한 묶음부터 이어서 전송
+        monkeypatch.setattr(exporter, "SYNC_MAX_RETRIES", 5)
+        assert exporter.sync_notices(store, url=url, chunk_size=3) == 4
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert sorted(applied) == sorted(f"n{i}" for i in range(10))
+    assert len(state.notices) == 10
+    assert state.cursor == store.last_change_seq() == store.get_sync_cursor(url)
+
+
+def test_sync_sends_only_changed_notices(store):
+    save(store, 5)
+    server, state, url, applied = start_server(fail_every=0)
+    try:
+        assert exporter.sync_notices(store, url=url, chunk_size=2) == 5
+        store.save_notice(
+            "n2", "공지 2 (수정)", "https://example.com/2", "2025-03-01", "학사",
+            None, None, "본문 2 (수정)"
+        )
+        store.flush()
+        assert exporter.sync_notices(store, url=url, chunk_size=2) == 1
+        assert exporter.sync_notices(store, url=url, chunk_size=2) == 0
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert applied.count("n2") == 2
+    assert len(applied) == 6
+    assert state.notices["n2"]["title"] == "공지 2 (수정)"
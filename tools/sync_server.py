@@ -0,0 +1,149 @@
+"""
+HANA (Hansung AI for Notice & Assistance)
+변경분 동기화 테스트용 로컬 서버
+
+FastAPI 서버 대신 exporter.sync_notices의 요청 형식을 받아 공지를 보관하는 최소 서버
+- POST FASTAPI_SYNC_PATH: gzip JSONL 묶음을 받아 공지 ID별 최신 버전만 보관하고 {"cursor": n} 응답
+- X-Sync-From이 서버가 가진 순번과 다르면 409 {"cursor": 서버 순번}
+- 이미 반영한 묶음을 같은 Idempotency-Key로 다시 보내면 반영하지 않고 같은 응답
+- POST FASTAPI_PATH: 기존 notice_db.txt 파일 업로드 (크기만 기록)
+- GET /state: 보관 중인 공지 수와 순번
+- --fail-every N: N번째 요청마다 503 응답 (재시도 확인용)
+
+실행:
+    python tools/sync_server.py --port 8000
+    python tools/sync_server.py --port 8000 --fail-every 3
+"""
+
+import os
+import sys
+import gzip
+import json
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crawler_config import FASTAPI_PATH, FASTAPI_SYNC_PATH
+
+
+class SyncState:
+    """
+    서버가 보관하는 공지와 확인한 변경 순번
+    """
+
+    def __init__(self, fail_every=0):
+        self.notices = {}
+        self.cursor = 0
+        self.applied_keys = {}
+        self.requests = 0
+        self.fail_every = fail_every
+        self.lock = Lock()
+
+    def apply(self, records, sync_from, sync_to, key):
+        """
+        묶음 반영
+
+        Returns:
+            tuple[int, dict]: (HTTP 상태 코드, 응답 본문)
+        """
+        with self.lock:
+            if key in self.applied_keys and self.applied_keys[key] <= self.cursor:
+                return 200, {"cursor": self.applied_keys[key], "duplicate": True}
+            if sync_from != self.cursor:
+                return 409, {"cursor": self.cursor}
+
+            for record in records:
+                current = self.notices.get(record["notice_id"])
+                if current is None or record["version"] >= current["version"]:
+                    self.notices[record["notice_id"]] = record
+
+            self.cursor = sync_to
+            self.applied_keys[key] = sync_to
+            return 200, {"cursor": sync_to, "received": len(records)}
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, status, payload):
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/state":
+                with state.lock:
+                    self._reply(200, {"cursor": state.cursor, "notices": len(state.notices)})
+            else:
+                self._reply(404, {"detail": "not found"})
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+            with state.lock:
+                state.requests += 1
+                fail = state.fail_every and state.requests % state.fail_every == 0
+            if fail:
+                self._reply(503, {"detail": "injected failure"})
+                return
+
+            if self.path == FASTAPI_PATH:
+                self._reply(200, {"received_bytes": len(body)})
+                return
+            if self.path != FASTAPI_SYNC_PATH:
+                self._reply(404, {"detail": "not found"})
+                return
+
+            try:
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                records = [json.loads(line) for line in body.decode("utf-8").splitlines() if line]
+                sync_from = int(self.headers["X-Sync-From"])
+                sync_to = int(self.headers["X-Sync-To"])
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                self._reply(400, {"detail": str(e)})
+                return
+
+            key = self.headers.get("Idempotency-Key") or f"{sync_from}-{sync_to}"
+            self._reply(*state.apply(records, sync_from, sync_to, key))
+
+        def log_message(self, format, *args):
+            print(f"[sync_server] {self.command} {self.path} {args[1] if len(args) > 1 else ''}")
+
+    return Handler
+
+
+def serve(port=8000, fail_every=0):
+    """
+    서버 생성 (호출 측에서 serve_forever 실행)
+
+    Returns:
+        tuple[ThreadingHTTPServer, SyncState]: (서버, 상태)
+    """
+    state = SyncState(fail_every)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(state))
+    return server, state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="변경분 동기화 테스트용 로컬 서버")
+    parser.add_argument("--port", type=int, default=8000, help="포트")
+    parser.add_argument("--fail-every", type=int, default=0, help="N번째 요청마다 503 응답 (0이면 사용 안 함)")
+    args = parser.parse_args()
+
+    server, _ = serve(args.port, args.fail_every)
+    print(f"동기화 테스트 서버 실행: http://127.0.0.1:{args.port}{FASTAPI_SYNC_PATH}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,22 +6,28 @@ HANA (Hansung AI for Notice & Assistance)
 """
 
 import os
+import re
+import glob
 import json
-import asyncio
-import img2pdf
+import hashlib
 import requests
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from openai import OpenAI
-from pyzerox import zerox
 
 from crawler_config import (
     CATEGORY_MAP,
-    DB_TEXT_FILENAME, CRAWLED_ID_FILENAME,
-    PDF_PATH, OCR_DELAY,
-    OPENAI_API_KEY, MODEL, TEMPERATURE, MAX_TOKENS,
+    DB_BACKEND, DB_PATH, DB_TEXT_FILENAME, CRAWLED_ID_FILENAME, CRAWL_LOCK_FILENAME,
+    CHECKPOINT_PATH,
+    MODEL, TEMPERATURE, MAX_TOKENS,
+    LLM_CACHE_PATH, LLM_CACHE_MAX_ENTRIES,
+    RULE_EXTRACTOR_ENABLED, RULE_EXTRACTOR_MIN_CONFIDENCE,
     FASTAPI_BASE_URL, FASTAPI_PORT, FASTAPI_PATH,
-    PROMPT
+    PROMPT, PERIOD_BATCH_PROMPT
 )
+from checkpoint import has_pending_checkpoint
+from date_extractor import extract_period
+from kv_cache import LRUCache
+from llm_client import request_json, trim_content
 
 # ============================================================================
 
@@ -41,165 +47,180 @@ def normalize_category(category):
 # ============================================================================
 
 # AI 기반 데이터 추출
-def get_application_period(content):
+
+# 신청기간 추출 응답 JSON 스키마 (structured output)
+PERIOD_SCHEMA = {
+    "name": "application_period",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "has_period": {"type": "boolean"},
+            "start_date": {"type": ["string", "null"]},
+            "end_date": {"type": ["string", "null"]},
+        },
+        "required": ["has_period", "start_date", "end_date"],
+        "additionalProperties": False,
+    },
+}
+
+# 신청기간 추출 결과 캐시 (첫 사용 시 생성)
+_period_cache = None
+
+def get_period_cache():
     """
-    OpenAI API로 공지사항 본문에서 신청기간 추출
+    신청기간 추출 결과 캐시 반환
+
+    Returns:
+        LRUCache: 본문·프롬프트·모델 해시를 키로 하는 영구 캐시
+    """
+    global _period_cache
+    if _period_cache is None:
+        _period_cache = LRUCache(LLM_CACHE_PATH, LLM_CACHE_MAX_ENTRIES)
+    return _period_cache
+
+def period_cache_key(content):
+    """
+    신청기간 추출 캐시 키 생성
+
+    개별 추출, 일괄 추출, Batch API 작업이 같은 키를 사용하므로 어느 경로의 결과든 재사용됨.
+    본문의 공백 차이는 무시하고, 프롬프트(개별·일괄)·모델·온도가 바뀌면 다른 키가 되도록 함
     
     Args:
         content (str): 공지사항 본문 내용
         
     Returns:
-        tuple[str | None, str | None]: (시작일, 종료일)
+        str: SHA-256 해시 키
     """
-    if not content:
-        return None, None
+    normalized = re.sub(r'\s+', ' ', content).strip()
+    payload = json.dumps([normalized, PROMPT, PERIOD_BATCH_PROMPT, MODEL, TEMPERATURE], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+# 신청기간 추출 경로별 처리 건수 (rule: 규칙 기반, llm: AI 호출 또는 캐시)
+period_stats = {"rule": 0, "llm": 0}
+
+async def get_application_period(content, pub_date=None):
+    """
+    공지사항 본문에서 신청기간 추출
+
+    규칙 기반 추출기의 확신도가 기준값 이상이면 바로 반환하고,
+    애매한 본문만 AI 추출로 넘김
     
-    try:
-        client = OpenAI(api_key=OPENAI_API_KEY)
-        
-        # 프롬프트 생성
-        prompt = PROMPT.format(content=content)
-
-        response = client.chat.completions.create(
-            model=MODEL,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=TEMPERATURE,
-            max_tokens=MAX_TOKENS
-        )
-
-        # AI 응답 파싱
-        ai_response = response.choices[0].message.content.strip()
-        
-        if not ai_response:
-            print("AI 응답이 비어있습니다.")
-            return None, None
+    Args:
+        content (str): 공지사항 본문 내용
+        pub_date (str | None): 게시일 (연도가 생략된 날짜 추론용)
         
-        try:
-            result = json.loads(ai_response)
-            
-            if result.get('has_period', False):
-                start_date = result.get('start_date')
-                end_date = result.get('end_date')
-                return start_date, end_date
-            else:
-                return None, None
-                
-        except json.JSONDecodeError as e:
-            print(f"JSON 형식 X: {e}")
-            print(f"AI 응답: {ai_response}")
-            return None, None
-        except Exception as e:
-            print(f"파싱 오류: {e}")
-            return None, None
-            
-    except Exception as e:
-        print(f"AI 신청기간 추출 실패: {e}")
+    Returns:
+        tuple[str | None, str | None]: (시작일, 종료일)
+    """
+    if not content:
         return None, None
 
-# ============================================================================
+    period = rule_based_period(content, pub_date)
+    if period is not None:
+        return period
 
-# 이미지 및 OCR 처리
+    period_stats["llm"] += 1
+    return await extract_period_with_llm(content)
 
-def images_to_pdf(image_urls):
+def rule_based_period(content, pub_date=None):
     """
-    이미지 URL들을 PDF로 변환
+    규칙 기반 추출기로 신청기간 추출 (확신도가 기준값 미만이면 None)
     
     Args:
-        image_urls (list): 이미지 URL 리스트
+        content (str): 공지사항 본문 내용
+        pub_date (str | None): 게시일
         
     Returns:
-        bool: 변환 성공 여부
+        tuple[str | None, str | None] | None: (시작일, 종료일), AI 추출이 필요하면 None
     """
-    try:
-        # 출력 디렉토리 생성
-        os.makedirs(os.path.dirname(PDF_PATH), exist_ok=True)
-        
-        image_list = []
-        
-        # 이미지 다운로드
-        for url in image_urls:
-            try:
-                response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-                response.raise_for_status()
-                image_list.append(response.content)
-            except requests.RequestException as e:
-                print(f"이미지 다운로드 실패: {url} - {e}")
-                continue
-        
-        # PDF 생성
-        if image_list:
-            pdf_bytes = img2pdf.convert(image_list)
-            with open(PDF_PATH, "wb") as f:
-                f.write(pdf_bytes)
-            return True
-        else:
-            print("다운로드된 이미지가 없습니다")
-            return False
-            
-    except Exception as e:
-        print(f"이미지 -> PDF 변환 중 오류 발생: {e}")
-        return False
+    if not RULE_EXTRACTOR_ENABLED:
+        return None
 
-async def get_text_from_pdf(file_path):
+    start_date, end_date, confidence = extract_period(content, pub_date)
+    if confidence < RULE_EXTRACTOR_MIN_CONFIDENCE:
+        return None
+
+    period_stats["rule"] += 1
+    return start_date, end_date
+
+async def extract_period_with_llm(content):
     """
-    PDF에서 zerox로 텍스트 추출
+    OpenAI API로 공지사항 본문에서 신청기간 추출
+
+    본문은 날짜 관련 부분 위주로 LLM_CONTENT_TOKEN_CAP 이하로 줄여 보내고,
+    응답은 JSON 스키마로 강제. 같은 본문을 이전에 처리했으면 캐시된 결과를
+    반환하고 API를 호출하지 않음
     
     Args:
-        file_path (str): PDF 파일 경로
+        content (str): 공지사항 본문 내용
         
     Returns:
-        str | None: 추출된 텍스트
+        tuple[str | None, str | None]: (시작일, 종료일)
     """
-    try:
-        result = await zerox(
-            file_path=file_path,
-            model=MODEL
-        )
-        
-        content = ""
-        for page in result.pages:
-            content += page.content + "\n\n"
-        
-        return content
+    if not content:
+        return None, None
+
+    content = trim_content(content)
+
+    # 캐시 조회
+    cache = get_period_cache()
+    key = period_cache_key(content)
+    cached = cache.get(key)
+    if cached is not None:
+        return cached["start_date"], cached["end_date"]
     
+    # 프롬프트 생성
+    prompt = PROMPT.format(content=content)
+
+    try:
+        ai_response = await request_json(prompt, PERIOD_SCHEMA, MAX_TOKENS)
     except Exception as e:
-        print(f"OCR 처리 실패: {e}")
-        return None
+        print(f"AI 신청기간 추출 실패: {e}")
+        return None, None
+
+    if ai_response is None:
+        return None, None
 
-async def image_urls_to_text(image_urls):
+    period = parse_application_period(ai_response)
+    if period is None:
+        return None, None
+
+    # 정상 응답만 캐시 (파싱 실패는 다음 실행 때 다시 시도)
+    cache.set(key, {"start_date": period[0], "end_date": period[1]})
+    return period
+
+def parse_application_period(ai_response):
     """
-    이미지 URL들에서 텍스트 추출 (PDF 변환 + OCR)
+    AI 응답(JSON)에서 시작일/종료일 추출
     
     Args:
-        image_urls (list[str]): 이미지 URL 리스트
+        ai_response (str): AI 응답 문자열
         
     Returns:
-        str | None: 추출된 텍스트
+        tuple[str | None, str | None] | None: (시작일, 종료일), 응답 형식이 잘못되면 None
     """
+    if not ai_response:
+        print("AI 응답이 비어있습니다.")
+        return None
+    
     try:
-        # 이미지 -> PDF 변환
-        if not images_to_pdf(image_urls):
-            print("PDF 변환 실패")
-            return None
-            
-        # API 호출 전 대기
-        await asyncio.sleep(OCR_DELAY)
-            
-        # OCR 처리
-        content = await get_text_from_pdf(PDF_PATH)
-        if content:
-            return content
+        result = json.loads(ai_response)
+        
+        if result.get('has_period', False):
+            start_date = result.get('start_date')
+            end_date = result.get('end_date')
+            return start_date, end_date
         else:
-            print("OCR 텍스트 추출 실패")
-            return ""
-                
-    finally:
-        # 임시 파일 정리
-        try:
-            if os.path.exists(PDF_PATH):
-                os.remove(PDF_PATH)
-        except OSError as e:
-            print(f"임시 파일 삭제 실패: {e}")
+            return None, None
+            
+    except json.JSONDecodeError as e:
+        print(f"JSON 형식 X: {e}")
+        print(f"AI 응답: {ai_response}")
+        return None
+    except Exception as e:
+        print(f"파싱 오류: {e}")
+        return None
 
 # ============================================================================
 
@@ -208,18 +229,40 @@ async def image_urls_to_text(image_urls):
 def is_initial_crawl():
     """
     초기 크롤링인지 확인
+
+    중단된 초기 크롤링의 체크포인트가 남아 있으면 DB 파일이 있어도 초기 크롤링으로 이어서 실행
     
     Returns:
-        bool: DB 파일이 없으면 True (초기 크롤링)
+        bool: DB 파일이 없거나 중단된 초기 크롤링이 있으면 True (초기 크롤링)
     """
-    return not os.path.exists(DB_TEXT_FILENAME)
+    if has_pending_checkpoint():
+        return True
+    return not os.path.exists(DB_PATH if DB_BACKEND == "sqlite" else DB_TEXT_FILENAME)
 
-def is_stop(pub_date):
+def has_legacy_text_db():
+    """
+    sqlite 저장소 도입 전(text 저장소) 배포인지 확인
+
+    sqlite 저장소 파일 없이 notice_db.txt만 있으면 is_initial_crawl은 초기 크롤링으로 판단하므로
+    크롤링 전에 import_legacy_text_db로 기존 공지를 가져와야 함
+
+    Returns:
+        bool: DB_BACKEND가 sqlite이고 notice_db.txt만 있으면 True
+    """
+    return (
+        DB_BACKEND == "sqlite"
+        and not os.path.exists(DB_PATH)
+        and os.path.exists(DB_TEXT_FILENAME)
+        and not has_pending_checkpoint()
+    )
+
+def is_stop(pub_date, days=365):
     """
     크롤링 중단 여부 확인 (1년 전 데이터는 중단)
     
     Args:
         pub_date (str): 공지사항 게시일 (예: "2025-09-16 14:30:00" 또는 "2025-09-16")
+        days (int): 중단 기준 (일)
         
     Returns:
         bool: 크롤링 중단 여부
@@ -229,7 +272,7 @@ def is_stop(pub_date):
         pub_date = pub_date.split(' ')[0]
     
     # 1년 전 날짜 계산
-    last_year_yesterday = datetime.now() - timedelta(days=365)
+    last_year_yesterday = datetime.now() - timedelta(days=days)
     target_date = last_year_yesterday.strftime("%Y-%m-%d")
     
     if pub_date < target_date:
@@ -237,27 +280,81 @@ def is_stop(pub_date):
         
     return False
 
-def load_latest_crawled_id():
+def notice_fingerprint(title, pub_date, category, description=""):
     """
-    마지막 크롤링 ID 로드
+    RSS 항목 지문 (제목·게시일·카테고리·요약이 바뀌면 달라짐)
+
+    상세 페이지를 받기 전에 이미 저장한 공지가 수정되었는지 판단하는 데 사용
+
+    Args:
+        title (str): 제목
+        pub_date (str): 게시일
+        category (str): 카테고리
+        description (str): RSS 요약
+
+    Returns:
+        str: 16진수 해시
+    """
+    raw = "\x1f".join([title, pub_date, category, description])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+def content_fingerprint(content, image_urls, attachments):
+    """
+    상세 페이지 지문 (view-con 본문·이미지·첨부파일이 바뀌면 달라짐)
+
+    OCR 전 본문으로 계산하므로 재검증 시 OCR 없이 변경 여부를 판단할 수 있음
+
+    Args:
+        content (str | None): 상세 페이지 본문 (Markdown)
+        image_urls (list[str]): 이미지 URL 목록
+        attachments (list[str]): 첨부파일 목록
+
+    Returns:
+        str: 16진수 해시
+    """
+    raw = json.dumps([content, image_urls, attachments], ensure_ascii=False)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+def is_older_than(notice_id, high_water_mark):
+    """
+    공지 ID가 최고 수위(이전에 본 가장 큰 숫자 ID) 이하인지 확인
+
+    Args:
+        notice_id (str): 공지 ID
+        high_water_mark (str | None): 이전에 본 가장 큰 공지 ID
+
+    Returns:
+        bool: 숫자 ID이고 최고 수위 이하이면 True
+    """
+    if not high_water_mark or not notice_id.isdigit() or not high_water_mark.isdigit():
+        return False
+    return int(notice_id) <= int(high_water_mark)
+
+def load_latest_crawled_id(filename=CRAWLED_ID_FILENAME):
+    """
+    마지막 크롤링 ID 로드 (이전에 본 가장 큰 공지 ID, 증분 크롤링의 최고 수위)
     
+    Args:
+        filename (str): 저장 파일명 (게시판별)
+
     Returns:
         str | None: 마지막 크롤링 ID (파일이 없으면 None)
     """
-    if os.path.exists(CRAWLED_ID_FILENAME):
-        with open(CRAWLED_ID_FILENAME, "r", encoding="utf-8") as f:
+    if os.path.exists(filename):
+        with open(filename, "r", encoding="utf-8") as f:
             latest_id = f.read().strip()
             return latest_id if latest_id else None
     return None
 
-def save_latest_crawled_id(notice_id):
+def save_latest_crawled_id(notice_id, filename=CRAWLED_ID_FILENAME):
     """
     마지막 크롤링 ID 저장
     
     Args:
         notice_id (str): 저장할 공지 ID
+        filename (str): 저장 파일명 (게시판별)
     """
-    with open(CRAWLED_ID_FILENAME, "w", encoding="utf-8") as f:
+    with open(filename, "w", encoding="utf-8") as f:
         f.write(notice_id)
 
 # ============================================================================
@@ -266,7 +363,9 @@ def save_latest_crawled_id(notice_id):
 
 def remove_notice_db():
     """
-    DB 파일 삭제 (일일 크롤링용)
+    텍스트 DB 파일 삭제 (일일 크롤링용)
+
+    sqlite 저장소는 누적 보관하고 내보내기 파일만 새로 만듦
     """
     if os.path.exists(DB_TEXT_FILENAME):
         os.remove(DB_TEXT_FILENAME)
@@ -275,16 +374,72 @@ def reset_database():
     """
     DB 파일 초기화 (모든 크롤링 기록 삭제)
     """
-    files_to_delete = [DB_TEXT_FILENAME, CRAWLED_ID_FILENAME]
+    files_to_delete = [
+        DB_TEXT_FILENAME, CRAWLED_ID_FILENAME,
+        DB_PATH, f"{DB_PATH}-wal", f"{DB_PATH}-shm",
+        CHECKPOINT_PATH, f"{CHECKPOINT_PATH}-wal", f"{CHECKPOINT_PATH}-shm"
+    ]
+
+    # 기본 게시판 외 게시판의 최고 수위 파일 (crawled_id_게시판.txt)
+    root, ext = os.path.splitext(CRAWLED_ID_FILENAME)
+    files_to_delete += glob.glob(f"{root}_*{ext}")
     
     for filename in files_to_delete:
         if os.path.exists(filename):
             os.remove(filename)
 
+@contextmanager
+def crawl_lock(filename=CRAWL_LOCK_FILENAME):
+    """
+    크롤러 실행 잠금 (다른 크롤러 프로세스가 잠금 중이면 기다리지 않고 실패)
+
+    운영체제의 파일 잠금을 사용하므로 프로세스가 비정상 종료되어도 잠금이 남지 않음
+
+    Args:
+        filename (str): 잠금 파일명
+
+    Yields:
+        bool: 잠금 획득 여부 (False면 다른 크롤러가 실행 중)
+    """
+    with open(filename, "a") as f:
+        try:
+            if os.name == "nt":
+                import msvcrt
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield False
+            return
+
+        try:
+            yield True
+        finally:
+            if os.name == "nt":
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
 # ============================================================================
 
 # FastAPI 서버 연동
 
+def fastapi_url(path):
+    """
+    FastAPI 서버 엔드포인트 URL (FASTAPI_BASE_URL에 스킴이 없으면 http://)
+
+    Args:
+        path (str): 엔드포인트 경로
+
+    Returns:
+        str: 전체 URL
+    """
+    base_url = FASTAPI_BASE_URL if "://" in FASTAPI_BASE_URL else f"http://{FASTAPI_BASE_URL}"
+    return f"{base_url}:{FASTAPI_PORT}{path}"
+
 def send_to_file(file_path=None):
     """
     FastAPI 서버로 결과 파일 전송
@@ -302,7 +457,7 @@ def send_to_file(file_path=None):
         print(f"전송할 파일이 없습니다: {file_path}")
         return False
 
-    url = f"{FASTAPI_BASE_URL}:{FASTAPI_PORT}{FASTAPI_PATH}"
+    url = fastapi_url(FASTAPI_PATH)
     try:
         with open(file_path, "rb") as f:
             files = {"file": (os.path.basename(file_path), f, "text/plain")}